@@ -0,0 +1,93 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from rbclib.metric import PrometheusExporterRelayer
+from rbclib.primitives.chain import ChainEnum
+from rbclib.primitives.consts import BIFROST_VALIDATOR_HISTORY_LIMIT_BLOCKS
+
+
+class AuthorityCache:
+    """
+    Round-keyed cache of the relayer authority (selected relayer list, quorum and selection flag).
+     - entries of a specific round never change, so they live until the round leaves the history window.
+     - entries of the current round (rnd is None) are dropped when the round of the chain advances.
+    """
+
+    def __init__(self, history_limit: int = BIFROST_VALIDATOR_HISTORY_LIMIT_BLOCKS):
+        self.history_limit = history_limit
+
+        self.__lock = threading.Lock()
+        self.__entries: Dict[tuple, Any] = dict()
+        self.__latest_rounds: Dict[str, int] = dict()
+
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def get_or_fetch(self, chain: ChainEnum, rnd: Optional[int], item: Hashable, fetcher: Callable[[], Any]) -> Any:
+        key = (chain.name, rnd, item)
+        with self.__lock:
+            if key in self.__entries:
+                self.hit_count += 1
+                PrometheusExporterRelayer.exporting_authority_cache(True)
+                return self.__entries[key]
+            self.miss_count += 1
+            latest_round_before_fetch = self.__latest_rounds.get(chain.name)
+        PrometheusExporterRelayer.exporting_authority_cache(False)
+
+        # fetch without holding the lock; a concurrent miss on the same key only costs one more rpc call
+        value = fetcher()
+
+        with self.__lock:
+            # do not store a current-round value fetched across a round boundary
+            if rnd is not None or latest_round_before_fetch == self.__latest_rounds.get(chain.name):
+                self.__entries[key] = value
+        return value
+
+    def contains(self, chain: ChainEnum, rnd: Optional[int], item: Hashable) -> bool:
+        with self.__lock:
+            return (chain.name, rnd, item) in self.__entries
+
+    def put(self, chain: ChainEnum, rnd: Optional[int], item: Hashable, value: Any):
+        """ stores a value fetched by the caller (e.g. with a batch call). """
+        with self.__lock:
+            self.__entries[(chain.name, rnd, item)] = value
+
+    def latest_round(self, chain: ChainEnum) -> Optional[int]:
+        with self.__lock:
+            return self.__latest_rounds.get(chain.name)
+
+    def advance_round(self, chain: ChainEnum, rnd: int) -> bool:
+        """ Notify the latest round of the chain. returns True if the round advanced and entries were dropped. """
+        with self.__lock:
+            cached_round = self.__latest_rounds.get(chain.name)
+            if cached_round is not None and cached_round >= rnd:
+                return False
+            self.__latest_rounds[chain.name] = rnd
+
+            min_rnd = rnd - self.history_limit
+            for key in list(self.__entries.keys()):
+                chain_name, entry_rnd, _ = key
+                if chain_name != chain.name:
+                    continue
+                if entry_rnd is None or entry_rnd < min_rnd:
+                    del self.__entries[key]
+        return True
+
+    def invalidate(self, chain: ChainEnum = None):
+        """ Drop every entry of the chain (every chain if None). """
+        with self.__lock:
+            if chain is None:
+                self.__entries.clear()
+                self.__latest_rounds.clear()
+                return
+            for key in list(self.__entries.keys()):
+                if key[0] == chain.name:
+                    del self.__entries[key]
+            self.__latest_rounds.pop(chain.name, None)
+
+    def stats(self) -> (int, int):
+        with self.__lock:
+            return self.hit_count, self.miss_count
+
+
+authority_cache_global = AuthorityCache()
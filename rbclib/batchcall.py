@@ -0,0 +1,171 @@
+import json
+import os
+from typing import Dict, List, Tuple, Optional
+
+import eth_abi
+from chainpy.eth.ethtype.utils import keccak_hash
+from chainpy.eventbridge.eventbridge import EventBridge
+from chainpy.logger import global_logger
+
+from rbclib.primitives.chain import ChainEnum
+from rbclib.rpc import send_batch_request, JsonRpcError
+
+CallTuple = Tuple[ChainEnum, str, str, list]  # (chain, contract name, method name, params)
+
+
+def _abi_type_str(abi_param: dict) -> str:
+    """ canonical type string of an abi parameter (e.g. "(bytes4,uint64,uint128)[]") """
+    type_str = abi_param["type"]
+    if not type_str.startswith("tuple"):
+        return type_str
+    components = ",".join([_abi_type_str(component) for component in abi_param["components"]])
+    return "({}){}".format(components, type_str[len("tuple"):])
+
+
+class ContractMethodAbi:
+    def __init__(self, abi_entry: dict):
+        self.name = abi_entry["name"]
+        self.input_types = [_abi_type_str(param) for param in abi_entry["inputs"]]
+        self.output_types = [_abi_type_str(param) for param in abi_entry["outputs"]]
+
+        signature = "{}({})".format(self.name, ",".join(self.input_types))
+        self.selector = keccak_hash(signature.encode()).bytes()[:4]
+
+    def encode_input(self, params: list) -> str:
+        return "0x" + (self.selector + eth_abi.encode(self.input_types, params)).hex()
+
+    def decode_output(self, data_hex: str) -> tuple:
+        return eth_abi.decode(self.output_types, bytes.fromhex(data_hex.replace("0x", "")))
+
+
+class ContractEventAbi:
+    def __init__(self, abi_entry: dict):
+        self.name = abi_entry["name"]
+        self.input_types = [_abi_type_str(param) for param in abi_entry["inputs"]]
+        self.indexed = [param.get("indexed", False) for param in abi_entry["inputs"]]
+
+        signature = "{}({})".format(self.name, ",".join(self.input_types))
+        self.topic = "0x" + keccak_hash(signature.encode()).bytes().hex()
+
+    def decode_log(self, topics: List[str], data_hex: str) -> tuple:
+        """ decodes the inputs of the event in their order; an indexed dynamic input is left as its topic hash. """
+        data_types = [type_str for type_str, indexed in zip(self.input_types, self.indexed) if not indexed]
+        data_values = iter(eth_abi.decode(data_types, bytes.fromhex(data_hex.replace("0x", ""))))
+        topic_values = iter(topics[1:])
+
+        decoded = list()
+        for type_str, indexed in zip(self.input_types, self.indexed):
+            if not indexed:
+                decoded.append(next(data_values))
+                continue
+            topic = bytes.fromhex(next(topic_values).replace("0x", ""))
+            is_dynamic = type_str in ("bytes", "string") or type_str.endswith("]") or type_str.startswith("(")
+            decoded.append(topic if is_dynamic else eth_abi.decode([type_str], topic)[0])
+        return tuple(decoded)
+
+
+class ContractAbiRegistry:
+    """ Contract addresses and method (and event) abis of each chain, loaded from the multichain config. """
+
+    def __init__(self, multichain_config: dict):
+        self.__config = multichain_config
+        self.__methods: Dict[Tuple[str, str, str], ContractMethodAbi] = dict()
+        self.__events: Dict[Tuple[str, str, str], ContractEventAbi] = dict()
+        self.__addresses: Dict[Tuple[str, str], str] = dict()
+
+    def url_of(self, chain: ChainEnum) -> str:
+        return self.__config[chain.name]["url_with_access_key"]
+
+    def _load_contract(self, chain: ChainEnum, contract_name: str):
+        chain_config = self.__config[chain.name]
+        for contract in chain_config["contracts"]:
+            if contract["name"] != contract_name:
+                continue
+            with open(os.path.join(chain_config["abi_dir"], contract["abi_file"]), "r") as f:
+                abi = json.load(f)
+            for entry in abi:
+                if entry.get("type") == "function":
+                    self.__methods[(chain.name, contract_name, entry["name"])] = ContractMethodAbi(entry)
+                elif entry.get("type") == "event":
+                    self.__events[(chain.name, contract_name, entry["name"])] = ContractEventAbi(entry)
+            self.__addresses[(chain.name, contract_name)] = contract["address"]
+            return
+        raise Exception("Not found contract: {} on {}".format(contract_name, chain.name))
+
+    def address_of(self, chain: ChainEnum, contract_name: str) -> str:
+        if (chain.name, contract_name) not in self.__addresses:
+            self._load_contract(chain, contract_name)
+        return self.__addresses[(chain.name, contract_name)]
+
+    def method_of(self, chain: ChainEnum, contract_name: str, method_name: str) -> ContractMethodAbi:
+        if (chain.name, contract_name) not in self.__addresses:
+            self._load_contract(chain, contract_name)
+        return self.__methods[(chain.name, contract_name, method_name)]
+
+    def event_of(self, chain: ChainEnum, contract_name: str, event_name: str) -> ContractEventAbi:
+        if (chain.name, contract_name) not in self.__addresses:
+            self._load_contract(chain, contract_name)
+        return self.__events[(chain.name, contract_name, event_name)]
+
+
+class BatchCall:
+    """
+    Collects read-only contract calls and resolves them with one JSON-RPC batch request per chain.
+    A call which fails in the batch (or every call, if the manager has no abi registry) is retried through
+    "world_call", so the results and errors are the same as calling "world_call" one by one.
+    """
+    def __init__(self, manager: EventBridge):
+        self.manager = manager
+        self.__calls: List[CallTuple] = list()
+
+    def add(self, chain: ChainEnum, contract_name: str, method_name: str, params: list) -> int:
+        """ queues a call and returns its index in the result list. """
+        self.__calls.append((chain, contract_name, method_name, params))
+        return len(self.__calls) - 1
+
+    def __len__(self) -> int:
+        return len(self.__calls)
+
+    def _batch_call_on(self, registry: ContractAbiRegistry, chain: ChainEnum, indices: List[int]) -> Dict[int, tuple]:
+        methods, rpc_calls = list(), list()
+        for i in indices:
+            _, contract_name, method_name, params = self.__calls[i]
+            method = registry.method_of(chain, contract_name, method_name)
+            tx = {"to": registry.address_of(chain, contract_name), "data": method.encode_input(params)}
+            methods.append(method)
+            rpc_calls.append(("eth_call", [tx, "latest"]))
+
+        results = dict()
+        for i, method, raw in zip(indices, methods, send_batch_request(registry.url_of(chain), rpc_calls)):
+            if isinstance(raw, JsonRpcError) or raw is None:
+                continue
+            results[i] = method.decode_output(raw)
+        return results
+
+    def call(self) -> List[tuple]:
+        """ resolves every queued call, and returns the results in the order of "add". """
+        results: Dict[int, tuple] = dict()
+
+        registry: Optional[ContractAbiRegistry] = getattr(self.manager, "abi_registry", None)
+        if registry is not None:
+            indices_of_chain: Dict[ChainEnum, List[int]] = dict()
+            for i, (chain, _, _, _) in enumerate(self.__calls):
+                indices_of_chain.setdefault(chain, list()).append(i)
+
+            for chain, indices in indices_of_chain.items():
+                try:
+                    results.update(self._batch_call_on(registry, chain, indices))
+                except Exception as e:
+                    global_logger.formatted_log(
+                        "BatchCall",
+                        address=self.manager.active_account.address,
+                        related_chain_name=chain.name,
+                        msg="FallbackToSingleCalls:{}".format(str(e))
+                    )
+
+        for i, (chain, contract_name, method_name, params) in enumerate(self.__calls):
+            if i not in results:
+                results[i] = self.manager.world_call(chain.name, contract_name, method_name, params)
+
+        self.__calls = list()
+        return [results[i] for i in range(len(results))]
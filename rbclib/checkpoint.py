@@ -0,0 +1,93 @@
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from chainpy.eventbridge.utils import timestamp_msec
+
+
+class BootstrapCheckpoint:
+    """
+    Crash-safe (sqlite, WAL journal with full sync) store of the bootstrap progress.
+     - chain_heights: the height up to which the logs of each chain have been collected.
+     - pending_requests: the first height on each chain at which a not-finalized request was seen.
+    The relayer resumes log collection from the lower of the two, so no log of a not-finalized request is skipped.
+    Recorded and finalized requests are buffered, and written in one transaction by "flush" (or with the heights by
+    "save_heights"), so the heights never move past a request which is not stored yet.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__conn = sqlite3.connect(path, check_same_thread=False)
+        self.__buffered: List[Tuple[str, tuple]] = list()
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute("PRAGMA synchronous=FULL")
+        self.__conn.execute(
+            "CREATE TABLE IF NOT EXISTS chain_heights ("
+            "chain TEXT PRIMARY KEY, height INTEGER NOT NULL, saved_at INTEGER NOT NULL)"
+        )
+        self.__conn.execute(
+            "CREATE TABLE IF NOT EXISTS pending_requests ("
+            "rid TEXT NOT NULL, chain TEXT NOT NULL, height INTEGER NOT NULL, recorded_at INTEGER NOT NULL, "
+            "PRIMARY KEY (rid, chain))"
+        )
+
+    def save_heights(self, heights: Dict[str, int]):
+        now = timestamp_msec()
+        with self.__lock, self.__conn:
+            self.__flush_buffered()
+            self.__conn.executemany(
+                "INSERT OR REPLACE INTO chain_heights (chain, height, saved_at) VALUES (?, ?, ?)",
+                [(chain_name, height, now) for chain_name, height in heights.items()]
+            )
+
+    def record_request(self, rid_hex: str, chain_name: str, height: int):
+        """ buffers the first height of a not-finalized request on the chain. """
+        with self.__lock:
+            self.__buffered.append((
+                "INSERT OR IGNORE INTO pending_requests (rid, chain, height, recorded_at) VALUES (?, ?, ?, ?)",
+                (rid_hex, chain_name, height, timestamp_msec())
+            ))
+
+    def finalize_request(self, rid_hex: str):
+        with self.__lock:
+            self.__buffered.append(("DELETE FROM pending_requests WHERE rid = ?", (rid_hex,)))
+
+    def flush(self):
+        """ writes the buffered requests in one transaction. """
+        with self.__lock, self.__conn:
+            self.__flush_buffered()
+
+    def __flush_buffered(self):
+        for sql, params in self.__buffered:
+            self.__conn.execute(sql, params)
+        self.__buffered = list()
+
+    def resume_heights(self, chain_names: List[str], max_age_msec: int) -> Optional[Dict[str, int]]:
+        """
+        returns the height to resume log collection for each chain,
+        or None if the checkpoint is missing (for any of the chains) or older than "max_age_msec".
+        """
+        min_saved_at = timestamp_msec() - max_age_msec
+        with self.__lock, self.__conn:
+            self.__flush_buffered()
+            # requests older than the full rewind window are not handled by bootstrap anyway
+            self.__conn.execute("DELETE FROM pending_requests WHERE recorded_at < ?", (min_saved_at,))
+
+            rows = self.__conn.execute("SELECT chain, height, saved_at FROM chain_heights").fetchall()
+            heights = {chain_name: height for chain_name, height, saved_at in rows if saved_at >= min_saved_at}
+            if any(chain_name not in heights for chain_name in chain_names):
+                return None
+
+            rows = self.__conn.execute("SELECT chain, MIN(height) FROM pending_requests GROUP BY chain").fetchall()
+            for chain_name, pending_height in rows:
+                if chain_name in heights:
+                    heights[chain_name] = min(heights[chain_name], pending_height)
+
+        return {chain_name: heights[chain_name] for chain_name in chain_names}
+
+    def close(self):
+        with self.__lock:
+            with self.__conn:
+                self.__flush_buffered()
+            self.__conn.close()
@@ -1,4 +1,4 @@
-from typing import Optional, Tuple, Union, List
+from typing import Optional, Tuple, Union, List, Iterable, Dict
 
 from chainpy.eth.ethtype.hexbytes import EthHexBytes, EthHashBytes
 from chainpy.eth.ethtype.utils import to_eth_v
@@ -8,28 +8,109 @@ from chainpy.eventbridge.eventbridge import EventBridge
 from chainpy.eventbridge.utils import timestamp_msec
 from chainpy.logger import global_logger
 
+from rbclib.journal import JournalEntry
 from rbclib.metric import PrometheusExporterRelayer
 from rbclib.primitives.chain import ChainEventStatus, chain_enum, ChainEnum
+from rbclib.primitives.codec import chain_bytes
 from rbclib.primitives.consts import RBC_EVENT_STATUS_START_DATA_START_INDEX, RBC_EVENT_STATUS_START_DATA_END_INDEX, NoneParams, \
-    BIFROST_VALIDATOR_HISTORY_LIMIT_BLOCKS, SOCKET_CONTRACT_NAME, SUBMIT_FUNCTION_NAME, GET_REQ_INFO_FUNCTION_NAME
+    BIFROST_VALIDATOR_HISTORY_LIMIT_BLOCKS, SOCKET_CONTRACT_NAME, SUBMIT_FUNCTION_NAME, GET_REQ_INFO_FUNCTION_NAME, \
+    SOCKET_LOG_DECODE_CHUNK_SIZE, SIG_AGGREGATION_QUORUM
 from rbclib.primitives.method import RBCMethodV1
+from rbclib.sigsort import signature_sorter_global
+from rbclib.socketlog import SocketLogColumns, parse_status_value
 from rbclib.submits import PollSubmit
-from rbclib.utils import fetch_relayer_index, log_invalid_flow, fetch_relayer_num, extract_latest_event_status, fetch_quorum, fetch_socket_rbc_sigs
+from rbclib.txpipeline import pipelined
+from rbclib.utils import fetch_relayer_index, log_invalid_flow, fetch_relayer_num, fetch_quorum, fetch_socket_rbc_sigs, \
+    fetch_sorted_relayer_list_lower
 from relayer.global_config import relayer_config_global, RelayerRole
 from relayer.relayer import Relayer
 
 
+class RbcEventFields:
+    """
+    Decoded fields (a row of "SocketLogColumns") of a socket event. Built once per event object;
+    "clone_with_other_status" builds a new event object (and so new fields) for the other status.
+    """
+    __slots__ = ("src_chain", "rnd", "seq", "status", "dst_chain", "rbc_method", "req_id_concat_bytes")
+
+    def __init__(self, columns: SocketLogColumns, idx: int = 0):
+        self.src_chain: ChainEnum = columns.src_chain(idx)
+        self.rnd: int = columns.rounds[idx]
+        self.seq: int = columns.seqs[idx]
+        self.status: ChainEventStatus = columns.status(idx)
+        self.dst_chain: ChainEnum = columns.dst_chain(idx)
+        self.rbc_method: RBCMethodV1 = columns.rbc_method(idx)
+        self.req_id_concat_bytes: EthHexBytes = columns.req_id_concat_bytes(idx)
+
+
+FINALIZED_STATUSES = (ChainEventStatus.COMMITTED, ChainEventStatus.ROLLBACKED)
+
+# the statuses handled by "ExternalRbcEvent"
+EXTERNAL_HANDLED_STATUS_VALUES = frozenset(status.value for status in [
+    ChainEventStatus.ACCEPTED, ChainEventStatus.REJECTED, ChainEventStatus.COMMITTED, ChainEventStatus.ROLLBACKED
+])
+
+# status -> precedence of the status as the latest status of an outbound request
+OUTBOUND_STATUS_PRECEDENCE = {status: rank for rank, status in enumerate([
+    ChainEventStatus.FAILED,
+    ChainEventStatus.REQUESTED,
+    ChainEventStatus.REJECTED,
+    ChainEventStatus.ACCEPTED,
+    ChainEventStatus.REVERTED,
+    ChainEventStatus.EXECUTED,
+    ChainEventStatus.ROLLBACKED,
+    ChainEventStatus.COMMITTED
+])}
+
+
+class RidLatestState:
+    """
+    The latest state of a request seen in the bootstrap logs. Only the log with the highest status precedence is
+    kept; the log is dropped once the request is finalized (a finalized request stays finalized).
+    """
+    __slots__ = ("rid_hex", "rnd", "inbound", "status", "rank", "detected_event")
+
+    def __init__(self, rid_hex: str, rnd: int, inbound: bool):
+        self.rid_hex = rid_hex
+        self.rnd = rnd
+        self.inbound = inbound
+        self.status: Optional[ChainEventStatus] = None
+        self.rank = -1
+        self.detected_event: Optional[DetectedEvent] = None
+
+    @property
+    def finalized(self) -> bool:
+        return self.status in FINALIZED_STATUSES
+
+    def reduce(self, status: ChainEventStatus, detected_event: DetectedEvent) -> bool:
+        """ returns whether the log has become the latest state of the request. """
+        # inbound requests progress in the order of the status value
+        rank = status.value if self.inbound else OUTBOUND_STATUS_PRECEDENCE[status]
+        if rank <= self.rank:
+            return False
+        self.status, self.rank = status, rank
+        self.detected_event = None if self.finalized else detected_event
+        return True
+
+
 class RbcEvent(ChainEventABC):
     """
     Data class for event from socket contract.
     """
     EVENT_NAME = "Socket"
+    # the journal entries are replayed by "bootstrap", against the latest status in the logs
+    REPLAYS_JOURNAL_IN_BOOTSTRAP = True
 
     def __init__(self,
                  detected_event: DetectedEvent,
                  time_lock: int,
                  manager: EventBridge):
+        self.__fields: Optional[RbcEventFields] = None
         super().__init__(detected_event, time_lock, manager)
+        if time_lock != 0:
+            # events of bootstrap are recorded after removing finalized requests
+            self.record_checkpoint()
+            self.compact_journal()
 
     def __cmp__(self, other):
         return self.status.value < other.status.value
@@ -52,9 +133,7 @@ class RbcEvent(ChainEventABC):
     @classmethod
     def init(cls, detected_event: DetectedEvent, time_lock: int, manager: EventBridge):
         """ Depending on the event status, selects a child class of Socket Event, and initiates its instance. """
-        # parse event-status from event data (fast, but not expandable)
-        status_data = detected_event.data[RBC_EVENT_STATUS_START_DATA_START_INDEX:RBC_EVENT_STATUS_START_DATA_END_INDEX]
-        status = ChainEventStatus(status_data.int())
+        status = RbcEvent.parse_status(detected_event)
         casting_type = RbcEvent.select_child(status)
 
         # The normal relayer processes the ACCEPTED or REJECTED event after a certain period of time.
@@ -68,6 +147,7 @@ class RbcEvent(ChainEventABC):
             ret = casting_type(
                 detected_event, time_lock + relayer_config_global.slow_relayer_delay_sec * 1000, manager
             )
+            ret.journal_in_flight(ret.time_lock, is_call=False)
             # does not export log in bootstrap process
             global_logger.formatted_log(
                 "Protocol",
@@ -93,6 +173,55 @@ class RbcEvent(ChainEventABC):
 
         return RbcEvent.init(self.detected_event, time_lock, self.relayer)
 
+    def record_checkpoint(self):
+        """ keeps the bootstrap checkpoint from moving past the first log of a not-finalized request. """
+        checkpoint = self.relayer.checkpoint
+        if checkpoint is None:
+            return
+        rid_hex = self.req_id_concat_bytes.hex()
+        if self.status in [ChainEventStatus.COMMITTED, ChainEventStatus.ROLLBACKED]:
+            checkpoint.finalize_request(rid_hex)
+        else:
+            checkpoint.record_request(rid_hex, self.detected_event.chain_name, self.detected_event.block_number)
+
+    def journal_in_flight(self, time_lock: int, is_call: bool, aggregated: bool = True):
+        """ journals this event before it is put back into the queue with a future time lock. """
+        journal = self.relayer.journal
+        if journal is None:
+            return
+        journal.write(
+            self.req_id_concat_bytes.hex(),
+            RbcEvent.EVENT_NAME,
+            self.status.value,
+            self.detected_event,
+            time_lock,
+            is_call,
+            aggregated
+        )
+
+    def compact_journal(self):
+        """ drops the journal entry of the request once it is finalized. """
+        journal = self.relayer.journal
+        if journal is None:
+            return
+        if self.status in [ChainEventStatus.COMMITTED, ChainEventStatus.ROLLBACKED]:
+            journal.remove(self.req_id_concat_bytes.hex())
+
+    @classmethod
+    def from_journal(cls, manager: "Relayer", entry: JournalEntry) -> Optional["RbcEvent"]:
+        event = cls.init(entry.detected_event, 0, manager)
+        if event is None:
+            return None
+
+        if entry.is_call:
+            event.switch_to_call(entry.time_lock)
+        else:
+            event.switch_to_send(entry.time_lock)
+
+        if isinstance(event, _AggregatedRelayEvent):
+            event.aggregated = entry.aggregated
+        return event
+
     def summary(self) -> str:
         """ returns summary string for logger. """
         req_id = self.req_id()
@@ -199,77 +328,105 @@ class RbcEvent(ChainEventABC):
     def is_outbound(self) -> bool:
         return self.src_chain == chain_enum.BIFROST
 
+    @property
+    def fields(self) -> "RbcEventFields":
+        """ decoded fields of this event, built on the first access """
+        if self.__fields is None:
+            self.__fields = RbcEventFields(SocketLogColumns([self.detected_event.data]))
+        return self.__fields
+
     def req_id(self) -> Tuple[ChainEnum, int, int]:
-        unzipped_decoded_data = self.decoded_data[0]
-        req_id_tuple = unzipped_decoded_data[0]
-        return chain_enum.from_bytes(req_id_tuple[0]), req_id_tuple[1], req_id_tuple[2]
+        fields = self.fields
+        return fields.src_chain, fields.rnd, fields.seq
 
     @property
     def req_id_concat_bytes(self) -> EthHexBytes:
-        chain, rnd, seq = self.req_id()
-        return EthHexBytes(chain.formatted_bytes()) + EthHexBytes(rnd, 16) + EthHexBytes(seq, 16)
+        return self.fields.req_id_concat_bytes
 
     @property
     def src_chain(self) -> ChainEnum:
-        return self.req_id()[0]
+        return self.fields.src_chain
 
     @property
     def rnd(self) -> int:
-        return self.req_id()[1]
+        return self.fields.rnd
 
     @property
     def seq(self) -> int:
-        return self.req_id()[2]
+        return self.fields.seq
 
     @property
     def status(self) -> ChainEventStatus:
-        unzipped_decoded_data = self.decoded_data[0]
-        return ChainEventStatus(unzipped_decoded_data[1])
+        return self.fields.status
 
     def inst(self) -> Tuple[Union[ChainEnum, int], Union[RBCMethodV1, int]]:
-        unzipped_decoded_data = self.decoded_data[0]
-        inst_id_tuple = unzipped_decoded_data[2]
-        return chain_enum.from_bytes(inst_id_tuple[0]), RBCMethodV1.from_bytes(inst_id_tuple[1])
+        fields = self.fields
+        return fields.dst_chain, fields.rbc_method
 
     @property
     def dst_chain(self) -> ChainEnum:
-        return self.inst()[0]
+        return self.fields.dst_chain
 
     @property
     def rbc_method(self) -> RBCMethodV1:
-        return self.inst()[1]
+        return self.fields.rbc_method
 
     @staticmethod
-    def bootstrap(manager: "Relayer", detected_events: List[DetectedEvent]) -> List['RbcEvent']:
+    def bootstrap(manager: "Relayer", detected_events: Iterable[DetectedEvent]) -> List['RbcEvent']:
         if manager.__class__.__name__ != "Relayer":
             raise Exception("Relayer only as a manger")
 
-        # the collected events are made into objects and stored in the list
-        rbc_events = list()
-        for detected_event in detected_events:
-            event_obj = RbcEvent.init(detected_event, 0, manager)
-            rbc_events.append(event_obj)
-
-        # remove finalized event objects
-        not_finalized_event_objs = RbcEvent._remove_finalized_rids(rbc_events)
-
-        # remove too late event
-        not_handled_events_objs = list()
-
         if manager.round_cache is None:
             raise Exception("relayer's current rnd is None")
         min_rnd = manager.round_cache - BIFROST_VALIDATOR_HISTORY_LIMIT_BLOCKS
-        for not_finalized_event_obj in not_finalized_event_objs:
-            if min_rnd > not_finalized_event_obj.rnd:
+
+        # the logs are reduced on the fly, chunk by chunk, to the latest state of each request
+        latest_states: Dict[str, RidLatestState] = dict()
+        for chunk in RbcEvent.chunks_of(detected_events, SOCKET_LOG_DECODE_CHUNK_SIZE):
+            columns = SocketLogColumns([detected_event.data for detected_event in chunk])
+            finalized_rids = list()
+            for idx, detected_event in enumerate(chunk):
+                rid_hex, status = columns.req_id_hex(idx), columns.status(idx)
+                if status in FINALIZED_STATUSES:
+                    finalized_rids.append(rid_hex)
+                if min_rnd > columns.rounds[idx]:
+                    # too late request
+                    continue
+
+                state = latest_states.get(rid_hex)
+                if state is None:
+                    state = RidLatestState(rid_hex, columns.rounds[idx], columns.is_inbound(idx))
+                    latest_states[rid_hex] = state
+                state.reduce(status, detected_event)
+
+            # finalized requests no longer hold the bootstrap checkpoint back, nor stay in the journal
+            RbcEvent.finalize_requests(manager, finalized_rids)
+
+        # event objects are made only for not finalized requests
+        not_handled_events_objs, replayed_events_objs = list(), list()
+        for state in latest_states.values():
+            if state.finalized:
                 continue
 
             if relayer_config_global.is_fast_relayer():
-                status = not_finalized_event_obj.status
+                status = state.status
                 if status != ChainEventStatus.ACCEPTED and status != ChainEventStatus:
                     continue
 
-            not_finalized_event_obj.time_lock = timestamp_msec()
-            not_handled_events_objs.append(not_finalized_event_obj)
+            # a journaled event is replayed with its own time lock, unless the request has moved on since
+            replayed_obj = RbcEvent.replay_journal_of(manager, state)
+            if replayed_obj is not None:
+                replayed_events_objs.append(replayed_obj)
+                continue
+
+            event_obj = RbcEvent.init(state.detected_event, 0, manager)
+            event_obj.time_lock = timestamp_msec()
+            event_obj.record_checkpoint()
+            not_handled_events_objs.append(event_obj)
+
+        # the pending requests of bootstrap are stored at once
+        if manager.checkpoint is not None:
+            manager.checkpoint.flush()
 
         # logging and return not finalized event objects
         for event_obj in not_handled_events_objs:
@@ -278,28 +435,59 @@ class RbcEvent(ChainEventABC):
                 address=manager.active_account.address,
                 msg="Unchecked{}Log:{}".format(RbcEvent.EVENT_NAME, event_obj.summary())
             )
-        return not_handled_events_objs
+        return not_handled_events_objs + replayed_events_objs
 
     @staticmethod
-    def _remove_finalized_rids(event_objs: List["RbcEvent"]) -> List["RbcEvent"]:
-        # request_id_str -> event_obj with last status
-        event_with_last_status_of_each_rid = dict()
-        for event_obj in event_objs:
-            request_id_str = event_obj.req_id_concat_bytes.hex()
-            # store new event object with the rid
-            if request_id_str not in event_with_last_status_of_each_rid:
-                event_with_last_status_of_each_rid[request_id_str] = [event_obj]
-                continue
-            else:
-                event_with_last_status_of_each_rid[request_id_str].append(event_obj)
+    def finalize_requests(manager: "Relayer", rid_hexes: List[str]):
+        """ drops the requests from the checkpoint and the journal, in one transaction each. """
+        if not rid_hexes:
+            return
+        if manager.checkpoint is not None:
+            for rid_hex in rid_hexes:
+                manager.checkpoint.finalize_request(rid_hex)
+            manager.checkpoint.flush()
+        if manager.journal is not None:
+            manager.journal.remove_many(rid_hexes)
 
-        not_finalized_latest_event_objs = list()
-        for rid_str, status_event_list in event_with_last_status_of_each_rid.items():
-            latest_status_obj = extract_latest_event_status(status_event_list)
-            if latest_status_obj.status in [ChainEventStatus.COMMITTED, ChainEventStatus.ROLLBACKED]:
-                continue
-            not_finalized_latest_event_objs.append(latest_status_obj)
-        return not_finalized_latest_event_objs
+    @staticmethod
+    def replay_journal_of(manager: "Relayer", state: RidLatestState) -> Optional["RbcEvent"]:
+        """ returns the journaled event of the request if it is of the latest status in the logs. """
+        journal = manager.journal
+        if journal is None:
+            return None
+        entry = journal.entry_of(state.rid_hex)
+        if entry is None:
+            return None
+
+        event_obj = RbcEvent.from_journal(manager, entry) if entry.status == state.status.value else None
+        if event_obj is None:
+            # stale entry; the request is bootstrapped from its latest log
+            journal.remove(state.rid_hex)
+            return None
+
+        global_logger.formatted_log(
+            "BootStrap",
+            address=manager.active_account.address,
+            related_chain_name=chain_enum.BIFROST.name,
+            msg="ReplayJournal:{}:time-lock({})".format(event_obj.summary(), entry.time_lock)
+        )
+        return event_obj
+
+    @staticmethod
+    def chunks_of(detected_events: Iterable[DetectedEvent], size: int) -> Iterable[List[DetectedEvent]]:
+        chunk = list()
+        for detected_event in detected_events:
+            chunk.append(detected_event)
+            if len(chunk) == size:
+                yield chunk
+                chunk = list()
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def parse_status(detected_event: DetectedEvent) -> ChainEventStatus:
+        """ parses event-status from event data (fast, but not expandable) """
+        return ChainEventStatus(parse_status_value(detected_event.data))
 
     @staticmethod
     def change_status_of_data(detected_event: DetectedEvent, event_status: ChainEventStatus):
@@ -321,7 +509,7 @@ class RbcEvent(ChainEventABC):
     def build_transaction_param_with_sig(self) -> SendParamTuple:
         next_status = ChainEventStatus(self.status.value + 2)
         data_with_next_status = self.change_status_of_data(self.detected_event, next_status)
-        sig = self.relayer.active_account.ecdsa_recoverable_sign(data_with_next_status)
+        sig = signature_sorter_global.sign(self.relayer.active_account, data_with_next_status)
         submit_data = PollSubmit(self).add_single_sig(sig.r, sig.s, to_eth_v(sig.v))
         return (
             chain_enum.BIFROST.name,
@@ -338,16 +526,14 @@ class ExternalRbcEvent(RbcEvent):
     @classmethod
     def init(cls, detected_event: DetectedEvent, time_lock: int, relayer: "Relayer"):
         """ Depending on the event status, selects a child class of Socket Event, and initiates its instance. """
-        # parse event-status from event data (fast, but not expandable)
-        status_data = detected_event.data[RBC_EVENT_STATUS_START_DATA_START_INDEX:RBC_EVENT_STATUS_START_DATA_END_INDEX]
-        status = ChainEventStatus(status_data.int())
-
-        if status in [ChainEventStatus.ACCEPTED, ChainEventStatus.REJECTED, ChainEventStatus.COMMITTED, ChainEventStatus.ROLLBACKED]:
-            casting_type = RbcEvent.select_child(status)
-            return casting_type(detected_event, time_lock, relayer)
-        else:
+        # most of the socket logs are dropped by the status, before anything else is decoded
+        status_value = parse_status_value(detected_event.data)
+        if status_value not in EXTERNAL_HANDLED_STATUS_VALUES:
             return None
 
+        casting_type = RbcEvent.select_child(ChainEventStatus(status_value))
+        return casting_type(detected_event, time_lock, relayer)
+
 
 class ChainFailedEvent(RbcEvent):
     def __init__(self,
@@ -358,6 +544,7 @@ class ChainFailedEvent(RbcEvent):
         if self.status != ChainEventStatus.FAILED:
             raise Exception("Event status not matches")
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
         """ A method to build a transaction which handles the event """
         if not self.check_my_event():
@@ -368,7 +555,7 @@ class ChainFailedEvent(RbcEvent):
             return NoneParams
 
         msg_to_sign = self.detected_event.data
-        sig = self.relayer.active_account.ecdsa_recoverable_sign(msg_to_sign)
+        sig = signature_sorter_global.sign(self.relayer.active_account, msg_to_sign)
         submit_data = PollSubmit(self).add_single_sig(sig.r, sig.s, to_eth_v(sig.v))
         return (
             chain_enum.BIFROST.name,
@@ -392,9 +579,10 @@ class ChainRequestedEvent(RbcEvent):
             self.dst_chain.name,
             SOCKET_CONTRACT_NAME,
             GET_REQ_INFO_FUNCTION_NAME,
-            [(chain.formatted_bytes(), rnd, seq)]
+            [(chain_bytes(chain), rnd, seq)]
         )
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
         """ A method to build a transaction which handles the event """
         if not self.check_my_event():
@@ -410,7 +598,7 @@ class ChainRequestedEvent(RbcEvent):
         else:
             # generate signature if it's needed
             status_changed_data = RbcEvent.change_status_of_data(self.detected_event, ChainEventStatus.ACCEPTED)
-            sig = self.relayer.active_account.ecdsa_recoverable_sign(status_changed_data)
+            sig = signature_sorter_global.sign(self.relayer.active_account, status_changed_data)
             submit_data = PollSubmit(self).add_single_sig(sig.r, sig.s, to_eth_v(sig.v))
             return (
                 chain_enum.BIFROST.name,
@@ -459,6 +647,7 @@ class ChainRequestedEvent(RbcEvent):
         # find out chain to call
         if self.is_inbound():
             next_time_lock = self.time_lock + 1000 * relayer_config_global.rbc_event_call_delay_sec
+            self.journal_in_flight(next_time_lock, is_call=True)
             self.switch_to_call(next_time_lock)
             return self
         else:
@@ -483,6 +672,7 @@ class ChainExecutedEvent(RbcEvent):
         if self.status != ChainEventStatus.EXECUTED:
             raise Exception("Event status not matches")
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
         if not self.check_my_event():
             return NoneParams
@@ -501,6 +691,7 @@ class ChainRevertedEvent(RbcEvent):
         if self.status != ChainEventStatus.REVERTED:
             raise Exception("Event status not matches")
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
         if not self.check_my_event():
             return NoneParams
@@ -518,6 +709,7 @@ class _AggregatedRelayEvent(RbcEvent):
         super().__init__(detected_event, time_lock, manager)
         self.aggregated = True
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
         if not self.check_my_event():
             return NoneParams
@@ -541,6 +733,7 @@ class _AggregatedRelayEvent(RbcEvent):
 
         else:
             next_time_lock = self.time_lock + 1000 * relayer_config_global.rbc_event_call_delay_sec
+            self.journal_in_flight(next_time_lock, is_call=True, aggregated=self.aggregated)
             self.switch_to_call(next_time_lock)
             self.relayer.queue.enqueue(self)
 
@@ -555,7 +748,7 @@ class _AggregatedRelayEvent(RbcEvent):
             target_chain.name,
             SOCKET_CONTRACT_NAME,
             GET_REQ_INFO_FUNCTION_NAME,
-            [(chain.formatted_bytes(), rnd, seq)]
+            [(chain_bytes(chain), rnd, seq)]
         )
 
     def check_already_done(self, result: tuple) -> Tuple[ChainEventStatus, ChainEventStatus]:
@@ -589,7 +782,9 @@ class _AggregatedRelayEvent(RbcEvent):
         )
 
         self.aggregated = False
-        self.switch_to_send(timestamp_msec())
+        next_time_lock = timestamp_msec()
+        self.journal_in_flight(next_time_lock, is_call=False, aggregated=False)
+        self.switch_to_send(next_time_lock)
         return self
 
     def aggregated_relay(
@@ -597,8 +792,13 @@ class _AggregatedRelayEvent(RbcEvent):
     ) -> SendParamTuple:
         relayer_index = self.relayer.get_value_by_key(self.rnd)
         chain, rnd, seq = self.req_id()
-        sigs = fetch_socket_rbc_sigs(self.relayer, (chain.formatted_bytes(), rnd, seq), chain_event_status)
+        sigs = fetch_socket_rbc_sigs(self.relayer, (chain_bytes(chain), rnd, seq), chain_event_status)
         submit_data = PollSubmit(self).add_tuple_sigs(sigs)
+        if self.relayer.sig_aggregation_of(target_chain) == SIG_AGGREGATION_QUORUM:
+            submit_data.trim_to_quorum(
+                fetch_sorted_relayer_list_lower(self.relayer, target_chain, rnd),
+                fetch_quorum(self.relayer, target_chain, rnd)
+            )
 
         msg = "Primary" if is_primary_relay else "Secondary"
         global_logger.formatted_log(
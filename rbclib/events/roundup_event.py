@@ -9,10 +9,15 @@ from chainpy.eventbridge.eventbridge import EventBridge
 from chainpy.eventbridge.utils import timestamp_msec
 from chainpy.logger import global_logger
 
+from rbclib.authority import authority_cache_global
+from rbclib.journal import JournalEntry
 from rbclib.primitives.chain import chain_enum, ChainEnum, ChainEventStatus
-from rbclib.primitives.consts import NoneParams, SOCKET_CONTRACT_NAME, ROUND_UP_VOTING_FUNCTION_NAME
+from rbclib.primitives.consts import NoneParams, SOCKET_CONTRACT_NAME, ROUND_UP_VOTING_FUNCTION_NAME, \
+    SIG_AGGREGATION_QUORUM
 from rbclib.submits import AggregatedRoundUpSubmit
-from rbclib.utils import fetch_sorted_relayer_list_lower, fetch_latest_round, fetch_socket_vsp_sigs, log_invalid_flow
+from rbclib.txpipeline import pipelined
+from rbclib.utils import fetch_sorted_relayer_list_lower, fetch_latest_round, fetch_socket_vsp_sigs, log_invalid_flow, \
+    fetch_quorum
 from relayer.global_config import relayer_config_global
 
 
@@ -44,7 +49,44 @@ class RoundUpEvent(ChainEventABC):
                 )
             )
             time_lock = timestamp_msec() + relayer_config_global.slow_relayer_delay_sec * 1000
-            return cls(detected_event, time_lock, relayer)
+            ret = cls(detected_event, time_lock, relayer)
+            ret.journal_in_flight(time_lock)
+            return ret
+
+    @classmethod
+    def from_journal(cls, relayer: EventBridge, entry: JournalEntry) -> "RoundUpEvent":
+        event = cls(entry.detected_event, entry.time_lock, relayer)
+        event.selected_chain = chain_enum[entry.selected_chain]
+        event.aggregated = entry.aggregated
+        event.switch_to_send(entry.time_lock)
+        return event
+
+    @property
+    def journal_key(self) -> str:
+        return "{}:{}:{}".format(self.__class__.EVENT_NAME, self.round, self.selected_chain.name)
+
+    def journal_in_flight(self, time_lock: int):
+        """ journals this event before it is put back into the queue with a future time lock. """
+        journal = self.relayer.journal
+        if journal is None:
+            return
+        journal.write(
+            self.journal_key,
+            self.__class__.EVENT_NAME,
+            self.status.value,
+            self.detected_event,
+            time_lock,
+            False,
+            self.aggregated,
+            self.selected_chain.name
+        )
+
+    def compact_journal(self):
+        """ drops the journal entry once this event has nothing left to do. """
+        journal = self.relayer.journal
+        if journal is None:
+            return
+        journal.remove(self.journal_key)
 
     @property
     def relayer(self) -> "EventBridge":
@@ -84,23 +126,31 @@ class RoundUpEvent(ChainEventABC):
         primary_index = self.detected_event.block_number % len(previous_validator_list)
         return primary_index == self.relayer.get_value_by_key(self.round - 1)
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
         # ignore event except one with status: 10
         if self.status != ChainEventStatus.NEXT_AUTHORITY_COMMITTED:
+            self.compact_journal()
             return NoneParams
 
+        # the authority of the new round is committed on bifrost network
+        authority_cache_global.advance_round(chain_enum.BIFROST, self.round)
+
         # check whether this relayer is included in the very previous validator set
         if not self.is_previous_relayer():
+            self.compact_journal()
             return NoneParams
 
         # split task for each native chain
         if self.selected_chain == chain_enum.NONE:
             for chain in self.updating_chains:
                 self.relayer.queue.enqueue(self.clone(chain))
+            self.compact_journal()
             return NoneParams
 
         # check to need to sync validator list to the selected chain
         target_round = fetch_latest_round(self.relayer, self.selected_chain)
+        authority_cache_global.advance_round(self.selected_chain, target_round)
 
         if target_round >= self.round:
             global_logger.formatted_log(
@@ -109,6 +159,7 @@ class RoundUpEvent(ChainEventABC):
                 related_chain_name=self.selected_chain.name,
                 msg="SlowRelay:{}:round({}):AlreadyProcessed".format(self.__class__.EVENT_NAME, target_round)
             )
+            self.compact_journal()
             return NoneParams
 
         # code branch: primary(send) vs secondary(call)
@@ -116,6 +167,12 @@ class RoundUpEvent(ChainEventABC):
             # primary relayer do
             result = fetch_socket_vsp_sigs(self.relayer, self.round)
             submit_data = AggregatedRoundUpSubmit(self).add_tuple_sigs(result)
+            if self.relayer.sig_aggregation_of(self.selected_chain) == SIG_AGGREGATION_QUORUM:
+                # verified by the authority of the latest round on the selected chain
+                submit_data.trim_to_quorum(
+                    fetch_sorted_relayer_list_lower(self.relayer, self.selected_chain, target_round),
+                    fetch_quorum(self.relayer, self.selected_chain, target_round)
+                )
             return (
                 self.selected_chain.name,
                 SOCKET_CONTRACT_NAME,
@@ -128,8 +185,9 @@ class RoundUpEvent(ChainEventABC):
                              + self.relayer.get_chain_manager_of(self.selected_chain.name).tx_commit_time_sec \
                              + 1000 * relayer_config_global.roundup_event_call_delay_sec
 
-            self.switch_to_send(next_time_lock)
             self.aggregated = False
+            self.journal_in_flight(next_time_lock)
+            self.switch_to_send(next_time_lock)
             self.relayer.queue.enqueue(self)
 
             return NoneParams
@@ -141,14 +199,18 @@ class RoundUpEvent(ChainEventABC):
         pass
 
     def handle_tx_result_success(self):
+        authority_cache_global.advance_round(self.selected_chain, self.round)
+        self.compact_journal()
         return None
 
     def handle_tx_result_fail(self) -> None:
         log_invalid_flow("Protocol", self)
+        self.compact_journal()
         return None
 
     def handle_tx_result_no_receipt(self) -> None:
         log_invalid_flow("Protocol", self)
+        self.compact_journal()
         return None
 
     def summary(self) -> str:
@@ -0,0 +1,45 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Dict, List, TypeVar
+
+from chainpy.eventbridge.eventbridge import EventBridge
+from chainpy.logger import global_logger
+
+from rbclib.metric import PrometheusExporterRelayer
+from rbclib.primitives.chain import ChainEnum
+from rbclib.primitives.consts import MULTICHAIN_FAN_OUT_MAX_WORKERS, MULTICHAIN_READ_TIMEOUT_SEC
+
+T = TypeVar("T")
+
+# shared by every fan-out; a task must not fan out again, or it may wait for a worker held by its caller.
+_executor = ThreadPoolExecutor(max_workers=MULTICHAIN_FAN_OUT_MAX_WORKERS, thread_name_prefix="fan-out")
+
+
+def fan_out(
+    manager: EventBridge,
+    fn: Callable[[ChainEnum], T],
+    chains: List[ChainEnum],
+    timeout_sec: float = MULTICHAIN_READ_TIMEOUT_SEC
+) -> Dict[ChainEnum, T]:
+    """
+    Runs "fn" for every chain concurrently and returns the results of the chains which completed in time.
+    A chain which times out or raises is left out of the result (partial result), logged and counted in the metric.
+    """
+    futures: Dict[ChainEnum, Future] = {chain: _executor.submit(fn, chain) for chain in chains}
+    deadline = time.monotonic() + timeout_sec
+
+    results: Dict[ChainEnum, T] = dict()
+    for chain, future in futures.items():
+        try:
+            results[chain] = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except Exception as e:
+            reason = "error" if future.done() else "timeout"
+            future.cancel()  # effective only for a task still waiting for a worker
+            PrometheusExporterRelayer.exporting_fan_out_failure(chain, reason)
+            global_logger.formatted_log(
+                "FanOut",
+                address=manager.active_account.address,
+                related_chain_name=chain.name,
+                msg="{}:{}".format(reason, str(e))
+            )
+    return results
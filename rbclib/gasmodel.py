@@ -0,0 +1,72 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from rbclib.primitives.consts import GAS_MODEL_MAX_SAMPLES, GAS_MODEL_MIN_SAMPLES, GAS_MODEL_PERCENTILE, \
+    GAS_MODEL_MARGIN_PERCENT
+
+# (chain name, contract method name, rbc method name, number of signatures)
+GasUsageKey = Tuple[str, str, str, int]
+
+
+def sig_count_of(method_params) -> int:
+    """ returns the number of signatures in the params, found by the shape of "SocketSignature.tuple()" """
+    if not isinstance(method_params, (list, tuple)):
+        return 0
+    if len(method_params) == 3 and isinstance(method_params[0], list) and isinstance(method_params[1], list) \
+            and isinstance(method_params[2], (bytes, bytearray)) and len(method_params[0]) == len(method_params[1]):
+        return len(method_params[0])
+    return max([sig_count_of(param) for param in method_params] or [0])
+
+
+def gas_usage_key_of(event, chain_name: str, method_name: str, method_params) -> GasUsageKey:
+    rbc_method = getattr(event, "rbc_method", None)
+    rbc_method_name = rbc_method.name if rbc_method is not None and hasattr(rbc_method, "name") else ""
+    return chain_name, method_name, rbc_method_name, sig_count_of(method_params)
+
+
+class GasUsageModel:
+    """
+    Recent "gasUsed" of the successful transactions of each kind (GasUsageKey).
+    The gas limit of a kind is the "percentile" of its samples raised by "margin_percent"; a kind with less than
+    "min_samples" samples has no limit. A transaction out of gas raises the limit of its kind at once, to its gas used
+    raised by "margin_percent". The caller uses the limit only to raise its own (estimated) gas limit.
+    """
+
+    def __init__(
+        self,
+        max_samples: int = GAS_MODEL_MAX_SAMPLES,
+        min_samples: int = GAS_MODEL_MIN_SAMPLES,
+        percentile: int = GAS_MODEL_PERCENTILE,
+        margin_percent: int = GAS_MODEL_MARGIN_PERCENT
+    ):
+        self.max_samples = max_samples
+        self.min_samples = min_samples
+        self.percentile = percentile
+        self.margin_percent = margin_percent
+        self.__lock = threading.Lock()
+        self.__samples: Dict[GasUsageKey, Deque[int]] = dict()
+        self.__floors: Dict[GasUsageKey, int] = dict()
+
+    def record(self, key: GasUsageKey, gas_used: int):
+        with self.__lock:
+            if key not in self.__samples:
+                self.__samples[key] = deque(maxlen=self.max_samples)
+            self.__samples[key].append(gas_used)
+
+    def record_out_of_gas(self, key: GasUsageKey, gas_used: int):
+        with self.__lock:
+            raised = gas_used * (100 + self.margin_percent) // 100
+            self.__floors[key] = max(self.__floors.get(key, 0), raised)
+
+    def gas_limit_of(self, key: GasUsageKey) -> Optional[int]:
+        with self.__lock:
+            samples = sorted(self.__samples.get(key, ()))
+            floor = self.__floors.get(key)
+        if len(samples) < self.min_samples:
+            return floor
+        rank = min((len(samples) * self.percentile + 99) // 100, len(samples)) - 1
+        return max(samples[rank] * (100 + self.margin_percent) // 100, floor or 0)
+
+
+gas_model_global = GasUsageModel()
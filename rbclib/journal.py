@@ -0,0 +1,144 @@
+import json
+import sqlite3
+import threading
+from typing import Dict, List, NamedTuple, Optional
+
+from chainpy.eth.ethtype.hexbytes import EthHexBytes
+from chainpy.eth.managers.eventobj import DetectedEvent
+from chainpy.eventbridge.utils import timestamp_msec
+
+from rbclib.logfetch import LogRecord
+from rbclib.primitives.consts import JOURNAL_FLUSH_ENTRIES
+
+
+class JournalEntry(NamedTuple):
+    key: str
+    kind: str
+    status: int
+    # the log of the event, rebuilt as a "LogRecord"
+    detected_event: LogRecord
+    time_lock: int
+    is_call: bool
+    aggregated: bool
+    selected_chain: Optional[str]
+
+
+class EventJournal:
+    """
+    Journal (sqlite, WAL journal with normal sync) of the events time-locked in the event bridge queue.
+     - an entry is written when its event is put back into the queue with a future time lock.
+     - an entry is removed (compaction) when its request is finalized or its event has nothing left to do.
+    At start-up, the entries are replayed directly into the queue instead of rescanning logs for them.
+    Writes and removals are buffered, and stored in one transaction by "flush" (every tick of the checkpoint feed) or
+    once JOURNAL_FLUSH_ENTRIES keys are buffered; an entry lost with the buffer is found again by the bootstrap.
+    The log of an event is stored as the fields of a "LogRecord" (json), and rebuilt as one on replay.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__conn = sqlite3.connect(path, check_same_thread=False)
+        # key -> the row to store, or None to remove the key
+        self.__buffered: Dict[str, Optional[tuple]] = dict()
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute("PRAGMA synchronous=NORMAL")
+        self.__conn.execute(
+            "CREATE TABLE IF NOT EXISTS event_journal ("
+            "key TEXT PRIMARY KEY, kind TEXT NOT NULL, status INTEGER NOT NULL, log TEXT NOT NULL, "
+            "time_lock INTEGER NOT NULL, is_call INTEGER NOT NULL, aggregated INTEGER NOT NULL, "
+            "selected_chain TEXT, journaled_at INTEGER NOT NULL)"
+        )
+
+    def write(
+        self,
+        key: str,
+        kind: str,
+        status: int,
+        detected_event: DetectedEvent,
+        time_lock: int,
+        is_call: bool,
+        aggregated: bool,
+        selected_chain: str = None
+    ):
+        """ buffers the latest in-flight state of the key, replacing the previous one. """
+        row = (
+            key, kind, status, self._log_of(detected_event), time_lock,
+            int(is_call), int(aggregated), selected_chain, timestamp_msec()
+        )
+        self.__buffer({key: row})
+
+    def remove(self, key: str):
+        self.__buffer({key: None})
+
+    def remove_many(self, keys: List[str]):
+        self.__buffer({key: None for key in keys})
+
+    def __buffer(self, rows: Dict[str, Optional[tuple]]):
+        with self.__lock:
+            self.__buffered.update(rows)
+            if len(self.__buffered) >= JOURNAL_FLUSH_ENTRIES:
+                with self.__conn:
+                    self.__flush_buffered()
+
+    def flush(self):
+        """ stores the buffered writes and removals in one transaction. """
+        with self.__lock, self.__conn:
+            self.__flush_buffered()
+
+    def __flush_buffered(self):
+        if not self.__buffered:
+            return
+        self.__conn.executemany(
+            "INSERT OR REPLACE INTO event_journal "
+            "(key, kind, status, log, time_lock, is_call, aggregated, selected_chain, journaled_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [row for row in self.__buffered.values() if row is not None]
+        )
+        self.__conn.executemany(
+            "DELETE FROM event_journal WHERE key = ?",
+            [(key,) for key, row in self.__buffered.items() if row is None]
+        )
+        self.__buffered = dict()
+
+    def entry_of(self, key: str) -> Optional[JournalEntry]:
+        with self.__lock, self.__conn:
+            self.__flush_buffered()
+            row = self.__conn.execute(
+                "SELECT key, kind, status, log, time_lock, is_call, aggregated, selected_chain "
+                "FROM event_journal WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else self._entry_of_row(row)
+
+    def entries(self, max_age_msec: int) -> List[JournalEntry]:
+        """ returns the entries in the order of time lock, after dropping entries older than "max_age_msec". """
+        with self.__lock, self.__conn:
+            self.__flush_buffered()
+            self.__conn.execute(
+                "DELETE FROM event_journal WHERE journaled_at < ?", (timestamp_msec() - max_age_msec,)
+            )
+            rows = self.__conn.execute(
+                "SELECT key, kind, status, log, time_lock, is_call, aggregated, selected_chain "
+                "FROM event_journal ORDER BY time_lock"
+            ).fetchall()
+        return [self._entry_of_row(row) for row in rows]
+
+    @staticmethod
+    def _log_of(detected_event: DetectedEvent) -> str:
+        state = LogRecord.of_detected_event(detected_event).__getstate__()
+        state["data"] = EthHexBytes(state["data"]).hex()
+        return json.dumps(state)
+
+    @staticmethod
+    def _entry_of_row(row: tuple) -> JournalEntry:
+        key, kind, status, log, time_lock, is_call, aggregated, selected_chain = row
+        state = json.loads(log)
+        state["data"] = EthHexBytes(state["data"])
+        record = LogRecord.__new__(LogRecord)
+        record.__setstate__(state)
+        return JournalEntry(key, kind, status, record, time_lock, bool(is_call), bool(aggregated), selected_chain)
+
+    def close(self):
+        with self.__lock:
+            with self.__conn:
+                self.__flush_buffered()
+            self.__conn.close()
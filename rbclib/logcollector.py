@@ -0,0 +1,213 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from chainpy.eventbridge.utils import timestamp_msec
+from chainpy.logger import global_logger
+
+from rbclib.logfetch import LogRecord, LogTarget, ContractLogFilter, log_fetcher_global
+from rbclib.logsub import LogSubscription
+from rbclib.primitives.chain import ChainEnum, chain_enum
+from rbclib.primitives.consts import LOG_SUBSCRIPTION_TIMEOUT_BLOCKS, LOG_SUBSCRIPTION_RETRY_SEC
+from rbclib.rpc import send_request, sticky_endpoint
+
+
+class ChainLogCollector:
+    """
+    Collects the logs of the registered events on a chain, and puts their events into the event bridge queue.
+     - with "ws_url_with_access_key" in the chain config, the logs are received by "eth_subscribe", and held until
+       they are "block_aging_period" blocks deep.
+     - otherwise, or while the websocket is disconnected, the logs of the aged blocks are polled by "eth_getLogs"
+       every "block_period_sec". the blocks missed during a disconnection are fetched on the next subscription.
+    """
+
+    def __init__(self, relayer, chain: ChainEnum, targets: List[LogTarget], from_height: int):
+        self.relayer = relayer
+        self.chain = chain
+        self.targets = targets
+        self.log_filters = ContractLogFilter.group(targets)
+
+        chain_config = relayer.multichain_config[chain.name]
+        self.url = relayer.abi_registry.url_of(chain)
+        self.ws_url: Optional[str] = chain_config.get("ws_url_with_access_key")
+        self.block_period_sec: float = chain_config.get("block_period_sec", 3)
+        self.aging: int = chain_config.get("block_aging_period", 0)
+        self.max_log_num: int = chain_config.get("max_log_num", 1000)
+
+        # the logs up to this height are delivered
+        self.collected_height = from_height
+        self.__lock = threading.Lock()
+        self.__stopped = threading.Event()
+
+    def _log(self, msg: str):
+        global_logger.formatted_log(
+            "LogCollector", address=self.relayer.active_account.address, related_chain_name=self.chain.name, msg=msg
+        )
+
+    def head_height(self) -> int:
+        return int(send_request(self.url, "eth_blockNumber", []), 16)
+
+    def aged_height(self) -> int:
+        return self.head_height() - self.aging
+
+    def fetch_range(self, from_height: int, to_height: int, chunked: bool = False) -> List[LogRecord]:
+        fetch = log_fetcher_global.fetch_chunked if chunked else log_fetcher_global.fetch
+        records = list()
+        for log_filter in self.log_filters:
+            logs = fetch(self.chain.name, self.url, log_filter.params(), from_height, to_height, self.max_log_num)
+            for log in logs:
+                target = log_filter.target_of(log)
+                if target is not None:
+                    records.append(LogRecord.from_rpc_log(self.chain.name, target, log))
+        return sorted(records, key=lambda record: record.position)
+
+    def collect_until(self, height: Optional[int] = None):
+        """ delivers the logs up to the height (by default, the aged height) by "eth_getLogs" """
+        with self.__lock, sticky_endpoint(self.url):
+            if height is not None and height <= self.collected_height:
+                return
+            # the height is capped by the head of the node serving the logs, so no log is missed on a lagging node
+            head_height = self.head_height()
+            height = head_height - self.aging if height is None else min(height, head_height)
+            if height <= self.collected_height:
+                return
+            self.deliver(self.fetch_range(self.collected_height + 1, height))
+            self.collected_height = height
+
+    def deliver(self, records: List[LogRecord]):
+        for record in records:
+            event_class = self.relayer.chain_event_classes.get(record.event_name)
+            event = event_class.init(record, timestamp_msec(), self.relayer) if event_class is not None else None
+            if event is not None:
+                self.relayer.queue.enqueue(event)
+
+    def stop(self):
+        """ ends "run" after the current subscription or poll. """
+        self.__stopped.set()
+
+    def run(self):
+        next_subscription_at = 0.0
+        while not self.__stopped.is_set():
+            if self.ws_url is not None and time.monotonic() >= next_subscription_at:
+                try:
+                    self.run_subscription()
+                except Exception as e:
+                    self._log("SubscriptionLost:{}".format(str(e)))
+                next_subscription_at = time.monotonic() + LOG_SUBSCRIPTION_RETRY_SEC
+
+            try:
+                self.collect_until()
+            except Exception as e:
+                self._log("PollError:{}".format(str(e)))
+            self.__stopped.wait(self.block_period_sec)
+
+    def run_subscription(self):
+        timeout_sec = self.block_period_sec * LOG_SUBSCRIPTION_TIMEOUT_BLOCKS
+        with LogSubscription(self.ws_url, self.log_filters, timeout_sec) as subscription:
+            # the blocks up to this height are fetched by "eth_getLogs", the following ones are subscribed
+            subscribed_from = int(send_request(self.url, "eth_blockNumber", []), 16) + 1
+            self._log("Subscribed:from({})".format(subscribed_from))
+
+            pending: Dict[int, List[LogRecord]] = dict()
+            for kind, value in subscription.notifications():
+                if kind == "log":
+                    target, log = value
+                    record = LogRecord.from_rpc_log(self.chain.name, target, log)
+                    if log.get("removed"):
+                        # reorganized out of the chain
+                        pending[record.block_number] = [
+                            held for held in pending.get(record.block_number, []) if held.position != record.position
+                        ]
+                    elif record.block_number >= subscribed_from:
+                        pending.setdefault(record.block_number, list()).append(record)
+                    continue
+
+                aged_height = value - self.aging
+                self.collect_until(min(aged_height, subscribed_from - 1))
+                if self.collected_height >= subscribed_from - 1:
+                    # the held logs follow the fetched ones only
+                    self.release(pending, aged_height)
+
+    def release(self, pending: Dict[int, List[LogRecord]], aged_height: int):
+        """ delivers the held logs up to the aged height """
+        with self.__lock:
+            if aged_height <= self.collected_height:
+                return
+            heights = sorted(height for height in pending if height <= aged_height)
+            records = list()
+            for height in heights:
+                records.extend(pending.pop(height))
+            self.deliver(sorted(records, key=lambda record: record.position))
+            self.collected_height = aged_height
+
+
+class LogCollector:
+    """
+    Log collection of the relayer, in place of the chain monitor of the event bridge ("log_collector" of the entity
+    config). The registered events are removed from the chain configs passed to the event bridge.
+    """
+
+    def __init__(self, relayer, events_of_chain: Dict[str, List[dict]]):
+        self.relayer = relayer
+        self.events_of_chain = events_of_chain
+        self.chain_collectors: Dict[str, ChainLogCollector] = dict()
+
+    def targets_of(self, chain: ChainEnum) -> List[LogTarget]:
+        registry = self.relayer.abi_registry
+        return [
+            LogTarget(
+                event["contract_name"],
+                event["event_name"],
+                registry.address_of(chain, event["contract_name"]).lower(),
+                registry.event_of(chain, event["contract_name"], event["event_name"]).topic
+            )
+            for event in self.events_of_chain.get(chain.name, [])
+        ]
+
+    def collected_height_of(self, chain_name: str) -> int:
+        return self.chain_collectors[chain_name].collected_height
+
+    def _bootstrap_chain(self, chain_name: str) -> List[LogRecord]:
+        chain = chain_enum[chain_name]
+        from_height = self.relayer.get_chain_manager_of(chain_name).latest_height
+        collector = ChainLogCollector(self.relayer, chain, self.targets_of(chain), from_height)
+
+        records = list()
+        with sticky_endpoint(collector.url):
+            aged_height = collector.aged_height()
+            if aged_height >= from_height:
+                records = collector.fetch_range(from_height, aged_height, chunked=True)
+                collector.collected_height = aged_height
+        self.chain_collectors[chain_name] = collector
+        return records
+
+    def bootstrap(self):
+        """ collects the logs from the latest height of each chain (concurrently), and bootstraps their events. """
+        chain_names = self.relayer.supported_chain_list
+        with ThreadPoolExecutor(max_workers=len(chain_names), thread_name_prefix="log-bootstrap") as executor:
+            records_of_chain = list(executor.map(self._bootstrap_chain, chain_names))
+
+        # in the order of chains, and of blocks on each chain
+        records_of_event: Dict[str, List[LogRecord]] = dict()
+        for records in records_of_chain:
+            for record in records:
+                records_of_event.setdefault(record.event_name, list()).append(record)
+
+        for event_name, records in records_of_event.items():
+            event_class = self.relayer.chain_event_classes.get(event_name)
+            if event_class is None:
+                continue
+            for event in event_class.bootstrap(self.relayer, records):
+                self.relayer.queue.enqueue(event)
+
+        global_logger.formatted_log(
+            "BootStrap",
+            address=self.relayer.active_account.address,
+            related_chain_name=chain_enum.BIFROST.name,
+            msg="CollectedLogs:{}".format({name: len(records) for name, records in records_of_event.items()})
+        )
+
+    def start(self):
+        for chain_name, collector in self.chain_collectors.items():
+            threading.Thread(target=collector.run, name="log-collector-{}".format(chain_name), daemon=True).start()
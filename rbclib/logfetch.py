@@ -0,0 +1,251 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import requests
+from chainpy.eth.ethtype.hexbytes import EthHexBytes
+
+from rbclib.primitives.consts import LOG_FETCH_MAX_WINDOW, LOG_FETCH_GROWTH_FACTOR, LOG_FETCH_MAX_WORKERS_PER_PROVIDER, \
+    LOG_FETCH_WINDOWS_PER_CHUNK, LOG_FETCH_RATE_LIMIT_RETRY, LOG_FETCH_RATE_LIMIT_BACKOFF_SEC
+from rbclib.rpc import send_request, JsonRpcError
+
+# error messages of providers refusing a range of "eth_getLogs" (too many results, too wide a range, too slow)
+RANGE_ERROR_MESSAGES = (
+    "query returned more than",  # geth, infura, bsc
+    "response size exceeded",  # alchemy
+    "response size should not",
+    "block range",  # "block range too large", "exceed maximum block range", "block range limit exceeded", ...
+    "range too large",
+    "range is too large",
+    "is limited to a",  # quicknode: "eth_getLogs is limited to a 10,000 range"
+    "too many blocks",
+    "logs over limit",
+    "query timeout",
+)
+
+# error messages and codes of providers limiting the rate of requests, matched before the range errors
+RATE_LIMIT_ERROR_MESSAGES = (
+    "rate limit", "too many requests", "request rate", "request count", "compute units", "throughput"
+)
+RATE_LIMIT_ERROR_CODES = (429, -32029)
+
+
+class LogTarget(NamedTuple):
+    contract_name: str
+    event_name: str
+    address: str  # lower case
+    topic: str  # topic0, the hash of the event signature
+
+
+class LogRecord:
+    """
+    A log of a registered event, collected by the log collector of the relayer.
+    It has the members of chainpy's "DetectedEvent" used by the events of the relayer, and is decoded by
+    "Relayer.decode_event" with the event abi of the contract.
+    """
+    __slots__ = (
+        "chain_name", "contract_name", "event_name", "block_number", "block_hash", "log_index", "transaction_hash",
+        "topics", "data"
+    )
+
+    def __init__(
+        self,
+        chain_name: str,
+        contract_name: str,
+        event_name: str,
+        block_number: int,
+        block_hash: str,
+        log_index: int,
+        transaction_hash: str,
+        topics: List[str],
+        data: EthHexBytes
+    ):
+        self.chain_name = chain_name
+        self.contract_name = contract_name
+        self.event_name = event_name
+        self.block_number = block_number
+        self.block_hash = block_hash
+        self.log_index = log_index
+        self.transaction_hash = transaction_hash
+        self.topics = topics
+        self.data = data
+
+    @classmethod
+    def from_rpc_log(cls, chain_name: str, target: LogTarget, log: dict) -> "LogRecord":
+        return cls(
+            chain_name,
+            target.contract_name,
+            target.event_name,
+            int(log["blockNumber"], 16),
+            log.get("blockHash"),
+            int(log.get("logIndex") or "0x0", 16),
+            log.get("transactionHash"),
+            log["topics"],
+            EthHexBytes(log["data"])
+        )
+
+    @classmethod
+    def of_detected_event(cls, detected_event) -> "LogRecord":
+        """ the log of a detected event of the event bridge (or the record itself) """
+        if isinstance(detected_event, LogRecord):
+            return detected_event
+        return cls(
+            detected_event.chain_name,
+            detected_event.contract_name,
+            detected_event.event_name,
+            detected_event.block_number,
+            getattr(detected_event, "block_hash", None),
+            getattr(detected_event, "log_index", 0),
+            getattr(detected_event, "transaction_hash", None),
+            getattr(detected_event, "topics", None) or list(),
+            detected_event.data
+        )
+
+    @property
+    def position(self) -> tuple:
+        """ the order of the log on its chain """
+        return self.block_number, self.log_index
+
+    def __getstate__(self) -> Dict[str, object]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, object]):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code in RATE_LIMIT_ERROR_CODES
+    if isinstance(error, JsonRpcError):
+        if isinstance(error.error, dict) and error.error.get("code") in RATE_LIMIT_ERROR_CODES:
+            return True
+        msg = str(error.error).lower()
+        return any(message in msg for message in RATE_LIMIT_ERROR_MESSAGES)
+    return False
+
+
+def is_range_error(error: Exception) -> bool:
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    if isinstance(error, JsonRpcError) and not is_rate_limit_error(error):
+        msg = str(error.error).lower()
+        return any(message in msg for message in RANGE_ERROR_MESSAGES)
+    return False
+
+
+class AdaptiveLogFetcher:
+    """
+    "eth_getLogs" over a block range, split into windows sized per (chain, provider).
+     - a window is doubled after a response with less than half of "max_log_num" logs.
+     - a window is halved (and the request retried) when the provider refuses it with a "too many results" or
+       timeout error, or when the response has more than "max_log_num" logs.
+     - a request refused by rate limiting is retried with the same window after an exponential back-off.
+    The window of each (chain, provider) is kept for the next fetches, starting from "max_log_num" blocks.
+    A long range (bootstrap) is fetched in chunks concurrently by "fetch_chunked", with a bounded pool per provider.
+    """
+
+    def __init__(self, max_window: int = LOG_FETCH_MAX_WINDOW, max_workers: int = LOG_FETCH_MAX_WORKERS_PER_PROVIDER):
+        self.max_window = max_window
+        self.max_workers = max_workers
+        self.__lock = threading.Lock()
+        self.__windows: Dict[Tuple[str, str], int] = dict()
+        self.__executors: Dict[str, ThreadPoolExecutor] = dict()
+
+    def window_of(self, chain_name: str, url: str, max_log_num: int) -> int:
+        with self.__lock:
+            return self.__windows.setdefault((chain_name, url), max_log_num)
+
+    def _set_window(self, chain_name: str, url: str, window: int):
+        with self.__lock:
+            self.__windows[(chain_name, url)] = min(max(window, 1), self.max_window)
+
+    def fetch(
+        self, chain_name: str, url: str, log_filter: dict, from_height: int, to_height: int, max_log_num: int
+    ) -> List[dict]:
+        """ fetches the logs of the filter ("address" and "topics") in [from_height, to_height]. """
+        logs = list()
+        start, rate_limited = from_height, 0
+        while start <= to_height:
+            window = self.window_of(chain_name, url, max_log_num)
+            end = min(start + window - 1, to_height)
+            try:
+                result = send_request(
+                    url, "eth_getLogs", [dict(log_filter, fromBlock=hex(start), toBlock=hex(end))]
+                )
+            except Exception as e:
+                if is_rate_limit_error(e) and rate_limited < LOG_FETCH_RATE_LIMIT_RETRY:
+                    # the same window is retried after a back-off; the window is not to blame
+                    time.sleep(LOG_FETCH_RATE_LIMIT_BACKOFF_SEC * 2 ** rate_limited)
+                    rate_limited += 1
+                    continue
+                if not is_range_error(e) or end == start:
+                    raise
+                self._set_window(chain_name, url, (end - start + 1) // 2)
+                continue
+
+            rate_limited = 0
+            logs.extend(result)
+            if len(result) > max_log_num:
+                self._set_window(chain_name, url, window // 2)
+            elif len(result) < max_log_num // 2 and end - start + 1 == window:
+                # only a full window tells the range is small enough to grow
+                self._set_window(chain_name, url, window * LOG_FETCH_GROWTH_FACTOR)
+            start = end + 1
+        return logs
+
+    def _executor_of(self, url: str) -> ThreadPoolExecutor:
+        with self.__lock:
+            if url not in self.__executors:
+                self.__executors[url] = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="log-fetch")
+            return self.__executors[url]
+
+    def fetch_chunked(
+        self, chain_name: str, url: str, log_filter: dict, from_height: int, to_height: int, max_log_num: int
+    ) -> List[dict]:
+        """ "fetch" of a long range, split into chunks fetched concurrently and joined in block order. """
+        chunk_size = self.window_of(chain_name, url, max_log_num) * LOG_FETCH_WINDOWS_PER_CHUNK
+        executor = self._executor_of(url)
+        # the chunks run in the context of the caller (e.g. its sticky endpoint)
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                self.fetch, chain_name, url, log_filter, start, min(start + chunk_size - 1, to_height), max_log_num
+            )
+            for start in range(from_height, to_height + 1, chunk_size)
+        ]
+
+        logs = list()
+        for future in futures:
+            logs.extend(future.result())
+        return logs
+
+
+log_fetcher_global = AdaptiveLogFetcher()
+
+
+class ContractLogFilter:
+    """
+    A single log filter of every target event of a contract ("topics" of the topic0 list), instead of one filter per
+    event. The logs of the filter are demultiplexed to the targets by their topic0.
+    """
+
+    def __init__(self, address: str, targets: List[LogTarget]):
+        self.address = address
+        self.target_of_topic: Dict[str, LogTarget] = {target.topic.lower(): target for target in targets}
+
+    @classmethod
+    def group(cls, targets: List[LogTarget]) -> List["ContractLogFilter"]:
+        targets_of_address: Dict[str, List[LogTarget]] = dict()
+        for target in targets:
+            targets_of_address.setdefault(target.address, list()).append(target)
+        return [cls(address, targets_of_address[address]) for address in targets_of_address]
+
+    def params(self) -> dict:
+        return {"address": self.address, "topics": [sorted(self.target_of_topic)]}
+
+    def target_of(self, log: dict) -> Optional[LogTarget]:
+        topics = log.get("topics") or []
+        return self.target_of_topic.get(topics[0].lower()) if topics else None
@@ -0,0 +1,76 @@
+import json
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Tuple, Union
+
+import websocket
+
+from rbclib.logfetch import LogTarget, ContractLogFilter
+from rbclib.rpc import JsonRpcError
+
+# ("head", height) or ("log", (target, log))
+Notification = Tuple[str, Union[int, Tuple[LogTarget, dict]]]
+
+
+class LogSubscription:
+    """
+    "eth_subscribe" of the new heads and of the logs of the contracts (one subscription per contract filter),
+    over a websocket connection.
+    A connection error or a silence longer than "timeout_sec" is raised from "notifications".
+    """
+
+    def __init__(self, ws_url: str, log_filters: List[ContractLogFilter], timeout_sec: float):
+        self.ws_url = ws_url
+        self.log_filters = log_filters
+        self.timeout_sec = timeout_sec
+        self.__ws = None
+        self.__request_id = 0
+        self.__backlog: Deque[dict] = deque()
+        self.__head_subscription = None
+        self.__log_subscriptions: Dict[str, ContractLogFilter] = dict()
+
+    def __enter__(self) -> "LogSubscription":
+        self.__ws = websocket.create_connection(self.ws_url, timeout=self.timeout_sec)
+        try:
+            self.__head_subscription = self._request("eth_subscribe", ["newHeads"])
+            for log_filter in self.log_filters:
+                subscription = self._request("eth_subscribe", ["logs", log_filter.params()])
+                self.__log_subscriptions[subscription] = log_filter
+        except Exception:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.__ws is not None:
+            self.__ws.close()
+            self.__ws = None
+
+    def _request(self, method: str, params: list):
+        self.__request_id += 1
+        request_id = self.__request_id
+        self.__ws.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+        while True:
+            msg = json.loads(self.__ws.recv())
+            if msg.get("id") != request_id:
+                # a notification of an earlier subscription
+                self.__backlog.append(msg)
+                continue
+            if "error" in msg:
+                raise JsonRpcError(method, msg["error"])
+            return msg.get("result")
+
+    def notifications(self) -> Iterator[Notification]:
+        while True:
+            msg = self.__backlog.popleft() if self.__backlog else json.loads(self.__ws.recv())
+            if msg.get("method") != "eth_subscription":
+                continue
+            params = msg["params"]
+            if params["subscription"] == self.__head_subscription:
+                yield "head", int(params["result"]["number"], 16)
+            elif params["subscription"] in self.__log_subscriptions:
+                target = self.__log_subscriptions[params["subscription"]].target_of(params["result"])
+                if target is not None:
+                    yield "log", (target, params["result"])
@@ -22,6 +22,12 @@ class PrometheusExporterRelayer(PrometheusExporter):
     CHAIN_ROUNDS = Gauge(CHAIN_ROUNDS_QUERY_NAME, 'Description', ['chain'])
     REQUEST_COUNTERS = Counter(REQUEST_COUNTERS_QUERY_NAME, 'Description of counter', ['status'])
 
+    AUTHORITY_CACHE_COUNTER = Counter(AUTHORITY_CACHE_QUERY_NAME, 'Description of counter', ['result'])
+    FAN_OUT_FAILURE_COUNTER = Counter(FAN_OUT_FAILURE_QUERY_NAME, 'Description of counter', ['chain', 'reason'])
+
+    PENDING_TXS = Gauge(PENDING_TXS_QUERY_NAME, 'Description', ['chain'])
+    TIME_TO_RECEIPT = Gauge(TIME_TO_RECEIPT_QUERY_NAME, 'Description', ['chain'])
+
     @staticmethod
     def init_prometheus_exporter_on_relayer(
         supported_chains: List[str], port: int = PrometheusExporter.PROMETHEUS_SEVER_PORT
@@ -97,3 +103,27 @@ class PrometheusExporterRelayer(PrometheusExporter):
         if not PrometheusExporterRelayer.PROMETHEUS_ON:
             return
         PrometheusExporterRelayer.CHAIN_ROUNDS.labels(chain.lower()).set(rnd)
+
+    @staticmethod
+    def exporting_authority_cache(hit: bool):
+        if not PrometheusExporterRelayer.PROMETHEUS_ON:
+            return
+        PrometheusExporterRelayer.AUTHORITY_CACHE_COUNTER.labels("hit" if hit else "miss").inc()
+
+    @staticmethod
+    def exporting_fan_out_failure(chain: ChainEnum, reason: str):
+        if not PrometheusExporterRelayer.PROMETHEUS_ON:
+            return
+        PrometheusExporterRelayer.FAN_OUT_FAILURE_COUNTER.labels(chain.name.lower(), reason).inc()
+
+    @staticmethod
+    def exporting_pending_txs(chain: ChainEnum, pending_count: int):
+        if not PrometheusExporterRelayer.PROMETHEUS_ON:
+            return
+        PrometheusExporterRelayer.PENDING_TXS.labels(chain.name.lower()).set(pending_count)
+
+    @staticmethod
+    def exporting_time_to_receipt(chain: ChainEnum, elapsed_sec: float):
+        if not PrometheusExporterRelayer.PROMETHEUS_ON:
+            return
+        PrometheusExporterRelayer.TIME_TO_RECEIPT.labels(chain.name.lower()).set(elapsed_sec)
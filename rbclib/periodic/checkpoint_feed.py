@@ -0,0 +1,81 @@
+from typing import Optional, Dict
+
+from chainpy.eventbridge.chaineventabc import CallParamTuple, SendParamTuple
+from chainpy.eventbridge.periodiceventabc import PeriodicEventABC
+from chainpy.eventbridge.utils import timestamp_msec
+from chainpy.logger import global_logger
+
+from rbclib.primitives.chain import chain_enum
+from rbclib.primitives.consts import NoneParams, CHECKPOINT_PERIOD_SEC
+from rbclib.utils import log_invalid_flow
+from relayer.relayer import Relayer
+
+
+class CheckpointFeed(PeriodicEventABC):
+    """
+    Periodically stores the collected height of each chain into the relayer's bootstrap checkpoint, together with the
+    requests buffered by the events since the previous tick. The event journal is flushed on the same tick.
+    The heights observed in the previous tick are stored, so that the events collected up to them have been
+    initiated (and recorded as pending requests) before the checkpoint moves past them.
+    """
+
+    def __init__(
+        self,
+        relayer: "Relayer",
+        period_sec: int = CHECKPOINT_PERIOD_SEC,
+        time_lock: int = timestamp_msec(),
+        observed_heights: Dict[str, int] = None
+    ):
+        if period_sec == 0:
+            period_sec = CHECKPOINT_PERIOD_SEC
+        super().__init__(relayer, period_sec, time_lock)
+        self.observed_heights = observed_heights
+
+    @property
+    def relayer(self) -> "Relayer":
+        return self.manager
+
+    def clone_next(self):
+        heights = {
+            chain_name: self.relayer.collected_height_of(chain_name)
+            for chain_name in self.relayer.supported_chain_list
+        }
+        return self.__class__(self.relayer, self.period_sec, self.time_lock + self.period_sec * 1000, heights)
+
+    def summary(self) -> str:
+        return "{}".format(self.__class__.__name__)
+
+    def build_call_transaction_params(self) -> CallParamTuple:
+        log_invalid_flow("Checkpoint", self)
+        return NoneParams
+
+    def build_transaction_params(self) -> SendParamTuple:
+        if self.relayer.journal is not None:
+            self.relayer.journal.flush()
+        if self.relayer.checkpoint is None:
+            return NoneParams
+        if self.observed_heights is None:
+            self.relayer.checkpoint.flush()
+            return NoneParams
+
+        self.relayer.checkpoint.save_heights(self.observed_heights)
+        global_logger.formatted_log(
+            "Checkpoint",
+            address=self.relayer.active_account.address,
+            related_chain_name=chain_enum.BIFROST.name,
+            msg="SavedHeights:{}".format(self.observed_heights)
+        )
+        return NoneParams
+
+    def handle_call_result(self, result: tuple) -> Optional[PeriodicEventABC]:
+        log_invalid_flow("Checkpoint", self)
+        return None
+
+    def handle_tx_result_success(self) -> Optional[PeriodicEventABC]:
+        return None
+
+    def handle_tx_result_fail(self) -> Optional[PeriodicEventABC]:
+        return None
+
+    def handle_tx_result_no_receipt(self) -> Optional[PeriodicEventABC]:
+        return None
@@ -1,4 +1,5 @@
-from typing import Optional
+import random
+from typing import Optional, Tuple
 
 from chainpy.eventbridge.chaineventabc import CallParamTuple, SendParamTuple
 from chainpy.eventbridge.periodiceventabc import PeriodicEventABC
@@ -7,20 +8,53 @@ from chainpy.logger import global_logger
 
 from rbclib.metric import PrometheusExporterRelayer
 from rbclib.primitives.chain import chain_enum
-from rbclib.primitives.consts import NoneParams
-from rbclib.utils import is_heart_beat_pulsed
+from rbclib.primitives.consts import NoneParams, HEARTBEAT_SESSION_START_JITTER_SEC
+from rbclib.txpipeline import pipelined
+from rbclib.utils import is_heart_beat_pulsed, fetch_session_info
 from relayer.global_config import relayer_config_global
 from relayer.relayer import Relayer
 
 
+class HeartBeatSchedule:
+    """
+    Shared by the heartbeat events of a relayer. A pulse is needed once in a session, so after the pulse of a session,
+    the heartbeat sleeps (without any rpc call) until shortly after the expected start of the next session.
+    """
+
+    def __init__(self, retry_period_sec: int):
+        self.retry_period_sec = retry_period_sec
+        self.next_pulse_at = 0
+        self.pulsed_session: Optional[int] = None
+        self.pending: Optional[Tuple[int, int]] = None  # (session, expected start of the next session) in flight
+
+    def is_sleeping(self) -> bool:
+        return timestamp_msec() < self.next_pulse_at
+
+    def wait_until(self, next_session_at: int):
+        # relayers are spread over the beginning of the session
+        self.next_pulse_at = next_session_at + random.randint(0, HEARTBEAT_SESSION_START_JITTER_SEC * 1000)
+
+    def pulsed(self, session: int, next_session_at: int):
+        self.pulsed_session = session
+        self.pending = None
+        self.wait_until(next_session_at)
+
+    def retry(self):
+        self.pending = None
+        retry_period_msec = self.retry_period_sec * 1000
+        self.next_pulse_at = timestamp_msec() + retry_period_msec + random.randint(0, retry_period_msec // 2)
+
+
 class RelayerHeartBeat(PeriodicEventABC):
     def __init__(
         self,
         relayer: "Relayer",
         period_sec: int = relayer_config_global.heart_beat_period_sec,
-        time_lock: int = timestamp_msec()
+        time_lock: int = timestamp_msec(),
+        schedule: HeartBeatSchedule = None
     ):
         super().__init__(relayer, period_sec, time_lock)
+        self.schedule = schedule if schedule is not None else HeartBeatSchedule(period_sec)
 
     @property
     def relayer(self) -> "Relayer":
@@ -30,7 +64,8 @@ class RelayerHeartBeat(PeriodicEventABC):
         return self.__class__(
             self.relayer,
             self.period_sec,
-            self.time_lock + self.period_sec * 1000
+            max(self.time_lock + self.period_sec * 1000, self.schedule.next_pulse_at),
+            self.schedule
         )
 
     def summary(self) -> str:
@@ -39,16 +74,36 @@ class RelayerHeartBeat(PeriodicEventABC):
     def build_call_transaction_params(self) -> CallParamTuple:
         return NoneParams
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
-        if not is_heart_beat_pulsed(self.relayer):
-            return chain_enum.BIFROST.name, "relayer_authority", "heartbeat", []
-        else:
+        if self.schedule.is_sleeping():
             return NoneParams
 
+        session, first_session_block, current_height, session_length = fetch_session_info(self.relayer)
+        block_period_msec = self.relayer.multichain_config[chain_enum.BIFROST.name]["block_period_sec"] * 1000
+        remaining_blocks = max(first_session_block + session_length - current_height, 1)
+        next_session_at = timestamp_msec() + remaining_blocks * block_period_msec
+
+        if session == self.schedule.pulsed_session:
+            # woke up before the session changed
+            self.schedule.wait_until(next_session_at)
+            return NoneParams
+
+        if is_heart_beat_pulsed(self.relayer):
+            self.schedule.pulsed(session, next_session_at)
+            return NoneParams
+
+        # no other pulse until the result of this one
+        self.schedule.retry()
+        self.schedule.pending = (session, next_session_at)
+        return chain_enum.BIFROST.name, "relayer_authority", "heartbeat", []
+
     def handle_call_result(self, result: tuple) -> Optional[PeriodicEventABC]:
         return None
 
     def handle_tx_result_success(self) -> Optional[PeriodicEventABC]:
+        if self.schedule.pending is not None:
+            self.schedule.pulsed(*self.schedule.pending)
         PrometheusExporterRelayer.exporting_heartbeat_metric()
         global_logger.formatted_log(
             "HeartBeat",
@@ -59,6 +114,7 @@ class RelayerHeartBeat(PeriodicEventABC):
         return None
 
     def handle_tx_result_fail(self) -> Optional[PeriodicEventABC]:
+        self.schedule.retry()
         global_logger.formatted_log(
             "HeartBeat",
             address=self.relayer.active_account.address,
@@ -68,6 +124,7 @@ class RelayerHeartBeat(PeriodicEventABC):
         return None
 
     def handle_tx_result_no_receipt(self) -> Optional[PeriodicEventABC]:
+        self.schedule.retry()
         global_logger.formatted_log(
             "HeartBeat",
             address=self.relayer.active_account.address,
@@ -1,4 +1,5 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List
 
 from chainpy.btc.managers.simplerpccli import SimpleBtcClient
 from chainpy.eth.ethtype.hexbytes import EthHashBytes
@@ -9,9 +10,13 @@ from chainpy.eventbridge.utils import timestamp_msec
 from chainpy.logger import global_logger
 
 from rbclib.metric import PrometheusExporterRelayer
-from rbclib.utils import is_selected_relayer, fetch_oracle_latest_round, is_submitted_oracle_feed, log_invalid_flow
+from rbclib.primitives.chain import chain_enum
+from rbclib.primitives.consts import SOCKET_CONTRACT_NAME, CONSENSUS_ORACLE_FEEDING_FUNCTION_NAME, NoneParams, \
+    BTC_HASH_CATCH_UP_MAX_BATCH_SIZE, BTC_HASH_CATCH_UP_MAX_WORKERS
+from rbclib.primitives.oracle import Oracle
+from rbclib.txpipeline import pipelined
+from rbclib.utils import is_selected_relayer, fetch_oracle_latest_round, fetch_submitted_oracle_feeds, log_invalid_flow
 from relayer.global_config import relayer_config_global
-from ..primitives import SOCKET_CONTRACT_NAME, CONSENSUS_ORACLE_FEEDING_FUNCTION_NAME, NoneParams, chain_enum, Oracle
 
 
 class BtcHashUpOracle(PeriodicEventABC):
@@ -48,6 +53,7 @@ class BtcHashUpOracle(PeriodicEventABC):
         log_invalid_flow("BtcHash", self)
         return NoneParams
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
         # check whether this is current authority
         auth = is_selected_relayer(
@@ -75,40 +81,50 @@ class BtcHashUpOracle(PeriodicEventABC):
             )
             return NoneParams
 
-        self.delayed = True if delta > 1 else False
+        # catches up at most "BTC_HASH_CATCH_UP_MAX_BATCH_SIZE" heights in a transaction
+        batch_size = min(delta, BTC_HASH_CATCH_UP_MAX_BATCH_SIZE)
+        self.delayed = True if delta > batch_size else False
 
-        feed_target_height = latest_height_from_socket + 1
-        submitted = is_submitted_oracle_feed(self.relayer, Oracle.BITCOIN_BLOCK_HASH, feed_target_height)
-        if not submitted:
-            result = self.__cli.get_block_hash_by_height(feed_target_height)
-            block_hash = EthHashBytes(result)
-            PrometheusExporterRelayer.exporting_btc_hash(feed_target_height)
+        target_heights = list(range(latest_height_from_socket + 1, latest_height_from_socket + 1 + batch_size))
+        submitted = fetch_submitted_oracle_feeds(self.relayer, Oracle.BITCOIN_BLOCK_HASH, target_heights)
+        feed_heights = [height for height, is_submitted in zip(target_heights, submitted) if not is_submitted]
+        if not feed_heights:
             global_logger.formatted_log(
                 "BtcHash",
                 address=self.manager.active_account.address,
                 related_chain_name=chain_enum.BIFROST.name,
-                msg="btcHash({}):height({})".format(block_hash.hex(), feed_target_height)
-            )
-
-            return (
-                chain_enum.BIFROST.name,
-                SOCKET_CONTRACT_NAME,
-                CONSENSUS_ORACLE_FEEDING_FUNCTION_NAME,
-                [
-                    [Oracle.BITCOIN_BLOCK_HASH.value],
-                    [feed_target_height],
-                    [block_hash.bytes()]
-                ]
+                msg="submitted:height({}-{})".format(target_heights[0], target_heights[-1])
             )
+            return NoneParams
 
-        else:
+        block_hashes = self.fetch_block_hashes(feed_heights)
+        for height, block_hash in zip(feed_heights, block_hashes):
             global_logger.formatted_log(
                 "BtcHash",
                 address=self.manager.active_account.address,
                 related_chain_name=chain_enum.BIFROST.name,
-                msg="submitted:height({})".format(feed_target_height)
+                msg="btcHash({}):height({})".format(block_hash.hex(), height)
             )
-            return NoneParams
+        PrometheusExporterRelayer.exporting_btc_hash(feed_heights[-1])
+
+        return (
+            chain_enum.BIFROST.name,
+            SOCKET_CONTRACT_NAME,
+            CONSENSUS_ORACLE_FEEDING_FUNCTION_NAME,
+            [
+                [Oracle.BITCOIN_BLOCK_HASH.value] * len(feed_heights),
+                feed_heights,
+                [block_hash.bytes() for block_hash in block_hashes]
+            ]
+        )
+
+    def fetch_block_hashes(self, heights: List[int]) -> List[EthHashBytes]:
+        """ fetches the block hash of the heights from the bitcoin node concurrently. """
+        if len(heights) == 1:
+            return [EthHashBytes(self.__cli.get_block_hash_by_height(heights[0]))]
+        with ThreadPoolExecutor(max_workers=BTC_HASH_CATCH_UP_MAX_WORKERS) as executor:
+            results = executor.map(self.__cli.get_block_hash_by_height, heights)
+            return [EthHashBytes(result) for result in results]
 
     def handle_call_result(self, result: tuple) -> Optional[PeriodicEventABC]:
         log_invalid_flow("BtcHash", self)
@@ -1,16 +1,18 @@
-from typing import Optional
+from typing import Optional, Dict
 
+from chainpy.eth.ethtype.amount import EthAmount
 from chainpy.eventbridge.chaineventabc import CallParamTuple, SendParamTuple
 from chainpy.eventbridge.eventbridge import EventBridge
 from chainpy.eventbridge.periodiceventabc import PeriodicEventABC
 from chainpy.eventbridge.utils import timestamp_msec
 from chainpy.logger import global_logger
-from chainpy.offchain.priceaggregator import PriceOracleAgg
 
 from rbclib.metric import PrometheusExporterRelayer
+from rbclib.pricefeed import PriceCollector, PriceFeedingPolicy
 from rbclib.primitives.chain import chain_enum
-from rbclib.primitives.consts import NoneParams
+from rbclib.primitives.consts import NoneParams, PRICE_PREFETCH_PERIOD_SEC
 from rbclib.primitives.oracle import Oracle
+from rbclib.txpipeline import pipelined
 from rbclib.utils import is_selected_relayer, log_invalid_flow
 from relayer.global_config import relayer_config_global
 
@@ -21,16 +23,34 @@ class PriceUpOracle(PeriodicEventABC):
         manager: EventBridge,
         period_sec: int = 300,
         time_lock: int = timestamp_msec(),
-        price_cli: PriceOracleAgg = None
+        price_collector: PriceCollector = None,
+        price_policy: PriceFeedingPolicy = None
     ):
         if period_sec == 0:
             period_sec = relayer_config_global.price_source_collection_period_sec
         super().__init__(manager, period_sec, time_lock)
 
-        if price_cli is not None:
-            self.__cli = price_cli
+        if price_collector is not None:
+            self.__collector = price_collector
         else:
-            self.__cli = PriceOracleAgg(relayer_config_global.price_source_url_dict)
+            # prices are prefetched on the collector's own timer, off the event bridge worker
+            self.__collector = PriceCollector(
+                manager.active_account.address,
+                relayer_config_global.price_source_url_dict,
+                relayer_config_global.price_oracle_assets,
+                min(PRICE_PREFETCH_PERIOD_SEC, period_sec)
+            )
+            self.__collector.start()
+
+        if price_policy is not None:
+            self.__policy = price_policy
+        else:
+            self.__policy = PriceFeedingPolicy(
+                relayer_config_global.price_deviation_threshold_percent,
+                relayer_config_global.price_heartbeat_sec
+            )
+        # prices in the feeding transaction, recorded as fed on its success
+        self.feeding_prices: Dict[str, EthAmount] = dict()
 
         PrometheusExporterRelayer.exporting_running_time_metric()
 
@@ -39,7 +59,9 @@ class PriceUpOracle(PeriodicEventABC):
         return self.manager
 
     def clone_next(self):
-        return self.__class__(self.relayer, self.period_sec, self.time_lock + self.period_sec * 1000, self.__cli)
+        return self.__class__(
+            self.relayer, self.period_sec, self.time_lock + self.period_sec * 1000, self.__collector, self.__policy
+        )
 
     def summary(self) -> str:
         return "{}".format(self.__class__.__name__)
@@ -48,6 +70,7 @@ class PriceUpOracle(PeriodicEventABC):
         log_invalid_flow("PriceUp", self)
         return NoneParams
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
         # check whether this is current authority
         auth = is_selected_relayer(
@@ -57,19 +80,31 @@ class PriceUpOracle(PeriodicEventABC):
             return NoneParams
 
         # dictionary of prices (key: coin id)
-        symbols: list[str] = relayer_config_global.price_oracle_assets
-        collected_prices = self.__cli.get_current_weighted_price(symbols)
+        collected_prices = self.__collector.snapshot()
+        if collected_prices is None:
+            global_logger.formatted_log(
+                "PriceUp",
+                address=self.relayer.active_account.address,
+                related_chain_name=chain_enum.BIFROST.name,
+                msg="{}:NoPriceSnapshot".format(self.__class__.__name__)
+            )
+            return NoneParams
+
+        # only the assets which moved enough (or are due for the heartbeat) are fed
+        symbols = self.__policy.select(collected_prices)
+        if not symbols:
+            return NoneParams
+        self.feeding_prices = {symbol: collected_prices[symbol] for symbol in symbols}
 
         # build oid list and prices list
         oid_list = [Oracle[symbol].value for symbol in symbols]
-        prices = [value for value in collected_prices.values()]
-        PrometheusExporterRelayer.exporting_asset_prices(symbols, prices)
+        prices = [collected_prices[symbol] for symbol in symbols]
 
         global_logger.formatted_log(
             "PriceUp",
             address=self.relayer.active_account.address,
             related_chain_name=chain_enum.BIFROST.name,
-            msg="{}:price-feeding".format(self.__class__.__name__)
+            msg="{}:price-feeding:{}".format(self.__class__.__name__, symbols)
         )
         return (
             chain_enum.BIFROST.name,
@@ -83,6 +118,9 @@ class PriceUpOracle(PeriodicEventABC):
         return None
 
     def handle_tx_result_success(self) -> Optional[PeriodicEventABC]:
+        self.__policy.record_fed(self.feeding_prices)
+        symbols = list(self.feeding_prices.keys())
+        PrometheusExporterRelayer.exporting_asset_prices(symbols, [self.feeding_prices[symbol] for symbol in symbols])
         return None
 
     def handle_tx_result_fail(self) -> Optional[PeriodicEventABC]:
@@ -0,0 +1,58 @@
+from typing import Optional
+
+from chainpy.eventbridge.chaineventabc import CallParamTuple, SendParamTuple
+from chainpy.eventbridge.periodiceventabc import PeriodicEventABC
+from chainpy.eventbridge.utils import timestamp_msec
+
+from rbclib.primitives.consts import NoneParams, TX_RESULT_FEED_PERIOD_SEC
+from rbclib.utils import log_invalid_flow
+from relayer.relayer import Relayer
+
+
+class TxResultFeed(PeriodicEventABC):
+    """
+    Periodically hands the results of the transactions sent through the tx pipelines back to the event bridge worker:
+    the "handle_tx_result_*" handlers of the events run here, on the worker, never on the threads of the pipelines.
+    """
+
+    def __init__(
+        self,
+        relayer: "Relayer",
+        period_sec: int = TX_RESULT_FEED_PERIOD_SEC,
+        time_lock: int = timestamp_msec()
+    ):
+        if period_sec == 0:
+            period_sec = TX_RESULT_FEED_PERIOD_SEC
+        super().__init__(relayer, period_sec, time_lock)
+
+    @property
+    def relayer(self) -> "Relayer":
+        return self.manager
+
+    def clone_next(self):
+        return self.__class__(self.relayer, self.period_sec, self.time_lock + self.period_sec * 1000)
+
+    def summary(self) -> str:
+        return "{}".format(self.__class__.__name__)
+
+    def build_call_transaction_params(self) -> CallParamTuple:
+        log_invalid_flow("TxResult", self)
+        return NoneParams
+
+    def build_transaction_params(self) -> SendParamTuple:
+        for pipeline in self.relayer.tx_pipeline_list():
+            pipeline.dispatch_results()
+        return NoneParams
+
+    def handle_call_result(self, result: tuple) -> Optional[PeriodicEventABC]:
+        log_invalid_flow("TxResult", self)
+        return None
+
+    def handle_tx_result_success(self) -> Optional[PeriodicEventABC]:
+        return None
+
+    def handle_tx_result_fail(self) -> Optional[PeriodicEventABC]:
+        return None
+
+    def handle_tx_result_no_receipt(self) -> Optional[PeriodicEventABC]:
+        return None
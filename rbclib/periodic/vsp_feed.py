@@ -7,12 +7,15 @@ from chainpy.eventbridge.periodiceventabc import PeriodicEventABC
 from chainpy.eventbridge.utils import timestamp_msec
 from chainpy.logger import global_logger
 
+from rbclib.authority import authority_cache_global
 from rbclib.metric import PrometheusExporterRelayer
 from rbclib.primitives.chain import chain_enum
 from rbclib.primitives.consts import SOCKET_CONTRACT_NAME, ROUND_UP_FUNCTION_NAME, NoneParams
+from rbclib.sigsort import signature_sorter_global
 from rbclib.submits import SocketSignature
-from rbclib.utils import fetch_bottom_round, fetch_latest_round, fetch_relayer_index, is_selected_relayer, fetch_sorted_relayer_list_lower, \
-    log_invalid_flow
+from rbclib.txpipeline import pipelined
+from rbclib.utils import fetch_bottom_round, fetch_latest_rounds, fetch_relayer_index, is_selected_relayer, \
+    fetch_sorted_relayer_list_lower, log_invalid_flow
 from relayer.global_config import relayer_config_global
 
 
@@ -61,14 +64,22 @@ class VSPFeed(PeriodicEventABC):
         log_invalid_flow("VSPFeed", self)
         return NoneParams
 
+    @pipelined
     def build_transaction_params(self) -> SendParamTuple:
-        round_from_bn = fetch_latest_round(self.relayer, chain_enum.BIFROST)
+        # fetch rounds of bifrost and every supported chain concurrently; a slow chain is skipped in this tick
+        chains = [chain_enum[chain_name] for chain_name in self.relayer.supported_chain_list]
+        rounds = fetch_latest_rounds(self.relayer, list(set([chain_enum.BIFROST] + chains)))
+        if chain_enum.BIFROST not in rounds:
+            return NoneParams
+        round_from_bn = rounds[chain_enum.BIFROST]
 
         # for prometheus exporter
-        for chain_name in self.relayer.supported_chain_list:
-            chain = chain_enum[chain_name]
-            rnd = fetch_latest_round(self.relayer, chain)
-            PrometheusExporterRelayer.exporting_external_chain_rnd(chain_name, rnd)
+        for chain in chains:
+            rnd = rounds.get(chain)
+            if rnd is None:
+                continue
+            authority_cache_global.advance_round(chain, rnd)
+            PrometheusExporterRelayer.exporting_external_chain_rnd(chain.name, rnd)
 
         global_logger.formatted_log(
             "CheckRound",
@@ -82,6 +93,7 @@ class VSPFeed(PeriodicEventABC):
 
         # update round cache
         self.current_round = round_from_bn
+        authority_cache_global.advance_round(chain_enum.BIFROST, round_from_bn)
 
         # update relayer index cache
         relayer_index = fetch_relayer_index(self.relayer, chain_enum.BIFROST, rnd=round_from_bn)
@@ -119,7 +131,7 @@ class VSPFeed(PeriodicEventABC):
         # build VSP feed data with signature
         sorted_validator_list = fetch_sorted_relayer_list_lower(self.relayer, chain_enum.BIFROST)
         data_to_sig = eth_abi.encode(["uint256", "address[]"], [round_from_bn, sorted_validator_list])
-        sig = self.relayer.active_account.ecdsa_recoverable_sign(data_to_sig)
+        sig = signature_sorter_global.sign(self.relayer.active_account, data_to_sig)
         socket_sig = SocketSignature.from_single_sig(sig.r, sig.s, sig.v + 27)
 
         submit_data = [(round_from_bn, sorted_validator_list, socket_sig.tuple())]
@@ -0,0 +1,153 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import Dict, List, Optional, Tuple, Union
+
+from chainpy.eth.ethtype.amount import EthAmount
+from chainpy.eth.ethtype.hexbytes import EthAddress
+from chainpy.eventbridge.utils import timestamp_msec
+from chainpy.logger import global_logger
+from chainpy.offchain.priceaggregator import PriceOracleAgg
+
+from rbclib.primitives.chain import chain_enum
+from rbclib.primitives.consts import PRICE_PREFETCH_PERIOD_SEC, PRICE_SOURCE_TIMEOUT_SEC, PRICE_SOURCE_MAX_STALE_SEC, \
+    PRICE_HEARTBEAT_SEC
+
+
+class PriceCollector:
+    """
+    Collects the prices of the symbols from the price sources, on its own timer thread.
+     - the prices are the volume-weighted prices of the sources, aggregated by chainpy's "PriceOracleAgg".
+     - a collection which fails keeps the last prices (stale fallback); a collection which misses its deadline is
+       logged, and its prices are stored once it completes.
+     - prices older than "max_stale_sec" are not used.
+    The price feeding reads the latest snapshot, and never waits for the price sources.
+    """
+
+    def __init__(
+        self,
+        address: EthAddress,
+        source_url_dict: Dict[str, str],
+        symbols: List[str],
+        period_sec: int = PRICE_PREFETCH_PERIOD_SEC,
+        source_timeout_sec: float = PRICE_SOURCE_TIMEOUT_SEC,
+        max_stale_sec: int = PRICE_SOURCE_MAX_STALE_SEC
+    ):
+        self.address = address
+        self.symbols = symbols
+        self.period_sec = period_sec
+        self.source_timeout_sec = source_timeout_sec
+        self.max_stale_sec = max_stale_sec
+
+        self.__cli = PriceOracleAgg(source_url_dict)
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="price-source")
+        self.__pending: Optional[Future] = None
+
+        self.__lock = threading.Lock()
+        # (collected time in msec, symbol -> price)
+        self.__prices: Optional[Tuple[int, Dict[str, EthAmount]]] = None
+        self.__timer: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.__timer is not None:
+            return
+        self.__timer = threading.Thread(target=self._run, name="price-collector", daemon=True)
+        self.__timer.start()
+
+    def _run(self):
+        while True:
+            started_at = time.monotonic()
+            try:
+                self.collect()
+            except Exception as e:
+                self._log("CollectError:{}".format(str(e)))
+            time.sleep(max(self.period_sec - (time.monotonic() - started_at), 0))
+
+    def _log(self, msg: str):
+        global_logger.formatted_log(
+            "PriceCollector", address=self.address, related_chain_name=chain_enum.BIFROST.name, msg=msg
+        )
+
+    def collect(self):
+        if self.__pending is not None and not self.__pending.done():
+            # the sources have not answered the previous collection yet
+            return
+        future = self.__pending = self.__executor.submit(self.__cli.get_current_weighted_price, self.symbols)
+        # a late result is still stored; the deadline only reports the slow collection
+        future.add_done_callback(self._store)
+
+        if not wait([future], timeout=self.source_timeout_sec).done:
+            self._log("Timeout")
+
+    def _store(self, future: Future):
+        try:
+            prices = future.result()
+        except Exception as e:
+            self._log("CollectError:{}".format(str(e)))
+            return
+        with self.__lock:
+            self.__prices = (timestamp_msec(), dict(prices))
+
+    def snapshot(self) -> Optional[Dict[str, EthAmount]]:
+        """ returns the price of every symbol, or None if a symbol has no price within "max_stale_sec". """
+        with self.__lock:
+            collected = self.__prices
+        if collected is None or collected[0] < timestamp_msec() - self.max_stale_sec * 1000:
+            return None
+
+        prices = collected[1]
+        if any(prices.get(symbol) is None for symbol in self.symbols):
+            return None
+        return {symbol: prices[symbol] for symbol in self.symbols}
+
+
+class PriceFeedingPolicy:
+    """
+    Selects the assets to feed: an asset is fed when its price moved by the deviation threshold (percent) from the
+    last fed price, or when it has not been fed for "heartbeat_sec" (PRICE_HEARTBEAT_SEC if not set). Without a
+    threshold, every asset is fed.
+    """
+
+    def __init__(
+        self,
+        deviation_threshold_percent: Union[float, Dict[str, float]] = None,
+        heartbeat_sec: int = PRICE_HEARTBEAT_SEC
+    ):
+        self.deviation_threshold_percent = deviation_threshold_percent
+        # an unchanged price is never left unfed
+        self.heartbeat_sec = heartbeat_sec or PRICE_HEARTBEAT_SEC
+
+        self.__lock = threading.Lock()
+        # symbol -> (fed time in msec, fed price)
+        self.__last_fed: Dict[str, Tuple[int, EthAmount]] = dict()
+
+    def threshold_of(self, symbol: str) -> Optional[float]:
+        if isinstance(self.deviation_threshold_percent, dict):
+            return self.deviation_threshold_percent.get(symbol, self.deviation_threshold_percent.get("default"))
+        return self.deviation_threshold_percent
+
+    def select(self, prices: Dict[str, EthAmount]) -> List[str]:
+        """ returns the symbols to feed among the prices. """
+        now = timestamp_msec()
+        with self.__lock:
+            last_fed = dict(self.__last_fed)
+
+        selected = list()
+        for symbol, price in prices.items():
+            threshold = self.threshold_of(symbol)
+            if threshold is None or symbol not in last_fed:
+                selected.append(symbol)
+                continue
+
+            fed_at, fed_price = last_fed[symbol]
+            if now - fed_at >= self.heartbeat_sec * 1000:
+                selected.append(symbol)
+            elif fed_price.int() == 0 or abs(price.int() - fed_price.int()) * 100 >= threshold * fed_price.int():
+                selected.append(symbol)
+        return selected
+
+    def record_fed(self, prices: Dict[str, EthAmount]):
+        now = timestamp_msec()
+        with self.__lock:
+            for symbol, price in prices.items():
+                self.__last_fed[symbol] = (now, price)
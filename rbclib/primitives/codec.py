@@ -0,0 +1,36 @@
+"""
+Import-time lookup tables for the primitives decoded from every socket event.
+The enum methods ("from_bytes", "formatted_hex", ...) compute the same values, but on every call.
+"""
+from typing import Dict
+
+from rbclib.primitives.chain import ChainPrimitive, MainnetPrimitives, TestnetPrimitives, ChainEnum, chain_enum
+from rbclib.primitives.method import RBCMethodV1
+
+CHAIN_BY_BYTES: Dict[type, Dict[bytes, ChainPrimitive]] = {
+    enum_cls: {member.formatted_bytes(): member for member in enum_cls}
+    for enum_cls in [MainnetPrimitives, TestnetPrimitives]
+}
+CHAIN_BYTES: Dict[ChainPrimitive, bytes] = {
+    member: member.formatted_bytes() for enum_cls in [MainnetPrimitives, TestnetPrimitives] for member in enum_cls
+}
+
+RBC_METHOD_BY_BYTES: Dict[bytes, RBCMethodV1] = {
+    bytes.fromhex(method.formatted_hex().replace("0x", "")): method for method in RBCMethodV1
+}
+
+
+def chain_from_bytes(value: bytes, enum_cls: type = chain_enum) -> ChainEnum:
+    member = CHAIN_BY_BYTES[enum_cls].get(bytes(value))
+    # fall back to the enum for the error message of an unknown chain
+    return member if member is not None else enum_cls.from_bytes(value)
+
+
+def chain_bytes(chain: ChainEnum) -> bytes:
+    return CHAIN_BYTES[chain]
+
+
+def rbc_method_from_bytes(value: bytes) -> RBCMethodV1:
+    method = RBC_METHOD_BY_BYTES.get(bytes(value))
+    # a method with non-zero padding is still decoded by its length prefix
+    return method if method is not None else RBCMethodV1.from_bytes(value)
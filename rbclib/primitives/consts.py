@@ -1,15 +1,90 @@
 BIFROST_VALIDATOR_HISTORY_LIMIT_BLOCKS = 6
 BOOTSTRAP_OFFSET_ROUNDS = 5
 
+CHECKPOINT_FILE_NAME = "checkpoint.relayer.db"
+CHECKPOINT_PERIOD_SEC = 30
+JOURNAL_FLUSH_ENTRIES = 64
+
+# block timestamps of the chain managers are in milliseconds
+BLOCK_TIMESTAMP_UNITS_PER_SEC = 1000
+
+MULTICHAIN_FAN_OUT_MAX_WORKERS = 8
+MULTICHAIN_READ_TIMEOUT_SEC = 10
+
+SIG_RECOVERY_CACHE_MAX_SIZE = 8192
+SIG_RECOVERY_PROCESS_POOL_MIN_SIGS = 16
+SIG_RECOVERY_PROCESS_POOL_MAX_WORKERS = 4
+
+# "sig_aggregation" of the chain config: submit every collected signature (all) or a quorum of them (quorum)
+SIG_AGGREGATION_ALL = "all"
+SIG_AGGREGATION_QUORUM = "quorum"
+
 RBC_EVENT_STATUS_START_DATA_START_INDEX = 128
 RBC_EVENT_STATUS_START_DATA_END_INDEX = 160
 
+# request id (bytes4 chain, uint64 round, uint128 sequence) of the socket message;
+# the low 16 bytes of the round/sequence words, as in the concatenated request id
+RBC_EVENT_SRC_CHAIN_DATA_START_INDEX = 32
+RBC_EVENT_SRC_CHAIN_DATA_END_INDEX = 36
+RBC_EVENT_ROUND_DATA_START_INDEX = 80
+RBC_EVENT_ROUND_DATA_END_INDEX = 96
+RBC_EVENT_SEQ_DATA_START_INDEX = 112
+RBC_EVENT_SEQ_DATA_END_INDEX = 128
+# instruction (bytes4 chain, bytes16 method) of the socket message
+RBC_EVENT_DST_CHAIN_DATA_START_INDEX = 160
+RBC_EVENT_DST_CHAIN_DATA_END_INDEX = 164
+RBC_EVENT_METHOD_DATA_START_INDEX = 192
+RBC_EVENT_METHOD_DATA_END_INDEX = 208
+SOCKET_LOG_DECODE_CHUNK_SIZE = 1024
+
 SOCKET_CONTRACT_NAME = "socket"
 SUBMIT_FUNCTION_NAME = "poll"
 GET_REQ_INFO_FUNCTION_NAME = "get_request"
 ROUND_UP_VOTING_FUNCTION_NAME = "round_control_relay"
 
 ROUND_UP_FUNCTION_NAME = "round_control_poll"
+CONSENSUS_ORACLE_FEEDING_FUNCTION_NAME = "oracle_consensus_feeding"
+
+HEARTBEAT_SESSION_START_JITTER_SEC = 30
+
+TX_PIPELINE_MAX_IN_FLIGHT = 4
+TX_FEE_HISTORY_BLOCKS = 10
+TX_FEE_HISTORY_REWARD_PERCENTILE = 50
+TX_FEE_ESCALATION_INTERVAL_POLLS = 3
+TX_FEE_ESCALATION_PERCENT = 20
+TX_FEE_MIN_REPLACEMENT_PERCENT = 10  # nodes reject a replacement whose fees rose by less
+TX_SEND_NONCE_RETRY = 2
+TX_RESULT_FEED_PERIOD_SEC = 1
+
+GAS_MODEL_MAX_SAMPLES = 128
+GAS_MODEL_MIN_SAMPLES = 8
+GAS_MODEL_PERCENTILE = 95
+GAS_MODEL_MARGIN_PERCENT = 20
+
+LOG_SUBSCRIPTION_TIMEOUT_BLOCKS = 10
+LOG_SUBSCRIPTION_RETRY_SEC = 60
+
+LOG_FETCH_MAX_WINDOW = 100000
+LOG_FETCH_GROWTH_FACTOR = 2
+LOG_FETCH_MAX_WORKERS_PER_PROVIDER = 4
+LOG_FETCH_WINDOWS_PER_CHUNK = 4
+LOG_FETCH_RATE_LIMIT_RETRY = 3
+LOG_FETCH_RATE_LIMIT_BACKOFF_SEC = 1
+
+RPC_POOL_EWMA_ALPHA = 0.2
+RPC_POOL_HEDGE_LATENCY_FACTOR = 3
+RPC_POOL_HEDGE_MIN_SEC = 0.5
+RPC_POOL_EJECT_AFTER_ERRORS = 3
+RPC_POOL_EJECT_SEC = 60
+RPC_POOL_MAX_WORKERS = 16
+
+PRICE_PREFETCH_PERIOD_SEC = 30
+PRICE_SOURCE_TIMEOUT_SEC = 5
+PRICE_SOURCE_MAX_STALE_SEC = 600
+PRICE_HEARTBEAT_SEC = 3600
+
+BTC_HASH_CATCH_UP_MAX_BATCH_SIZE = 16
+BTC_HASH_CATCH_UP_MAX_WORKERS = 4
 
 HEARTBEAT_COUNTER_QUERY_NAME = "relayer_heartbeat_sum"
 RUNNING_SESSIONS_QUERY_NAME = "relayer_running_sessions"
@@ -21,4 +96,10 @@ ASSET_PRICES_QUERY_NAME = "relayer_prices_of_symbol"
 CHAIN_ROUNDS_QUERY_NAME = "relayer_chain_rounds_of_chain"
 REQUEST_COUNTERS_QUERY_NAME = "relayer_status_counter"
 
+AUTHORITY_CACHE_QUERY_NAME = "relayer_authority_cache_counter"
+FAN_OUT_FAILURE_QUERY_NAME = "relayer_fan_out_failure_counter"
+
+PENDING_TXS_QUERY_NAME = "relayer_pending_txs_of_chain"
+TIME_TO_RECEIPT_QUERY_NAME = "relayer_time_to_receipt_sec_of_chain"
+
 NoneParams = ("", "", "", [])
@@ -0,0 +1,92 @@
+import contextlib
+from typing import List, Tuple, Any, Union, Dict, ContextManager
+
+import requests
+
+DEFAULT_RPC_TIMEOUT_SEC = 10
+
+# a request is hedged to a second endpoint of a pool only if it is safe to be sent twice
+UNHEDGED_METHODS = {"eth_sendRawTransaction"}
+
+# endpoint pools by the url of their primary endpoint (see "rbclib.rpcpool")
+_endpoint_pools: Dict[str, Any] = dict()
+
+
+def register_endpoint_pool(url: str, pool):
+    """ routes the requests to the url through the endpoint pool """
+    _endpoint_pools[url] = pool
+
+
+def sticky_endpoint(url: str) -> ContextManager:
+    """ sends the requests to the url in the context to a single endpoint of its pool (see "RpcEndpointPool.sticky") """
+    pool = _endpoint_pools.get(url)
+    return pool.sticky() if pool is not None else contextlib.nullcontext()
+
+
+class JsonRpcError(Exception):
+    def __init__(self, method: str, error: Union[dict, str]):
+        self.method = method
+        self.error = error
+        super().__init__("{}: {}".format(method, error))
+
+
+def send_batch_request(
+    url: str, calls: List[Tuple[str, list]], timeout: float = DEFAULT_RPC_TIMEOUT_SEC
+) -> List[Union[Any, JsonRpcError]]:
+    """
+    Sends the (method, params) list as a single JSON-RPC batch request.
+    The results are returned in the order of calls; a failed call is returned as JsonRpcError, not raised.
+    """
+    if not calls:
+        return []
+
+    pool = _endpoint_pools.get(url)
+    if pool is not None:
+        hedge = all(method not in UNHEDGED_METHODS for method, _ in calls)
+        return pool.request(lambda endpoint_url: _send_batch_request(endpoint_url, calls, timeout), hedge)
+    return _send_batch_request(url, calls, timeout)
+
+
+def _send_batch_request(url: str, calls: List[Tuple[str, list]], timeout: float) -> List[Union[Any, JsonRpcError]]:
+    body = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    response = requests.post(url, json=body, headers={"Content-Type": "application/json"}, timeout=timeout)
+    response.raise_for_status()
+    responses = response.json()
+    if not isinstance(responses, list):
+        # some providers answer a batch with a single error object
+        raise JsonRpcError("batch", responses.get("error", responses) if isinstance(responses, dict) else responses)
+
+    # providers may reorder the responses of a batch
+    response_by_id = {resp.get("id"): resp for resp in responses}
+
+    results = list()
+    for i, (method, _) in enumerate(calls):
+        resp = response_by_id.get(i)
+        if resp is None:
+            results.append(JsonRpcError(method, "no response in batch"))
+        elif "error" in resp:
+            results.append(JsonRpcError(method, resp["error"]))
+        else:
+            results.append(resp.get("result"))
+    return results
+
+
+def send_request(url: str, method: str, params: list, timeout: float = DEFAULT_RPC_TIMEOUT_SEC) -> Any:
+    pool = _endpoint_pools.get(url)
+    if pool is not None:
+        hedge = method not in UNHEDGED_METHODS
+        return pool.request(lambda endpoint_url: _send_request(endpoint_url, method, params, timeout), hedge)
+    return _send_request(url, method, params, timeout)
+
+
+def _send_request(url: str, method: str, params: list, timeout: float) -> Any:
+    body = {"jsonrpc": "2.0", "id": 0, "method": method, "params": params}
+    response = requests.post(url, json=body, headers={"Content-Type": "application/json"}, timeout=timeout)
+    response.raise_for_status()
+    resp = response.json()
+    if "error" in resp:
+        raise JsonRpcError(method, resp["error"])
+    return resp.get("result")
@@ -0,0 +1,187 @@
+import contextlib
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
+
+from rbclib.primitives.consts import RPC_POOL_EWMA_ALPHA, RPC_POOL_HEDGE_LATENCY_FACTOR, RPC_POOL_HEDGE_MIN_SEC, \
+    RPC_POOL_EJECT_AFTER_ERRORS, RPC_POOL_EJECT_SEC, RPC_POOL_MAX_WORKERS
+from rbclib.rpc import JsonRpcError
+
+T = TypeVar("T")
+
+# shared by every pool, for the hedges only
+_executor = ThreadPoolExecutor(max_workers=RPC_POOL_MAX_WORKERS, thread_name_prefix="rpc-pool")
+
+# the endpoint pinned by "RpcEndpointPool.sticky" in the current context, by pool
+_sticky_endpoints: contextvars.ContextVar[Dict[int, "RpcEndpoint"]] = contextvars.ContextVar(
+    "sticky_endpoints", default=dict()
+)
+
+
+class RpcEndpoint:
+    __slots__ = ("url", "latency_sec", "consecutive_errors", "ejected_until")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency_sec: Optional[float] = None  # EWMA of the response times
+        self.consecutive_errors = 0
+        self.ejected_until = 0.0
+
+    def score(self) -> float:
+        """ lower is better; an endpoint without a response yet is tried first """
+        return 0.0 if self.latency_sec is None else self.latency_sec
+
+
+class RpcEndpointPool:
+    """
+    The RPC endpoints of a chain ("url_with_access_key" followed by "extra_urls_with_access_key").
+     - a request goes to the admitted endpoint with the lowest EWMA latency, and fails over to the next one on a
+       transport error (a JSON-RPC error is the answer of a healthy node, and is raised as it is).
+     - a hedged (read) request is sent to the second endpoint as well when the first has not answered within
+       "hedge_latency_factor" times its EWMA latency. the first endpoint is called on the caller's thread and its
+       answer is taken; if it fails, the answer of the hedge (already on its way) is taken instead.
+     - an endpoint is ejected for "eject_sec" after "eject_after_errors" consecutive errors, then readmitted.
+     - in the context of "sticky", every request goes to the same endpoint, without hedge or failover, so that a
+       sequence of reads (e.g. a height, then the logs up to it) sees the chain of a single node.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        ewma_alpha: float = RPC_POOL_EWMA_ALPHA,
+        hedge_latency_factor: float = RPC_POOL_HEDGE_LATENCY_FACTOR,
+        hedge_min_sec: float = RPC_POOL_HEDGE_MIN_SEC,
+        eject_after_errors: int = RPC_POOL_EJECT_AFTER_ERRORS,
+        eject_sec: float = RPC_POOL_EJECT_SEC
+    ):
+        self.endpoints = [RpcEndpoint(url) for url in urls]
+        self.ewma_alpha = ewma_alpha
+        self.hedge_latency_factor = hedge_latency_factor
+        self.hedge_min_sec = hedge_min_sec
+        self.eject_after_errors = eject_after_errors
+        self.eject_sec = eject_sec
+        self.__lock = threading.Lock()
+
+    def ranked(self) -> List[RpcEndpoint]:
+        """ the admitted endpoints by score; if every endpoint is ejected, the one to be readmitted first """
+        now = time.monotonic()
+        with self.__lock:
+            admitted = [endpoint for endpoint in self.endpoints if endpoint.ejected_until <= now]
+            if not admitted:
+                return [min(self.endpoints, key=lambda endpoint: endpoint.ejected_until)]
+            return sorted(admitted, key=lambda endpoint: endpoint.score())
+
+    def _record(self, endpoint: RpcEndpoint, elapsed_sec: float, error: Optional[Exception]):
+        with self.__lock:
+            if error is not None and not isinstance(error, JsonRpcError):
+                endpoint.consecutive_errors += 1
+                if endpoint.consecutive_errors >= self.eject_after_errors:
+                    endpoint.ejected_until = time.monotonic() + self.eject_sec
+                    endpoint.consecutive_errors = 0
+                return
+
+            endpoint.consecutive_errors = 0
+            if endpoint.latency_sec is None:
+                endpoint.latency_sec = elapsed_sec
+            else:
+                endpoint.latency_sec += self.ewma_alpha * (elapsed_sec - endpoint.latency_sec)
+
+    def _call(self, endpoint: RpcEndpoint, fn: Callable[[str], T]) -> T:
+        started_at = time.monotonic()
+        try:
+            result = fn(endpoint.url)
+        except Exception as e:
+            self._record(endpoint, time.monotonic() - started_at, e)
+            raise
+        self._record(endpoint, time.monotonic() - started_at, None)
+        return result
+
+    def hedge_after_sec(self, endpoint: RpcEndpoint) -> float:
+        if endpoint.latency_sec is None:
+            return self.hedge_min_sec
+        return max(endpoint.latency_sec * self.hedge_latency_factor, self.hedge_min_sec)
+
+    @contextlib.contextmanager
+    def sticky(self) -> Iterator[RpcEndpoint]:
+        """ pins the requests of the context to the best endpoint; a nested context keeps the outer endpoint. """
+        pinned = _sticky_endpoints.get()
+        if id(self) in pinned:
+            yield pinned[id(self)]
+            return
+
+        endpoint = self.ranked()[0]
+        token = _sticky_endpoints.set({**pinned, id(self): endpoint})
+        try:
+            yield endpoint
+        finally:
+            _sticky_endpoints.reset(token)
+
+    def request(self, fn: Callable[[str], T], hedge: bool) -> T:
+        """ calls "fn" with the url of an endpoint """
+        sticky_endpoint = _sticky_endpoints.get().get(id(self))
+        if sticky_endpoint is not None:
+            return self._call(sticky_endpoint, fn)
+
+        endpoints = self.ranked()
+        if hedge and len(endpoints) > 1:
+            return self._hedged_request(endpoints, fn)
+
+        error: Optional[Exception] = None
+        for endpoint in endpoints:
+            try:
+                return self._call(endpoint, fn)
+            except JsonRpcError:
+                raise
+            except Exception as e:
+                error = e
+        raise error
+
+    def _hedged_request(self, endpoints: List[RpcEndpoint], fn: Callable[[str], T]) -> T:
+        # the primary call runs on the caller's thread; the hedge waits on a worker until the primary is slow or fails
+        primary_settled, primary_failed = threading.Event(), [False]
+        hedge = _executor.submit(
+            self._delayed_call, endpoints[1], fn, primary_settled, primary_failed, self.hedge_after_sec(endpoints[0])
+        )
+        try:
+            result = self._call(endpoints[0], fn)
+        except JsonRpcError:
+            primary_settled.set()
+            raise
+        except Exception as e:
+            error = e
+            primary_failed[0] = True
+            primary_settled.set()
+        else:
+            primary_settled.set()
+            return result
+
+        # the primary failed: the answer of the hedge (sent already if the primary was slow) is taken
+        e = hedge.exception()
+        if e is None or isinstance(e, JsonRpcError):
+            return hedge.result()
+        error = e
+
+        # both failed; the rest of the endpoints are tried in order
+        for endpoint in endpoints[2:]:
+            try:
+                return self._call(endpoint, fn)
+            except JsonRpcError:
+                raise
+            except Exception as e:
+                error = e
+        raise error
+
+    def _delayed_call(
+        self,
+        endpoint: RpcEndpoint,
+        fn: Callable[[str], T],
+        primary_settled: threading.Event,
+        primary_failed: List[bool],
+        delay_sec: float
+    ) -> Optional[T]:
+        if primary_settled.wait(delay_sec) and not primary_failed[0]:
+            # the primary answered in time
+            return None
+        return self._call(endpoint, fn)
@@ -0,0 +1,107 @@
+import hashlib
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple
+
+from chainpy.eth.ethtype.account import EthAccount
+from chainpy.eth.ethtype.utils import to_eth_v
+
+from rbclib.primitives.consts import SIG_RECOVERY_CACHE_MAX_SIZE, SIG_RECOVERY_PROCESS_POOL_MIN_SIGS, \
+    SIG_RECOVERY_PROCESS_POOL_MAX_WORKERS
+
+SigTuple = Tuple[int, int, int]  # r, s, v
+
+
+def _recover_address_hex(msg: bytes, sig: SigTuple) -> str:
+    r, s, v = sig
+    return EthAccount.ecdsa_recover_address(r, s, v, msg).hex().lower()
+
+
+class SignatureSorter:
+    """
+    Recovers the signer of socket signatures and sorts the signatures by signer (the order the contracts expect).
+     - recovered signers are cached by (msg hash, r, s, v); a retried or re-aggregated submission recovers nothing.
+     - the signer of a signature made by this relayer is remembered on signing, without recovery.
+     - a large set of cache misses is recovered in a process pool, off the GIL of the event loop.
+    """
+
+    def __init__(
+        self,
+        cache_max_size: int = SIG_RECOVERY_CACHE_MAX_SIZE,
+        pool_min_sigs: int = SIG_RECOVERY_PROCESS_POOL_MIN_SIGS,
+        pool_max_workers: int = SIG_RECOVERY_PROCESS_POOL_MAX_WORKERS
+    ):
+        self.cache_max_size = cache_max_size
+        self.pool_min_sigs = pool_min_sigs
+        self.pool_max_workers = pool_max_workers
+        self.__lock = threading.Lock()
+        self.__cache: OrderedDict = OrderedDict()
+        self.__pool: Optional[ProcessPoolExecutor] = None
+
+    @staticmethod
+    def _key(msg_hash: bytes, sig: SigTuple) -> tuple:
+        return (msg_hash,) + tuple(sig)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self.__lock:
+            if self.__pool is None:
+                # "spawn" does not inherit the locks held by the other threads of the relayer
+                self.__pool = ProcessPoolExecutor(
+                    max_workers=self.pool_max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self.__pool
+
+    def _put(self, key: tuple, address_hex: str):
+        with self.__lock:
+            self.__cache[key] = address_hex
+            self.__cache.move_to_end(key)
+            while len(self.__cache) > self.cache_max_size:
+                self.__cache.popitem(last=False)
+
+    def remember_signer(self, msg: bytes, sig: SigTuple, address_hex: str):
+        self._put(self._key(hashlib.sha256(msg).digest(), sig), address_hex.lower())
+
+    def sign(self, account: EthAccount, msg: bytes):
+        """ signs the msg by the account, and remembers the account as the signer of the signature. """
+        sig = account.ecdsa_recoverable_sign(msg)
+        self.remember_signer(msg, (sig.r, sig.s, to_eth_v(sig.v)), account.address.hex())
+        return sig
+
+    def recover_addresses(self, msg: bytes, sigs: List[SigTuple]) -> List[str]:
+        """ returns the (lower hex) signer of each signature, in the order of "sigs". """
+        msg_hash = hashlib.sha256(msg).digest()
+        keys = [self._key(msg_hash, sig) for sig in sigs]
+
+        with self.__lock:
+            addresses = [self.__cache.get(key) for key in keys]
+        missed = [idx for idx, address in enumerate(addresses) if address is None]
+        if not missed:
+            return addresses
+
+        missed_sigs = [sigs[idx] for idx in missed]
+        recovered = None
+        if len(missed) >= self.pool_min_sigs:
+            try:
+                recovered = list(self._pool().map(_recover_address_hex, [msg] * len(missed_sigs), missed_sigs))
+            except BrokenProcessPool:
+                # recovers in this process, and restarts the pool for the next time
+                with self.__lock:
+                    self.__pool = None
+        if recovered is None:
+            recovered = [_recover_address_hex(msg, sig) for sig in missed_sigs]
+
+        for idx, address_hex in zip(missed, recovered):
+            addresses[idx] = address_hex
+            self._put(keys[idx], address_hex)
+        return addresses
+
+    def sort(self, msg: bytes, sigs: List[SigTuple]) -> List[Tuple[str, SigTuple]]:
+        """ returns (signer, signature) sorted by signer; a signer with several signatures keeps the last one. """
+        addresses = self.recover_addresses(msg, sigs)
+        return sorted(dict(zip(addresses, sigs)).items())
+
+
+signature_sorter_global = SignatureSorter()
@@ -0,0 +1,84 @@
+from array import array
+from typing import Iterable, List
+
+from chainpy.eth.ethtype.hexbytes import EthHexBytes
+
+from rbclib.primitives.chain import ChainEnum, ChainEventStatus, chain_enum
+from rbclib.primitives.codec import chain_from_bytes, chain_bytes, rbc_method_from_bytes
+from rbclib.primitives.consts import RBC_EVENT_SRC_CHAIN_DATA_START_INDEX, RBC_EVENT_SRC_CHAIN_DATA_END_INDEX, \
+    RBC_EVENT_ROUND_DATA_START_INDEX, RBC_EVENT_ROUND_DATA_END_INDEX, RBC_EVENT_SEQ_DATA_START_INDEX, \
+    RBC_EVENT_SEQ_DATA_END_INDEX, RBC_EVENT_STATUS_START_DATA_START_INDEX, RBC_EVENT_STATUS_START_DATA_END_INDEX, \
+    RBC_EVENT_DST_CHAIN_DATA_START_INDEX, RBC_EVENT_DST_CHAIN_DATA_END_INDEX, RBC_EVENT_METHOD_DATA_START_INDEX, \
+    RBC_EVENT_METHOD_DATA_END_INDEX
+from rbclib.primitives.method import RBCMethodV1
+
+REQ_ID_SIZE = 36  # bytes4 chain + 16 bytes round + 16 bytes sequence
+METHOD_SIZE = RBC_EVENT_METHOD_DATA_END_INDEX - RBC_EVENT_METHOD_DATA_START_INDEX
+BIFROST_CHAIN_ID = int.from_bytes(chain_bytes(chain_enum.BIFROST), "big")
+
+
+def parse_status_value(data: bytes) -> int:
+    """ parses the raw value of the event-status from socket log data (fast, but not expandable) """
+    return int.from_bytes(data[RBC_EVENT_STATUS_START_DATA_START_INDEX:RBC_EVENT_STATUS_START_DATA_END_INDEX], "big")
+
+
+class SocketLogColumns:
+    """
+    Columns of the head (request id, status and instruction) of a batch of socket log data, decoded at fixed offsets.
+    It skips the generic abi decoding ("decode_event"), which is still needed for the params of the message.
+    """
+    __slots__ = ("size", "req_ids", "src_chains", "rounds", "seqs", "statuses", "dst_chains", "rbc_methods")
+
+    def __init__(self, datas: Iterable[bytes]):
+        self.req_ids = bytearray()  # REQ_ID_SIZE bytes for each log
+        self.src_chains = array("L")
+        self.rounds = array("Q")
+        self.seqs: List[int] = list()  # uint128 does not fit in an array
+        self.statuses = array("B")
+        self.dst_chains = array("L")
+        self.rbc_methods = bytearray()  # METHOD_SIZE bytes for each log
+
+        for data in datas:
+            view = memoryview(data)
+            src_chain = view[RBC_EVENT_SRC_CHAIN_DATA_START_INDEX:RBC_EVENT_SRC_CHAIN_DATA_END_INDEX]
+            rnd = view[RBC_EVENT_ROUND_DATA_START_INDEX:RBC_EVENT_ROUND_DATA_END_INDEX]
+            seq = view[RBC_EVENT_SEQ_DATA_START_INDEX:RBC_EVENT_SEQ_DATA_END_INDEX]
+
+            self.req_ids += src_chain
+            self.req_ids += rnd
+            self.req_ids += seq
+            self.src_chains.append(int.from_bytes(src_chain, "big"))
+            self.rounds.append(int.from_bytes(rnd, "big"))
+            self.seqs.append(int.from_bytes(seq, "big"))
+            self.statuses.append(parse_status_value(view))
+            self.dst_chains.append(
+                int.from_bytes(view[RBC_EVENT_DST_CHAIN_DATA_START_INDEX:RBC_EVENT_DST_CHAIN_DATA_END_INDEX], "big")
+            )
+            self.rbc_methods += view[RBC_EVENT_METHOD_DATA_START_INDEX:RBC_EVENT_METHOD_DATA_END_INDEX]
+        self.size = len(self.statuses)
+
+    def req_id_concat_bytes(self, idx: int) -> EthHexBytes:
+        return EthHexBytes(bytes(self.req_ids[idx * REQ_ID_SIZE:(idx + 1) * REQ_ID_SIZE]))
+
+    def req_id_hex(self, idx: int) -> str:
+        return "0x" + self.req_ids[idx * REQ_ID_SIZE:(idx + 1) * REQ_ID_SIZE].hex()
+
+    def src_chain(self, idx: int) -> ChainEnum:
+        return chain_from_bytes(self.src_chains[idx].to_bytes(4, "big"))
+
+    def is_inbound(self, idx: int) -> bool:
+        return self.src_chains[idx] != BIFROST_CHAIN_ID
+
+    def status(self, idx: int) -> ChainEventStatus:
+        return ChainEventStatus(self.statuses[idx])
+
+    def dst_chain(self, idx: int) -> ChainEnum:
+        return chain_from_bytes(self.dst_chains[idx].to_bytes(4, "big"))
+
+    def rbc_method(self, idx: int) -> RBCMethodV1:
+        return rbc_method_from_bytes(bytes(self.rbc_methods[idx * METHOD_SIZE:(idx + 1) * METHOD_SIZE]))
+
+    def indices_of_status(self, statuses: Iterable[ChainEventStatus]) -> List[int]:
+        """ returns the indices of the logs with one of the statuses. """
+        status_values = frozenset(status.value for status in statuses)
+        return [idx for idx, value in enumerate(self.statuses) if value in status_values]
@@ -1,11 +1,12 @@
-from typing import Union
+from typing import Union, List, Optional
 
 import eth_abi
-from chainpy.eth.ethtype.account import EthAccount
 from chainpy.eth.ethtype.hexbytes import EthHashBytes, EthHexBytes
 from chainpy.eth.ethtype.utils import recursive_tuple_to_list
 from chainpy.eventbridge.chaineventabc import ChainEventABC
 
+from rbclib.sigsort import signature_sorter_global
+
 
 class SocketSignature:
     """
@@ -67,6 +68,8 @@ class SubmitWithSig:
         self.event = event
         self.sigs = SocketSignature.init()
         self.__decoded_data_tuple_cache = None
+        self.quorum_signers: Optional[List[str]] = None
+        self.quorum: int = 0
 
     @property
     def decoded_data_tuple(self):
@@ -88,23 +91,33 @@ class SubmitWithSig:
         self.sigs.merge_sigs(socket_sigs)
         return self
 
+    def trim_to_quorum(self, signers: List[str], quorum: int):
+        """ submits only "quorum" signatures (sorted) of the signers, instead of every collected signature. """
+        self.quorum_signers = [signer.lower() for signer in signers]
+        self.quorum = quorum
+        return self
+
     def _sort_sigs(self, msg: EthHexBytes):
         if self.sigs.size == 1:
             return None
 
-        sig_dict = dict()
-
         clone_sigs = self.sigs
         self.sigs = SocketSignature.init()
+        sigs = list()
         for i in range(clone_sigs.size):
             r, s, v = clone_sigs.get_single_sig(i)
-            addr = EthAccount.ecdsa_recover_address(r.int(), s.int(), v.int(), msg)
-            sig_dict[addr.hex()] = (r, s, v)
+            sigs.append((r.int(), s.int(), v.int()))
+
+        sorted_sigs = signature_sorter_global.sort(bytes(msg), sigs)
+        if self.quorum_signers is not None:
+            signers = set(self.quorum_signers)
+            valid_sigs = [sig for sig in sorted_sigs if sig[0] in signers]
+            # without enough valid signatures, every signature is submitted as before
+            if 0 < self.quorum <= len(valid_sigs):
+                sorted_sigs = valid_sigs[:self.quorum]
 
-        sorted_sigs = sorted(sig_dict.items())
-        for sig in sorted_sigs:
-            r, s, v = sig[1]
-            self.add_single_sig(r.int(), s.int(), v.int())
+        for _, (r, s, v) in sorted_sigs:
+            self.add_single_sig(r, s, v)
 
 
 class PollSubmit(SubmitWithSig):
@@ -117,9 +130,8 @@ class PollSubmit(SubmitWithSig):
         super(PollSubmit, self).__init__(event)
 
     def submit_tuple(self, fail_option: bool = False) -> list:
-        # decode event
-        decoded_socket_msg = self.event.manager.decode_event(self.event.detected_event)
-        decoded_socket_msg_contents = recursive_tuple_to_list(decoded_socket_msg[0])
+        # decode event (once for this submission)
+        decoded_socket_msg_contents = recursive_tuple_to_list(self.decoded_data_tuple[0])
 
         # convert flag from bool to int
         forced_fail = 1 if fail_option else 0
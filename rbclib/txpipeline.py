@@ -0,0 +1,519 @@
+import functools
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from chainpy.eth.ethtype.hexbytes import EthHexBytes
+from chainpy.eth.ethtype.utils import keccak_hash
+from chainpy.eventbridge.chaineventabc import SendParamTuple
+from chainpy.logger import global_logger
+
+from rbclib.gasmodel import GasUsageKey, gas_model_global, gas_usage_key_of
+from rbclib.metric import PrometheusExporterRelayer
+from rbclib.primitives.chain import ChainEnum, chain_enum
+from rbclib.primitives.consts import NoneParams, TX_PIPELINE_MAX_IN_FLIGHT, TX_FEE_HISTORY_BLOCKS, \
+    TX_FEE_HISTORY_REWARD_PERCENTILE, TX_FEE_ESCALATION_INTERVAL_POLLS, TX_FEE_ESCALATION_PERCENT, \
+    TX_FEE_MIN_REPLACEMENT_PERCENT, TX_SEND_NONCE_RETRY
+from rbclib.rpc import send_request, send_batch_request, sticky_endpoint, JsonRpcError
+
+
+def rlp_encode(item) -> bytes:
+    """ RLP encoding of (nested lists of) bytes and non-negative integers. """
+    if isinstance(item, int):
+        item = item.to_bytes((item.bit_length() + 7) // 8, "big")
+    if isinstance(item, (bytes, bytearray)):
+        if len(item) == 1 and item[0] < 0x80:
+            return bytes(item)
+        return _rlp_length_prefix(len(item), 0x80) + bytes(item)
+    payload = b"".join(rlp_encode(element) for element in item)
+    return _rlp_length_prefix(len(payload), 0xc0) + payload
+
+
+def _rlp_length_prefix(length: int, offset: int) -> bytes:
+    if length < 56:
+        return bytes([offset + length])
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([offset + 55 + len(length_bytes)]) + length_bytes
+
+
+def _hex_to_int(value: Optional[str]) -> int:
+    return int(value, 16) if value else 0
+
+
+def is_nonce_error(error: Exception) -> bool:
+    msg = str(error).lower()
+    return "nonce" in msg or "replacement transaction underpriced" in msg or "already known" in msg
+
+
+class NonceAllocator:
+    """
+    Local nonce counter of an account on a chain, synced with the "pending" transaction count of the node.
+    A nonce released below other allocated nonces (a gap) is filled right away by "fill_gap", since the following
+    transactions are not mined until it is; a gap which cannot be filled is reused by the next allocation.
+    """
+
+    def __init__(self, fetch_pending_nonce: Callable[[], int], fill_gap: Callable[[int], None]):
+        self.__fetch_pending_nonce = fetch_pending_nonce
+        self.__fill_gap = fill_gap
+        self.__lock = threading.Lock()
+        self.__next_nonce: Optional[int] = None
+        self.__released: Set[int] = set()
+
+    def allocate(self) -> int:
+        with self.__lock:
+            if self.__next_nonce is None:
+                self.__next_nonce = self.__fetch_pending_nonce()
+            if self.__released:
+                nonce = min(self.__released)
+                self.__released.remove(nonce)
+                return nonce
+            nonce = self.__next_nonce
+            self.__next_nonce += 1
+            return nonce
+
+    def release(self, nonce: int):
+        with self.__lock:
+            if self.__next_nonce is not None and nonce == self.__next_nonce - 1:
+                self.__next_nonce = nonce
+                return
+
+        try:
+            self.__fill_gap(nonce)
+        except Exception:
+            with self.__lock:
+                self.__released.add(nonce)
+            raise
+
+    def resync(self):
+        """ re-reads the nonce from the node, after a nonce error. """
+        with self.__lock:
+            self.__next_nonce = self.__fetch_pending_nonce()
+            self.__released = {nonce for nonce in self.__released if nonce >= self.__next_nonce}
+
+
+class FeeHistoryCache:
+    """ Base fee and priority fee suggested by "eth_feeHistory" of the latest blocks, re-fetched once per "ttl_sec". """
+
+    def __init__(self, fetch_fee_history: Callable[[], dict], ttl_sec: float):
+        self.__fetch_fee_history = fetch_fee_history
+        self.ttl_sec = ttl_sec
+        self.__lock = threading.Lock()
+        self.__fee: Optional[Tuple[int, int]] = None
+        self.__fetched_at = 0.0
+
+    def suggested_fee(self) -> Tuple[int, int]:
+        """ returns (base fee of the next block, median of the priority fee percentiles of the latest blocks) """
+        with self.__lock:
+            if self.__fee is None or time.monotonic() - self.__fetched_at >= self.ttl_sec:
+                history = self.__fetch_fee_history()
+                base_fee = _hex_to_int(history["baseFeePerGas"][-1])
+                rewards = sorted(_hex_to_int(reward[0]) for reward in history.get("reward") or [] if reward)
+                priority_fee = rewards[len(rewards) // 2] if rewards else 0
+                self.__fee, self.__fetched_at = (base_fee, priority_fee), time.monotonic()
+            return self.__fee
+
+
+class InFlightTx:
+    """
+    A nonce in flight; every transaction sent with the nonce (fee-escalated, or the empty replacement) is tracked
+    until one is mined.
+    """
+    __slots__ = ("event", "tx", "tx_hashes", "sent_at", "tries", "gas_key", "replacement_hash", "nonce_used")
+
+    def __init__(self, event, tx: Dict[str, Any], tx_hash: str, gas_key: GasUsageKey):
+        self.event = event
+        self.tx = tx
+        self.gas_key = gas_key
+        self.tx_hashes = [tx_hash]
+        self.sent_at = time.monotonic()
+        self.tries = 0
+        self.replacement_hash: Optional[str] = None
+        # the nonce was seen mined by none of the tracked transactions
+        self.nonce_used = False
+
+    @property
+    def nonce(self) -> int:
+        return self.tx["nonce"]
+
+    @property
+    def tx_hash(self) -> str:
+        return self.tx_hashes[-1]
+
+
+class TxPipeline:
+    """
+    Sends the transactions of the relayer on a chain, without waiting for the receipt of the previous one.
+     - nonces are allocated locally ("NonceAllocator"); up to "max_in_flight" transactions are unmined at once.
+     - receipts are tracked on a separate thread, which polls the receipts of every pending transaction in a single
+       batch request per block. the result of a transaction is queued for "dispatch_results", which the event bridge
+       worker calls (through "TxResultFeed"): it calls "handle_tx_result_*" of the event, and puts the event returned
+       by the handler into the event queue. a transaction which cannot be sent is handled by "handle_tx_result_fail"
+       the same way; a transaction rejected for its nonce is re-sent with the nonce re-synced from the node.
+     - the threads of the pipeline only read the event ("summary", "gas_limit_multiplier", "rbc_method"); its
+       handlers and every change of its state run on the event bridge worker.
+     - a transaction without a receipt is re-sent with the same nonce and fees raised by "fee_escalation_percent"
+       every "fee_escalation_interval" polls, up to "max_gas_price"/"max_priority_price" of the fee config.
+       the first fees of an EIP-1559 transaction follow the (cached) "eth_feeHistory" of the chain.
+     - a transaction without a receipt after "receipt_max_try" polls is replaced by an empty transaction of the same
+       nonce, so the following nonces are not blocked. it stays in flight until one of the transactions of its nonce
+       is mined; the event gets "handle_tx_result_no_receipt" if the replacement (or a transaction not sent by the
+       pipeline) takes the nonce. a transaction whose fees are at the limits cannot be replaced, and is re-sent as is.
+    The account signs the keccak hash of the signing payload of the transaction (EIP-155 legacy or EIP-1559).
+    """
+
+    def __init__(self, relayer, chain: ChainEnum, max_in_flight: int = TX_PIPELINE_MAX_IN_FLIGHT):
+        self.relayer = relayer
+        self.chain = chain
+        self.max_in_flight = max_in_flight
+
+        chain_config = relayer.multichain_config[chain.name]
+        self.fee_config: dict = chain_config["fee_config"]
+        self.receipt_max_try: int = chain_config.get("receipt_max_try", 20)
+        self.block_period_sec: float = chain_config.get("block_period_sec", 3)
+
+        pipeline_config = chain_config.get("tx_pipeline") or dict()
+        self.fee_escalation_interval = pipeline_config.get("fee_escalation_interval", TX_FEE_ESCALATION_INTERVAL_POLLS)
+        self.fee_escalation_percent = pipeline_config.get("fee_escalation_percent", TX_FEE_ESCALATION_PERCENT)
+
+        self.url = relayer.abi_registry.url_of(chain)
+        self.sender = relayer.active_account.address.hex()
+        self.chain_id = _hex_to_int(self.rpc("eth_chainId", []))
+        self.nonces = NonceAllocator(
+            lambda: _hex_to_int(self.rpc("eth_getTransactionCount", [self.sender, "pending"])), self.fill_nonce_gap
+        )
+        self.fee_history = FeeHistoryCache(
+            lambda: self.rpc(
+                "eth_feeHistory", [hex(TX_FEE_HISTORY_BLOCKS), "latest", [TX_FEE_HISTORY_REWARD_PERCENTILE]]
+            ),
+            self.block_period_sec
+        )
+
+        self.__submitted: queue.Queue = queue.Queue()
+        self.__slots = threading.BoundedSemaphore(max_in_flight)
+        self.__lock = threading.Lock()
+        self.__in_flight: Dict[int, InFlightTx] = dict()
+        # (event, name of its tx result handler), for the event bridge worker
+        self.__results: queue.Queue = queue.Queue()
+
+        threading.Thread(target=self._send_loop, name="tx-send-{}".format(chain.name), daemon=True).start()
+        threading.Thread(target=self._receipt_loop, name="tx-receipt-{}".format(chain.name), daemon=True).start()
+
+    def rpc(self, method: str, params: list) -> Any:
+        return send_request(self.url, method, params)
+
+    def _log(self, msg: str):
+        global_logger.formatted_log(
+            "TxPipeline", address=self.relayer.active_account.address, related_chain_name=self.chain.name, msg=msg
+        )
+
+    def submit(self, event, params: SendParamTuple):
+        self.__submitted.put((event, params))
+
+    def pending_count(self) -> int:
+        with self.__lock:
+            return len(self.__in_flight)
+
+    def in_flight_txs(self) -> List[InFlightTx]:
+        with self.__lock:
+            return list(self.__in_flight.values())
+
+    def _send_loop(self):
+        while True:
+            event, params = self.__submitted.get()
+            self.__slots.acquire()
+            try:
+                # the pending nonce is read from the node which takes the transaction
+                with sticky_endpoint(self.url):
+                    self._send(event, params)
+            except Exception as e:
+                self.__slots.release()
+                self._log("SendError:{}:{}".format(event.summary(), str(e)))
+                self._dispatch(event, "handle_tx_result_fail")
+
+    def _send(self, event, params: SendParamTuple):
+        _, contract_name, method_name, method_params = params
+        registry = self.relayer.abi_registry
+        to = registry.address_of(self.chain, contract_name)
+        data = registry.method_of(self.chain, contract_name, method_name).encode_input(method_params)
+
+        gas_key = gas_usage_key_of(event, self.chain.name, method_name, method_params)
+        gas_limit = self.estimate_gas_limit(event, to, data, gas_key)
+        tx = {"to": to, "data": data, "value": 0, "gas": gas_limit}
+        tx.update(self.initial_fee())
+
+        for retry in range(TX_SEND_NONCE_RETRY + 1):
+            tx["nonce"] = self.nonces.allocate()
+            try:
+                tx_hash = self.send_tx(tx)
+                break
+            except Exception as e:
+                if not is_nonce_error(e):
+                    self.release_nonce(tx["nonce"])
+                    raise
+                # the nonce is used (or skipped) by the node; re-sent with the nonce of the node
+                self._log("NonceError:{}:nonce({}):{}".format(event.summary(), tx["nonce"], str(e)))
+                self.nonces.resync()
+                if retry == TX_SEND_NONCE_RETRY:
+                    raise
+
+        with self.__lock:
+            self.__in_flight[tx["nonce"]] = InFlightTx(event, tx, tx_hash, gas_key)
+        self._log("Sent:{}:nonce({}):{}".format(event.summary(), tx["nonce"], tx_hash))
+
+    def estimate_gas_limit(self, event, to: str, data: str, gas_key: GasUsageKey) -> int:
+        """
+        returns the estimated gas with the fixed multiplier of the event,
+        raised to the gas used by the same kind of transactions if they used more.
+        """
+        estimated = _hex_to_int(self.rpc("eth_estimateGas", [{"from": self.sender, "to": to, "data": data}]))
+        multiplier = event.gas_limit_multiplier() if hasattr(event, "gas_limit_multiplier") else 1.0
+        gas_limit = int(estimated * multiplier)
+        # the model only raises the limit; a kind of transactions may vary in gas (e.g. the poll closing a quorum)
+        return max(gas_limit, gas_model_global.gas_limit_of(gas_key) or 0)
+
+    def initial_fee(self) -> Dict[str, int]:
+        if self.fee_config["type"] != 2:
+            return {"gasPrice": self.fee_config["gas_price"]}
+
+        max_fee, max_priority_fee = self.fee_config["max_gas_price"], self.fee_config["max_priority_price"]
+        try:
+            base_fee, priority_fee = self.fee_history.suggested_fee()
+        except Exception as e:
+            self._log("FeeHistoryError:{}".format(str(e)))
+            return {"maxFeePerGas": max_fee, "maxPriorityFeePerGas": max_priority_fee}
+
+        # twice the base fee keeps the transaction includable through a few blocks of rising base fee
+        fee = min(base_fee * 2 + priority_fee, max_fee)
+        return {"maxFeePerGas": fee, "maxPriorityFeePerGas": min(priority_fee, max_priority_fee, fee)}
+
+    def escalated_fee(self, tx: Dict[str, Any]) -> Optional[Dict[str, int]]:
+        """
+        returns the fees of the transaction raised by at least TX_FEE_MIN_REPLACEMENT_PERCENT,
+        or None if the limits of the fee config leave no room for such a rise.
+        """
+        def raised(fee: int, limit: int) -> Optional[int]:
+            percent = max(self.fee_escalation_percent, TX_FEE_MIN_REPLACEMENT_PERCENT)
+            raised_fee = min(max(fee * (100 + percent) // 100, fee + 1), limit)
+            # a smaller rise is rejected by the node as an underpriced replacement
+            if raised_fee * 100 < fee * (100 + TX_FEE_MIN_REPLACEMENT_PERCENT) or raised_fee <= fee:
+                return None
+            return raised_fee
+
+        if "maxFeePerGas" in tx:
+            escalated = {
+                "maxFeePerGas": raised(tx["maxFeePerGas"], self.fee_config["max_gas_price"]),
+                "maxPriorityFeePerGas": raised(tx["maxPriorityFeePerGas"], self.fee_config["max_priority_price"])
+            }
+        else:
+            max_gas_price = self.fee_config.get("max_gas_price", tx["gasPrice"])
+            escalated = {"gasPrice": raised(tx["gasPrice"], max_gas_price)}
+
+        if any(fee is None for fee in escalated.values()):
+            return None
+        if "maxPriorityFeePerGas" in escalated:
+            escalated["maxPriorityFeePerGas"] = min(escalated["maxPriorityFeePerGas"], escalated["maxFeePerGas"])
+        return escalated
+
+    def sign_tx(self, tx: Dict[str, Any]) -> bytes:
+        """ returns the raw (signed) transaction """
+        account = self.relayer.active_account
+        to, data = bytes.fromhex(tx["to"].replace("0x", "")), bytes.fromhex(tx["data"].replace("0x", ""))
+        if "maxFeePerGas" in tx:
+            fields = [
+                self.chain_id, tx["nonce"], tx["maxPriorityFeePerGas"], tx["maxFeePerGas"], tx["gas"],
+                to, tx["value"], data, []
+            ]
+            sig = account.ecdsa_recoverable_sign(EthHexBytes(b"\x02" + rlp_encode(fields)))
+            return b"\x02" + rlp_encode(fields + [sig.v, sig.r, sig.s])
+
+        fields = [tx["nonce"], tx["gasPrice"], tx["gas"], to, tx["value"], data]
+        sig = account.ecdsa_recoverable_sign(EthHexBytes(rlp_encode(fields + [self.chain_id, 0, 0])))
+        return rlp_encode(fields + [sig.v + self.chain_id * 2 + 35, sig.r, sig.s])
+
+    def send_tx(self, tx: Dict[str, Any]) -> str:
+        raw_tx = self.sign_tx(tx)
+        tx_hash = "0x" + keccak_hash(raw_tx).bytes().hex()
+        try:
+            self.rpc("eth_sendRawTransaction", ["0x" + raw_tx.hex()])
+        except JsonRpcError as e:
+            # a re-sent transaction is already in the pool of the node
+            if "already known" not in str(e).lower():
+                raise
+        return tx_hash
+
+    def _receipt_loop(self):
+        while True:
+            time.sleep(self.block_period_sec)
+            try:
+                self.poll_receipts()
+            except Exception as e:
+                self._log("ReceiptError:{}".format(str(e)))
+            PrometheusExporterRelayer.exporting_pending_txs(self.chain, self.pending_count())
+
+    def poll_receipts(self):
+        in_flight_txs = self.in_flight_txs()
+        calls = [
+            ("eth_getTransactionReceipt", [tx_hash]) for in_flight in in_flight_txs for tx_hash in in_flight.tx_hashes
+        ]
+        results = iter(send_batch_request(self.url, calls))
+        for in_flight in in_flight_txs:
+            receipt, errors = None, list()
+            for _ in in_flight.tx_hashes:
+                result = next(results)
+                if isinstance(result, JsonRpcError):
+                    errors.append(result)
+                elif result is not None:
+                    receipt = result
+
+            if receipt is None and errors:
+                self._log("ReceiptError:nonce({}):{}".format(in_flight.nonce, str(errors[-1])))
+                continue
+            self._check_receipt(in_flight, receipt)
+
+    def _check_receipt(self, in_flight: InFlightTx, receipt: Optional[dict]):
+        replaced = in_flight.replacement_hash is not None
+        if replaced and receipt is not None and receipt.get("transactionHash") == in_flight.replacement_hash:
+            # the empty replacement took the nonce; the transaction of the event was not mined
+            self._finish(in_flight, "handle_tx_result_no_receipt")
+            return
+        if receipt is not None:
+            PrometheusExporterRelayer.exporting_time_to_receipt(self.chain, time.monotonic() - in_flight.sent_at)
+            succeeded = _hex_to_int(receipt.get("status")) == 1
+            gas_used = _hex_to_int(receipt.get("gasUsed"))
+            if succeeded and gas_used:
+                gas_model_global.record(in_flight.gas_key, gas_used)
+            elif gas_used >= in_flight.tx["gas"]:
+                # out of gas; the kind needs more than its limit
+                gas_model_global.record_out_of_gas(in_flight.gas_key, gas_used)
+            handler_name = "handle_tx_result_success" if succeeded else "handle_tx_result_fail"
+            self._finish(in_flight, handler_name, receipt.get("transactionHash"))
+            return
+
+        in_flight.tries += 1
+        if in_flight.tries >= self.receipt_max_try:
+            # the reads and the sends of the nonce go to the same node
+            with sticky_endpoint(self.url):
+                self.handle_stuck(in_flight)
+        elif in_flight.tries % self.fee_escalation_interval == 0:
+            self.escalate(in_flight)
+
+    def escalate(self, in_flight: InFlightTx):
+        """ re-sends the transaction of the nonce with raised fees. """
+        escalated = self.escalated_fee(in_flight.tx)
+        if escalated is None:
+            return
+
+        tx = dict(in_flight.tx, **escalated)
+        try:
+            tx_hash = self.send_tx(tx)
+        except Exception as e:
+            self._log("EscalateError:nonce({}):{}".format(in_flight.nonce, str(e)))
+            return
+        in_flight.tx = tx
+        in_flight.tx_hashes.append(tx_hash)
+        self._log("Escalated:{}:nonce({}):{}:{}".format(in_flight.event.summary(), in_flight.nonce, escalated, tx_hash))
+
+    def handle_stuck(self, in_flight: InFlightTx):
+        """ called on every poll without a receipt, once the transaction has had "receipt_max_try" polls. """
+        mined_nonce = _hex_to_int(self.rpc("eth_getTransactionCount", [self.sender, "latest"]))
+        if mined_nonce > in_flight.nonce:
+            if in_flight.nonce_used:
+                # still no receipt a poll later; the nonce was taken by a transaction the pipeline did not send
+                self._log("NonceUsed:{}:nonce({})".format(in_flight.event.summary(), in_flight.nonce))
+                self._finish(in_flight, "handle_tx_result_no_receipt")
+                return
+            # the receipt of one of the transactions may not have been served yet
+            in_flight.nonce_used = True
+            return
+
+        if in_flight.replacement_hash is not None:
+            return
+        escalated = self.escalated_fee(in_flight.tx)
+        if escalated is not None:
+            self.replace_with_empty_tx(in_flight, escalated)
+        elif (in_flight.tries - self.receipt_max_try) % self.fee_escalation_interval == 0:
+            # the fees are at the cap of the fee config, so an empty transaction cannot replace the transaction;
+            # it is re-sent in case the node dropped it from its pool
+            try:
+                self.send_tx(in_flight.tx)
+            except Exception as e:
+                self._log("ResendError:nonce({}):{}".format(in_flight.nonce, str(e)))
+                return
+            self._log("ResentAtFeeCap:{}:nonce({})".format(in_flight.event.summary(), in_flight.nonce))
+
+    def replace_with_empty_tx(self, in_flight: InFlightTx, escalated: Dict[str, int]):
+        """ fills the nonce of the stuck transaction, so that the following transactions are mined. """
+        tx = dict(in_flight.tx, to=self.sender, data="0x", value=0, gas=21000, **escalated)
+        try:
+            tx_hash = self.send_tx(tx)
+        except Exception as e:
+            # tried again on the next poll; the stuck transaction may also be mined in the meantime
+            self._log("ReplaceError:nonce({}):{}".format(in_flight.nonce, str(e)))
+            return
+        in_flight.tx_hashes.append(tx_hash)
+        in_flight.replacement_hash = tx_hash
+        self._log("Replaced:{}:nonce({}):{}".format(in_flight.event.summary(), in_flight.nonce, tx_hash))
+
+    def release_nonce(self, nonce: int):
+        try:
+            self.nonces.release(nonce)
+        except Exception as e:
+            self._log("GapFillError:nonce({}):{}".format(nonce, str(e)))
+
+    def fill_nonce_gap(self, nonce: int):
+        """ sends an empty transaction with the nonce released by a transaction which was not sent. """
+        tx = {"to": self.sender, "data": "0x", "value": 0, "gas": 21000, "nonce": nonce}
+        tx.update(self.initial_fee())
+        tx_hash = self.send_tx(tx)
+        self._log("GapFilled:nonce({}):{}".format(nonce, tx_hash))
+
+    def _finish(self, in_flight: InFlightTx, handler_name: str, mined_hash: Optional[str] = None):
+        with self.__lock:
+            if self.__in_flight.pop(in_flight.nonce, None) is None:
+                return
+        self.__slots.release()
+        self._log("{}:{}:{}".format(handler_name, in_flight.event.summary(), mined_hash or in_flight.tx_hash))
+        self._dispatch(in_flight.event, handler_name)
+
+    def _dispatch(self, event, handler_name: str):
+        self.__results.put((event, handler_name))
+
+    def dispatch_results(self):
+        """
+        calls the tx result handlers of the events whose transactions have finished, and puts the events they return
+        into the event queue. called on the event bridge worker.
+        """
+        while True:
+            try:
+                event, handler_name = self.__results.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                next_event = getattr(event, handler_name)()
+            except Exception as e:
+                self._log("HandlerError:{}:{}:{}".format(handler_name, event.summary(), str(e)))
+                continue
+            if next_event is not None:
+                self.relayer.queue.enqueue(next_event)
+
+
+def pipelined(build_transaction_params: Callable) -> Callable:
+    """
+    Decorates "build_transaction_params" of an event: if the tx pipeline is enabled for the chain of the transaction,
+    the transaction is sent through the pipeline, and the event bridge gets no transaction to send.
+    """
+    @functools.wraps(build_transaction_params)
+    def wrapper(event) -> SendParamTuple:
+        params = build_transaction_params(event)
+        if params == NoneParams or not params or not params[0]:
+            return params
+
+        chain = chain_enum[params[0]] if isinstance(params[0], str) else params[0]
+        pipeline = event.manager.tx_pipeline_of(chain)
+        if pipeline is None:
+            return params
+        pipeline.submit(event, params)
+        return NoneParams
+
+    return wrapper
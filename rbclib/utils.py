@@ -1,13 +1,19 @@
 import inspect
+import threading
+from collections import OrderedDict
 from enum import Enum
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Dict
 
 from chainpy.eth.ethtype.hexbytes import EthAddress, EthHashBytes
 from chainpy.eth.managers.ethchainmanager import EthChainManager
 from chainpy.eventbridge.eventbridge import EventBridge
 from chainpy.logger import global_logger
 
+from rbclib.authority import authority_cache_global
+from rbclib.batchcall import BatchCall
+from rbclib.fanout import fan_out
 from rbclib.primitives.chain import chain_enum, ChainEventStatus, ChainEnum
+from rbclib.primitives.consts import BLOCK_TIMESTAMP_UNITS_PER_SEC
 from rbclib.primitives.oracle import Oracle
 
 
@@ -20,60 +26,122 @@ def log_invalid_flow(log_id: str, event):
     ))
 
 
-def find_height_by_timestamp(chain_manager: EthChainManager, target_time: int, front_height: int = 0, front_time: int = 0):
+BLOCK_TIMESTAMP_CACHE_MAX_SIZE = 4096
+
+# chain name -> (height -> block timestamp); block timestamps never change, so every fetched header is kept
+_block_timestamp_cache: Dict[str, OrderedDict] = dict()
+_block_timestamp_cache_lock = threading.Lock()
+
+
+def fetch_block_timestamp(chain_manager: EthChainManager, height: int) -> int:
+    with _block_timestamp_cache_lock:
+        chain_cache = _block_timestamp_cache.setdefault(chain_manager.chain_name, OrderedDict())
+        if height in chain_cache:
+            chain_cache.move_to_end(height)
+            return chain_cache[height]
+
+    timestamp = chain_manager.eth_get_block_by_height(height).timestamp
+
+    with _block_timestamp_cache_lock:
+        chain_cache[height] = timestamp
+        if len(chain_cache) > BLOCK_TIMESTAMP_CACHE_MAX_SIZE:
+            chain_cache.popitem(last=False)
+    return timestamp
+
+
+def find_height_by_timestamp(
+    chain_manager: EthChainManager,
+    target_time: int,
+    front_height: int = 0,
+    front_time: int = 0,
+    block_period_sec: int = None,
+    timestamp_units_per_sec: int = BLOCK_TIMESTAMP_UNITS_PER_SEC
+) -> int:
+    """ returns the highest block whose timestamp is not later than the target time (the front block at least). """
     current_block = chain_manager.eth_get_block_by_height()
     current_height, current_time = current_block.number, current_block.timestamp  # as a rear
 
     if front_height < 1:
-        front_height, front_time = chain_manager.latest_height, chain_manager.eth_get_block_by_height(
-            chain_manager.latest_height).timestamp
+        front_height = chain_manager.latest_height
+        front_time = fetch_block_timestamp(chain_manager, front_height)
 
     if front_time >= target_time:
         return front_height
 
     if chain_enum[chain_manager.chain_name] != chain_enum.BIFROST:
         target_time -= 30000
-    return binary_search(chain_manager, front_height, front_time, current_height, current_time, target_time)
-
-
-def binary_search(
-    chain_manager: EthChainManager, front_height: int, front_time: int, rear_height: int, rear_time: int, target_time: int
+    if front_time > target_time:
+        return front_height
+    if current_time <= target_time:
+        return current_height
+    return interpolation_search(
+        chain_manager, front_height, front_time, current_height, current_time, target_time, block_period_sec,
+        timestamp_units_per_sec
+    )
+
+
+def interpolation_search(
+    chain_manager: EthChainManager,
+    front_height: int,
+    front_time: int,
+    rear_height: int,
+    rear_time: int,
+    target_time: int,
+    block_period_sec: int = None,
+    timestamp_units_per_sec: int = BLOCK_TIMESTAMP_UNITS_PER_SEC
 ) -> int:
-    if front_time > rear_time or front_height > rear_height:
-        raise Exception("binary search prams error: front > rear")
-
-    medium_height = (front_height + rear_height) // 2
-    medium_block = chain_manager.eth_get_block_by_height(medium_height)
-    if abs(target_time - medium_block.timestamp) < 30000:  # 30 secs
-        return medium_height
-    elif target_time > medium_block.timestamp:
-        return binary_search(
-            chain_manager,
-            medium_height, medium_block.timestamp,
-            rear_height, rear_time,
-            target_time
-        )
-    else:
-        return binary_search(
-            chain_manager,
-            front_height, front_time,
-            medium_height, medium_block.timestamp,
-            target_time
-        )
+    """
+    Finds the boundary block (front_time <= target_time < rear_time is required) by interpolating block heights
+    with timestamps. A step which does not halve the range is followed by a bisection step, so that the number of
+    rpc calls stays logarithmic even for chains with irregular block times.
+    "timestamp_units_per_sec" is the unit of the block timestamps of the chain, for the guess from "block_period_sec".
+    """
+    if not front_time <= target_time < rear_time or front_height >= rear_height:
+        raise Exception("interpolation search params error: front > target or target >= rear")
+
+    guess = None
+    if block_period_sec:
+        # the first guess from the block period
+        blocks_behind = -(-(rear_time - target_time) // (block_period_sec * timestamp_units_per_sec))  # ceil
+        guess = rear_height - blocks_behind
+
+    bisection = False
+    while rear_height - front_height > 1:
+        if guess is None:
+            if bisection:
+                guess = (front_height + rear_height) // 2
+            else:
+                height_range, time_range = rear_height - front_height, rear_time - front_time
+                guess = front_height + (target_time - front_time) * height_range // time_range
+        guess = min(max(guess, front_height + 1), rear_height - 1)
+
+        width = rear_height - front_height
+        guess_time = fetch_block_timestamp(chain_manager, guess)
+        if guess_time <= target_time:
+            front_height, front_time = guess, guess_time
+        else:
+            rear_height, rear_time = guess, guess_time
+
+        bisection = not bisection and (rear_height - front_height) * 2 > width
+        guess = None
+    return front_height
 
 
 def fetch_latest_round(manager: EventBridge, target_chain: ChainEnum) -> int:
     return manager.world_call(target_chain.name, "relayer_authority", "latest_round", [])[0]  # unzip
 
 
+def fetch_latest_rounds(manager: EventBridge, target_chains: List[ChainEnum]) -> Dict[ChainEnum, int]:
+    """ fetches the latest rounds of the chains concurrently. a chain which does not respond in time is left out. """
+    return fan_out(manager, lambda chain: fetch_latest_round(manager, chain), target_chains)
+
+
 def fetch_bottom_round(manager: EventBridge) -> int:
-    bottom_round = 2 ** 256 - 1
-    for chain_name in manager.supported_chain_list:
-        chain = chain_enum[chain_name]
-        round_num = fetch_latest_round(manager, chain)
-        if bottom_round > round_num:
-            bottom_round = round_num
-    return bottom_round
+    chains = [chain_enum[chain_name] for chain_name in manager.supported_chain_list]
+    rounds = fetch_latest_rounds(manager, chains)
+    if len(rounds) != len(chains):
+        raise Exception("Not fetched latest round of chains: {}".format(set(chains) - set(rounds.keys())))
+    return min(rounds.values()) if rounds else 2 ** 256 - 1
 
 
 def fetch_round_info(manager: EventBridge) -> (int, int, int):
@@ -83,13 +151,24 @@ def fetch_round_info(manager: EventBridge) -> (int, int, int):
     return current_height, current_rnd_idx, round_length
 
 
+def fetch_session_info(manager: EventBridge) -> (int, int, int, int):
+    """ returns (current session index, first block of the session, current height, session length) """
+    resp = manager.world_call(chain_enum.BIFROST.name, "authority", "round_info", [])
+    current_rnd_idx, fir_session_idx, current_session_index = resp[:3]
+    first_rnd_block, first_session_block, current_height, round_length, session_length = resp[3:]
+    return current_session_index, first_session_block, current_height, session_length
+
+
 def is_selected_relayer(
     manager: EventBridge, chain: ChainEnum, rnd: int = None, relayer_address: EthAddress = None, is_initial: bool = True
 ) -> bool:
     method = "is_selected_relayer" if rnd is None else "is_previous_selected_relayer"
     params = [relayer_address.hex(), is_initial] if rnd is None else [rnd, relayer_address.hex(), is_initial]
 
-    return manager.world_call(chain.name, "relayer_authority", method, params)[0]
+    return authority_cache_global.get_or_fetch(
+        chain, rnd, (method, relayer_address.hex().lower(), is_initial),
+        lambda: manager.world_call(chain.name, "relayer_authority", method, params)[0]
+    )
 
 
 def fetch_relayer_index(
@@ -112,10 +191,29 @@ def fetch_sorted_relayer_list_lower(
     method = "selected_relayers" if rnd is None else "previous_selected_relayers"
     params = [is_initial] if rnd is None else [rnd, is_initial]
 
-    validator_tuple = manager.world_call(chain.name, "relayer_authority", method, params)[0]
-    validator_list = list(validator_tuple)
-    validator_list_lower = [addr.lower() for addr in validator_list]
-    return sorted(validator_list_lower)
+    def fetch() -> list:
+        validator_tuple = manager.world_call(chain.name, "relayer_authority", method, params)[0]
+        validator_list_lower = [addr.lower() for addr in validator_tuple]
+        return sorted(validator_list_lower)
+
+    # return a copy, so that callers can not mutate the cached list
+    return list(authority_cache_global.get_or_fetch(chain, rnd, (method, is_initial), fetch))
+
+
+def prefetch_sorted_relayer_lists_lower(
+    manager: EventBridge, chain: ChainEnum, rnds: List[int], is_initial: bool = True
+):
+    """ fills the authority cache with the relayer lists of the rounds, using a single batch call. """
+    method = "previous_selected_relayers"
+    missed_rnds = [rnd for rnd in rnds if not authority_cache_global.contains(chain, rnd, (method, is_initial))]
+
+    batch = BatchCall(manager)
+    for rnd in missed_rnds:
+        batch.add(chain, "relayer_authority", method, [rnd, is_initial])
+
+    for rnd, result in zip(missed_rnds, batch.call()):
+        validator_list_lower = [addr.lower() for addr in result[0]]
+        authority_cache_global.put(chain, rnd, (method, is_initial), sorted(validator_list_lower))
 
 
 def fetch_relayer_num(manager: EventBridge, target_chain: ChainEnum, is_initial: bool = True) -> int:
@@ -126,7 +224,10 @@ def fetch_relayer_num(manager: EventBridge, target_chain: ChainEnum, is_initial:
 def fetch_quorum(manager: EventBridge, target_chain: ChainEnum, rnd: int = None, is_initial: bool = True) -> int:
     method = "majority" if rnd is None else "previous_majority"
     params = [is_initial] if rnd is None else [rnd, is_initial]
-    return manager.world_call(target_chain.name, "relayer_authority", method, params)[0]
+    return authority_cache_global.get_or_fetch(
+        target_chain, rnd, (method, is_initial),
+        lambda: manager.world_call(target_chain.name, "relayer_authority", method, params)[0]
+    )
 
 
 def fetch_socket_rbc_sigs(manager: EventBridge, request_id: tuple, chain_event_status: ChainEventStatus):
@@ -163,39 +264,16 @@ def is_submitted_oracle_feed(
     return EthHashBytes(result) != 0
 
 
-def sort_by_event_status(arr):  # : arr: List["RbcEvent"], return: : List["RbcEvent"]
-    ret_arr = list()
-    for element in arr:
-        ret_arr.append((element.status.value, element))
-    return [item_tuple[1] for item_tuple in sorted(ret_arr)]
-
-
-def extract_latest_event_status(arr):  # arr: List["RbcEvent"]
-    sorted_list = sort_by_event_status(arr)
-    status_list = [element.status for element in sorted_list]
+def fetch_submitted_oracle_feeds(
+    manager: EventBridge, oracle: Oracle, rnds: List[int], relayer_address: EthAddress = None
+) -> List[bool]:
+    """ "is_submitted_oracle_feed" of every round, using a single batch call. """
+    relayer_address = manager.active_account.address if relayer_address is None else relayer_address
 
-    inbound = sorted_list[0].is_inbound()
-    if inbound:
-        return sorted_list[-1]
-    else:
-        if ChainEventStatus.COMMITTED in status_list:
-            return sorted_list[status_list.index(ChainEventStatus.COMMITTED)]
-        elif ChainEventStatus.ROLLBACKED in status_list:
-            return sorted_list[status_list.index(ChainEventStatus.ROLLBACKED)]
-        elif ChainEventStatus.EXECUTED in status_list:
-            return sorted_list[status_list.index(ChainEventStatus.EXECUTED)]
-        elif ChainEventStatus.REVERTED in status_list:
-            return sorted_list[status_list.index(ChainEventStatus.REVERTED)]
-        elif ChainEventStatus.ACCEPTED in status_list:
-            return sorted_list[status_list.index(ChainEventStatus.ACCEPTED)]
-        elif ChainEventStatus.REJECTED in status_list:
-            return sorted_list[status_list.index(ChainEventStatus.REJECTED)]
-        elif ChainEventStatus.REQUESTED in status_list:
-            return sorted_list[status_list.index(ChainEventStatus.REQUESTED)]
-        elif ChainEventStatus.FAILED in status_list:
-            return sorted_list[status_list.index(ChainEventStatus.REQUESTED)]
-        else:
-            raise Exception("Invalid event status")
+    batch = BatchCall(manager)
+    for rnd in rnds:
+        batch.add(chain_enum.BIFROST, "oracle", "get_consensus_feed", [oracle.value, relayer_address.hex(), rnd])
+    return [EthHashBytes(result[0]) != 0 for result in batch.call()]
 
 
 def to_even_hex(a: Union[str, int]) -> str:
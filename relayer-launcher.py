@@ -6,8 +6,10 @@ from chainpy.logger import logger_config_global, global_logger
 from rbclib.events.rbc_event import RbcEvent, ExternalRbcEvent
 from rbclib.events.roundup_event import RoundUpEvent
 from rbclib.metric import PrometheusExporterRelayer
+from rbclib.periodic.checkpoint_feed import CheckpointFeed
 from rbclib.periodic.heartbeat import RelayerHeartBeat
 from rbclib.periodic.oracle_price_up import PriceUpOracle
+from rbclib.periodic.tx_result_feed import TxResultFeed
 from rbclib.periodic.vsp_feed import VSPFeed
 from relayer.relayer import Relayer, relayer_config_global, RelayerRole
 
@@ -28,6 +30,12 @@ def config_relayer(relayer: Relayer, heart_beat_opt: bool, prometheus_on: bool):
     # event bridge will periodically check validator set of the bifrost network.
     relayer.register_offchain_event_obj("sync_validator", VSPFeed)
 
+    # event bridge will periodically store the collected heights of each chain for the next bootstrap.
+    relayer.register_offchain_event_obj("checkpoint", CheckpointFeed)
+
+    # event bridge will periodically handle the results of the transactions sent through the tx pipelines.
+    relayer.register_offchain_event_obj("tx_result", TxResultFeed)
+
     # event bridge will periodically collect price source from offchain, and relay it to bifrost network.
     relayer.register_offchain_event_obj("price", PriceUpOracle)
 
@@ -49,6 +57,12 @@ def config_fast_relayer(relayer: Relayer, prometheus_on: bool):
     # multichain monitor will detect "RoundUp" event from the socket contract on bifrost network.
     relayer.register_chain_event_obj("RoundUp", RoundUpEvent)
 
+    # event bridge will periodically store the collected heights of each chain for the next bootstrap.
+    relayer.register_offchain_event_obj("checkpoint", CheckpointFeed)
+
+    # event bridge will periodically handle the results of the transactions sent through the tx pipelines.
+    relayer.register_offchain_event_obj("tx_result", TxResultFeed)
+
     if prometheus_on:
         PrometheusExporterRelayer.init_prometheus_exporter_on_relayer(relayer.supported_chain_list)
 
@@ -1,5 +1,5 @@
 import enum
-from typing import List, Dict
+from typing import List, Dict, Union
 
 
 class RelayerRole(enum.Enum):
@@ -25,6 +25,8 @@ class FastRelayerConfig:
         price_oracle_assets: List[str] = None,
         price_source_url_dict: Dict[str, str] = None,
         price_source_collection_period_sec: int = 0,
+        price_deviation_threshold_percent: Union[float, Dict[str, float]] = None,
+        price_heartbeat_sec: int = 0,
 
         btc_hash_source_url: str = None,
         btc_hash_source_collection_period_sec: int = 0,
@@ -45,6 +47,8 @@ class FastRelayerConfig:
         self.price_oracle_assets: List[str] = price_oracle_assets
         self.price_source_url_dict: Dict[str, str] = price_source_url_dict
         self.price_source_collection_period_sec: int = price_source_collection_period_sec
+        self.price_deviation_threshold_percent: Union[float, Dict[str, float]] = price_deviation_threshold_percent
+        self.price_heartbeat_sec: int = price_heartbeat_sec
 
         self.btc_hash_source_url: str = btc_hash_source_url
         self.btc_hash_source_collection_period_sec: int = btc_hash_source_collection_period_sec
@@ -65,6 +69,8 @@ class FastRelayerConfig:
         price_oracle_assets: List[str] = None,
         price_source_url_dict: Dict[str, str] = None,
         price_source_collection_period_sec: int = 0,
+        price_deviation_threshold_percent: Union[float, Dict[str, float]] = None,
+        price_heartbeat_sec: int = 0,
 
         btc_hash_source_url: str = None,
         btc_hash_source_collection_period_sec: int = 0,
@@ -85,6 +91,8 @@ class FastRelayerConfig:
         self.price_oracle_assets: List[str] = price_oracle_assets
         self.price_source_url_dict: Dict[str, str] = price_source_url_dict
         self.price_source_collection_period_sec: int = price_source_collection_period_sec
+        self.price_deviation_threshold_percent: Union[float, Dict[str, float]] = price_deviation_threshold_percent
+        self.price_heartbeat_sec: int = price_heartbeat_sec
 
         self.btc_hash_source_url: str = btc_hash_source_url
         self.btc_hash_source_collection_period_sec: int = btc_hash_source_collection_period_sec
@@ -1,7 +1,10 @@
 import copy
 import json
 import logging
+import os
+import threading
 import time
+from typing import Optional, Dict, List
 
 from chainpy.eth.ethtype.account import EthAccount
 from chainpy.eth.managers.configsanitycheck import is_meaningful, ConfigSanityChecker
@@ -11,16 +14,104 @@ from chainpy.eventbridge.eventbridge import EventBridge
 from chainpy.logger import global_logger
 
 from rbclib.__init__ import __version__
-from rbclib.primitives.chain import chain_enum
-from rbclib.primitives.consts import BIFROST_VALIDATOR_HISTORY_LIMIT_BLOCKS, BOOTSTRAP_OFFSET_ROUNDS
-from rbclib.utils import fetch_round_info, fetch_latest_round, find_height_by_timestamp, fetch_relayer_index
+from rbclib.authority import authority_cache_global
+from rbclib.batchcall import ContractAbiRegistry
+from rbclib.checkpoint import BootstrapCheckpoint
+from rbclib.journal import EventJournal
+from rbclib.logcollector import LogCollector
+from rbclib.logfetch import LogRecord
+from rbclib.primitives.chain import chain_enum, ChainEnum
+from rbclib.primitives.consts import BIFROST_VALIDATOR_HISTORY_LIMIT_BLOCKS, BOOTSTRAP_OFFSET_ROUNDS, \
+    BLOCK_TIMESTAMP_UNITS_PER_SEC, CHECKPOINT_FILE_NAME, SIG_AGGREGATION_ALL, TX_PIPELINE_MAX_IN_FLIGHT
+from rbclib.rpc import register_endpoint_pool, send_request
+from rbclib.rpcpool import RpcEndpointPool
+from rbclib.txpipeline import TxPipeline
+from rbclib.utils import fetch_round_info, fetch_latest_round, find_height_by_timestamp, fetch_relayer_index, \
+    prefetch_sorted_relayer_lists_lower, fetch_block_timestamp
 from relayer.global_config import RelayerRole, relayer_config_global
 
 
 class Relayer(EventBridge):
     def __init__(self, multichain_config: dict, relayer_index_cache_max_length: int = 100):
-        super().__init__(multichain_config, int, relayer_index_cache_max_length)
+        self.log_collector: Optional[LogCollector] = None
+        if multichain_config.get("entity", {}).get("log_collector"):
+            # the relayer collects the logs of the events by itself, instead of the chain monitor of the event bridge
+            events_of_chain = {
+                chain_name: chain_config["events"]
+                for chain_name, chain_config in multichain_config.items()
+                if isinstance(chain_config, dict) and "events" in chain_config
+            }
+            bridge_config = copy.deepcopy(multichain_config)
+            for chain_name in events_of_chain:
+                bridge_config[chain_name]["events"] = []
+            super().__init__(bridge_config, int, relayer_index_cache_max_length)
+            self.log_collector = LogCollector(self, events_of_chain)
+        else:
+            super().__init__(multichain_config, int, relayer_index_cache_max_length)
+        self.multichain_config = multichain_config
         self.round_cache = None
+        self.abi_registry = ContractAbiRegistry(multichain_config)
+        self.checkpoint: Optional[BootstrapCheckpoint] = None
+        self.journal: Optional[EventJournal] = None
+        self.chain_event_classes: Dict[str, type] = dict()
+        self.tx_pipelines: Dict[str, TxPipeline] = dict()
+        self.rpc_pools: Dict[str, RpcEndpointPool] = dict()
+        self.init_rpc_pools()
+        self.__tx_pipeline_lock = threading.Lock()
+
+    def sig_aggregation_of(self, chain: ChainEnum) -> str:
+        """ returns how the signatures are aggregated in the transactions to the chain. """
+        return self.multichain_config[chain.name].get("sig_aggregation", SIG_AGGREGATION_ALL)
+
+    def init_rpc_pools(self):
+        """ pools the endpoints of each chain with "extra_urls_with_access_key" in its config. """
+        for chain_name in self.supported_chain_list:
+            chain_config = self.multichain_config[chain_name]
+            extra_urls = chain_config.get("extra_urls_with_access_key")
+            if not extra_urls:
+                continue
+            url = chain_config["url_with_access_key"]
+            self.rpc_pools[chain_name] = RpcEndpointPool([url] + list(extra_urls))
+            register_endpoint_pool(url, self.rpc_pools[chain_name])
+
+    def world_call(self, chain_name: str, contract_name: str, method_name: str, method_params: list):
+        if chain_name not in self.rpc_pools:
+            return super().world_call(chain_name, contract_name, method_name, method_params)
+
+        # through the endpoint pool of the chain
+        chain = chain_enum[chain_name]
+        method = self.abi_registry.method_of(chain, contract_name, method_name)
+        tx = {"to": self.abi_registry.address_of(chain, contract_name), "data": method.encode_input(method_params)}
+        return method.decode_output(send_request(self.abi_registry.url_of(chain), "eth_call", [tx, "latest"]))
+
+    def decode_event(self, detected_event):
+        if isinstance(detected_event, LogRecord):
+            event_abi = self.abi_registry.event_of(
+                chain_enum[detected_event.chain_name], detected_event.contract_name, detected_event.event_name
+            )
+            return event_abi.decode_log(detected_event.topics, detected_event.data.hex())
+        return super().decode_event(detected_event)
+
+    def collected_height_of(self, chain_name: str) -> int:
+        """ the height up to which the logs of the chain have been collected """
+        if self.log_collector is not None and chain_name in self.log_collector.chain_collectors:
+            return self.log_collector.collected_height_of(chain_name)
+        return self.get_chain_manager_of(chain_name).latest_height
+
+    def tx_pipeline_of(self, chain: ChainEnum) -> Optional[TxPipeline]:
+        """ returns the tx pipeline of the chain, or None if the chain sends transactions through the event bridge. """
+        pipeline_config = self.multichain_config[chain.name].get("tx_pipeline")
+        if not pipeline_config:
+            return None
+        with self.__tx_pipeline_lock:
+            if chain.name not in self.tx_pipelines:
+                max_in_flight = pipeline_config.get("max_in_flight", TX_PIPELINE_MAX_IN_FLIGHT)
+                self.tx_pipelines[chain.name] = TxPipeline(self, chain, max_in_flight)
+            return self.tx_pipelines[chain.name]
+
+    def tx_pipeline_list(self) -> List[TxPipeline]:
+        with self.__tx_pipeline_lock:
+            return list(self.tx_pipelines.values())
 
     @classmethod
     def init_from_config_files(
@@ -39,12 +130,18 @@ class Relayer(EventBridge):
             with open(private_config_path, "r") as f:
                 private_config_dict = json.load(f)
 
+        # the checkpoint is stored next to the relayer config by default
+        checkpoint_path = relayer_config_dict["entity"].get("checkpoint_path")
+        if checkpoint_path is None:
+            checkpoint_path = os.path.join(os.path.dirname(relayer_config_path), CHECKPOINT_FILE_NAME)
+
         return cls.init_from_dicts(
             relayer_config_dict,
             private_config_dict=private_config_dict,
             private_key=private_key,
             role=role,
-            slow_relayer_delay_sec=slow_relayer_delay_sec
+            slow_relayer_delay_sec=slow_relayer_delay_sec,
+            checkpoint_path=checkpoint_path
         )
 
     @classmethod
@@ -55,7 +152,8 @@ class Relayer(EventBridge):
         private_key: str = None,
         role: RelayerRole = None,
         slow_relayer_delay_sec: int = None,
-        is_testnet: bool = False
+        is_testnet: bool = False,
+        checkpoint_path: str = None
     ):
         merged_dict = merge_dict(relayer_config_dict, private_config_dict)
         if private_key is not None:
@@ -87,13 +185,26 @@ class Relayer(EventBridge):
             roundup_event_call_delay_sec=200,
             price_oracle_assets=oracle_config["asset_prices"]["names"] if is_price_oracle_relayer else None,
             price_source_url_dict=oracle_config["asset_prices"]["urls"] if is_price_oracle_relayer else None,
-            price_source_collection_period_sec=300,
+            price_source_collection_period_sec=oracle_config["asset_prices"].get("collection_period_sec", 300)
+            if is_price_oracle_relayer else 300,
+            price_deviation_threshold_percent=oracle_config["asset_prices"].get("deviation_threshold_percent")
+            if is_price_oracle_relayer else None,
+            price_heartbeat_sec=oracle_config["asset_prices"].get("heartbeat_sec", 0) if is_price_oracle_relayer else 0,
             btc_hash_source_url=oracle_config["bitcoin_block_hash"]["url"] if is_btc_oracle_relayer else None,
             btc_hash_source_collection_period_sec=300,
             validator_set_check_period_sec=60
         )
 
-        return cls(merged_dict)
+        relayer = cls(merged_dict)
+        if checkpoint_path is not None:
+            relayer.checkpoint = BootstrapCheckpoint(checkpoint_path)
+            relayer.journal = EventJournal(checkpoint_path)
+        return relayer
+
+    def register_chain_event_obj(self, event_name: str, event_class: type):
+        super().register_chain_event_obj(event_name, event_class)
+        # remembered to replay the event journal
+        self.chain_event_classes[event_name] = event_class
 
     def _wait_for_sync(self, chain_manager: EthChainManager):
         while True:
@@ -125,6 +236,11 @@ class Relayer(EventBridge):
 
     def register_relayer_auth(self):
         round_history_limit = min(BIFROST_VALIDATOR_HISTORY_LIMIT_BLOCKS, self.round_cache)
+
+        # fetch relayer lists of every round in the history with a single batch call
+        rnds = [self.round_cache - i for i in range(round_history_limit)]
+        prefetch_sorted_relayer_lists_lower(self, chain_enum.BIFROST, rnds)
+
         for i in range(round_history_limit):
             relayer_index = fetch_relayer_index(self, chain_enum.BIFROST, rnd=self.round_cache - i)
             global_logger.formatted_log(
@@ -135,18 +251,81 @@ class Relayer(EventBridge):
             )
             self.set_value_by_key(self.round_cache - i, relayer_index)
 
+    def bootstrap_window_msec(self, round_length: int) -> int:
+        """ the time span of the full bootstrap rewind """
+        block_period_sec = self.multichain_config[chain_enum.BIFROST.name]["block_period_sec"]
+        return round_length * BOOTSTRAP_OFFSET_ROUNDS * block_period_sec * 1000
+
+    def replay_event_journal(self):
+        """ Puts the events journaled by the previous run back into the queue with their own time locks. """
+        if self.journal is None:
+            return
+
+        _, _, round_length = fetch_round_info(self)
+        for entry in self.journal.entries(self.bootstrap_window_msec(round_length)):
+            event_class = self.chain_event_classes.get(entry.kind)
+            if getattr(event_class, "REPLAYS_JOURNAL_IN_BOOTSTRAP", False):
+                continue
+            event = event_class.from_journal(self, entry) if event_class is not None else None
+            if event is None:
+                self.journal.remove(entry.key)
+                continue
+
+            self.queue.enqueue(event)
+            global_logger.formatted_log(
+                "BootStrap",
+                address=self.active_account.address,
+                related_chain_name=chain_enum.BIFROST.name,
+                msg="ReplayJournal:{}:time-lock({})".format(event.summary(), entry.time_lock)
+            )
+
+    def resume_latest_heights_from_checkpoint(self, bootstrap_start_height: int, round_length: int) -> bool:
+        """ Sets the latest heights from the bootstrap checkpoint. returns False if it is missing or stale. """
+        if self.checkpoint is None:
+            return False
+
+        heights = self.checkpoint.resume_heights(self.supported_chain_list, self.bootstrap_window_msec(round_length))
+        if heights is None:
+            return False
+
+        # rewind bifrost by a round to replay its latest "RoundUp" log, but never beyond the full rewind
+        heights[chain_enum.BIFROST.name] = max(heights[chain_enum.BIFROST.name] - round_length, bootstrap_start_height)
+
+        for chain_name, height in heights.items():
+            self.get_chain_manager_of(chain_name).latest_height = height
+
+        global_logger.formatted_log(
+            "BootStrap",
+            address=self.active_account.address,
+            related_chain_name=chain_enum.BIFROST.name,
+            msg="ResumeFromCheckpoint:{}".format(heights)
+        )
+        return True
+
     def determine_latest_heights_for_each_chain(self):
         current_height, _, round_length = fetch_round_info(self)
         bootstrap_start_height = max(current_height - round_length * BOOTSTRAP_OFFSET_ROUNDS, 1)
 
+        if self.resume_latest_heights_from_checkpoint(bootstrap_start_height, round_length):
+            return
+
+        bootstrap_start_time = fetch_block_timestamp(
+            self.get_chain_manager_of(chain_enum.BIFROST.name), bootstrap_start_height
+        )
+
         for chain_name in self.supported_chain_list:
             chain_manager = self.get_chain_manager_of(chain_name)
             if chain_name == chain_enum.BIFROST.name:
                 chain_manager.latest_height = bootstrap_start_height
             else:
-                bootstrap_start_time = self.get_chain_manager_of(chain_enum.BIFROST.name). \
-                    eth_get_block_by_height(bootstrap_start_height).timestamp
-                chain_manager.latest_height = find_height_by_timestamp(chain_manager, bootstrap_start_time)
+                chain_manager.latest_height = find_height_by_timestamp(
+                    chain_manager,
+                    bootstrap_start_time,
+                    block_period_sec=self.multichain_config[chain_name].get("block_period_sec"),
+                    timestamp_units_per_sec=self.multichain_config[chain_name].get(
+                        "timestamp_units_per_sec", BLOCK_TIMESTAMP_UNITS_PER_SEC
+                    )
+                )
 
     def run_relayer(self):
         # Wait until the bifrost node completes the sync.
@@ -160,6 +339,7 @@ class Relayer(EventBridge):
 
         # store the latest round of the BIFROST network
         self.round_cache = fetch_latest_round(self, chain_enum.BIFROST)
+        authority_cache_global.advance_round(chain_enum.BIFROST, self.round_cache)
 
         # store whether this relayer is a selected relayer in each round.
         self.register_relayer_auth()
@@ -167,6 +347,13 @@ class Relayer(EventBridge):
         # determine timestamp from which bootstrap starts
         self.determine_latest_heights_for_each_chain()
 
+        # replay time-locked events of the previous run; socket events are replayed by their bootstrap
+        self.replay_event_journal()
+
+        if self.log_collector is not None:
+            self.log_collector.bootstrap()
+            self.log_collector.start()
+
         # run relayer
         self.run_eventbridge()
 
@@ -7,6 +7,7 @@ setup(
     version=__version__,
     packages=["rbclib"],
     install_requires=[
-        "chainpy @ git+https://github.com/bifrost-platform/bifrost-python-lib.git@0.8.0"
+        "chainpy @ git+https://github.com/bifrost-platform/bifrost-python-lib.git@0.8.0",
+        "websocket-client"
     ]
 )
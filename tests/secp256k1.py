@@ -0,0 +1,86 @@
+import hashlib
+import hmac
+from typing import Optional, Tuple
+
+from chainpy.eth.ethtype.utils import keccak_hash
+
+P = 0xfffffffffffffffffffffffffffffffffffffffffffffffffffffffefffffc2f
+N = 0xfffffffffffffffffffffffffffffffebaaedce6af48a03bbfd25e8cd0364141
+G = (
+    0x79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798,
+    0x483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8
+)
+
+Point = Optional[Tuple[int, int]]
+
+
+def _add(a: Point, b: Point) -> Point:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a[0] == b[0] and (a[1] + b[1]) % P == 0:
+        return None
+    if a == b:
+        slope = 3 * a[0] * a[0] * pow(2 * a[1], -1, P) % P
+    else:
+        slope = (b[1] - a[1]) * pow(b[0] - a[0], -1, P) % P
+    x = (slope * slope - a[0] - b[0]) % P
+    return x, (slope * (a[0] - x) - a[1]) % P
+
+
+def _mul(point: Point, scalar: int) -> Point:
+    result = None
+    while scalar:
+        if scalar & 1:
+            result = _add(result, point)
+        point = _add(point, point)
+        scalar >>= 1
+    return result
+
+
+def _rfc6979_nonce(private_key: int, msg_hash: bytes) -> int:
+    x = private_key.to_bytes(32, "big")
+    h = (int.from_bytes(msg_hash, "big") % N).to_bytes(32, "big")
+    v, k = b"\x01" * 32, b"\x00" * 32
+    k = hmac.new(k, v + b"\x00" + x + h, hashlib.sha256).digest()
+    v = hmac.new(k, v, hashlib.sha256).digest()
+    k = hmac.new(k, v + b"\x01" + x + h, hashlib.sha256).digest()
+    v = hmac.new(k, v, hashlib.sha256).digest()
+    while True:
+        v = hmac.new(k, v, hashlib.sha256).digest()
+        nonce = int.from_bytes(v, "big")
+        if 1 <= nonce < N:
+            return nonce
+        k = hmac.new(k, v + b"\x00", hashlib.sha256).digest()
+        v = hmac.new(k, v, hashlib.sha256).digest()
+
+
+def sign(private_key: int, msg_hash: bytes) -> Tuple[int, int, int]:
+    """ returns (recovery id, r, s) of the deterministic (RFC 6979), low-s signature """
+    nonce = _rfc6979_nonce(private_key, msg_hash)
+    point = _mul(G, nonce)
+    r = point[0] % N
+    s = pow(nonce, -1, N) * (int.from_bytes(msg_hash, "big") + r * private_key) % N
+    recovery_id = point[1] & 1
+    if s > N // 2:
+        s, recovery_id = N - s, recovery_id ^ 1
+    return recovery_id, r, s
+
+
+def address_of(public_key: Point) -> str:
+    return "0x" + keccak_hash(public_key[0].to_bytes(32, "big") + public_key[1].to_bytes(32, "big")).bytes()[12:].hex()
+
+
+def address_of_private_key(private_key: int) -> str:
+    return address_of(_mul(G, private_key))
+
+
+def recover_address(msg_hash: bytes, recovery_id: int, r: int, s: int) -> str:
+    y = pow((r * r * r + 7) % P, (P + 1) // 4, P)
+    if y & 1 != recovery_id:
+        y = P - y
+    e = int.from_bytes(msg_hash, "big")
+    s_r = _mul((r, y), s)
+    e_g = _mul(G, (N - e) % N)
+    return address_of(_mul(_add(s_r, e_g), pow(r, -1, N)))
@@ -0,0 +1,172 @@
+import threading
+import time
+import types
+import unittest
+from typing import Callable, Dict, List
+from unittest import mock
+
+from rbclib import logcollector, logfetch
+from rbclib.logcollector import ChainLogCollector
+from rbclib.logfetch import LogTarget
+from rbclib.primitives.chain import chain_enum
+from tests.wsnode import LocalWsNode
+
+SOCKET_ADDRESS = "0x" + "ab" * 20
+SOCKET_TOPIC = "0x" + "cd" * 32
+BLOCK_PERIOD_SEC = 0.2
+AGING = 2
+
+
+def wait_until(predicate: Callable[[], bool], timeout_sec: float = 5) -> bool:
+    deadline = time.monotonic() + timeout_sec
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def socket_log(height: int, log_index: int = 0, removed: bool = False) -> dict:
+    log = {
+        "address": SOCKET_ADDRESS,
+        "blockNumber": hex(height),
+        "blockHash": "0x{:064x}".format(height),
+        "logIndex": hex(log_index),
+        "transactionHash": "0x{:064x}".format(height * 1000 + log_index),
+        "topics": [SOCKET_TOPIC],
+        "data": "0x"
+    }
+    if removed:
+        log["removed"] = True
+    return log
+
+
+class FakeHttpNode:
+    """ "eth_blockNumber" and "eth_getLogs" of a chain whose head and logs are set by the test """
+
+    def __init__(self, head: int):
+        self.head = head
+        self.logs: Dict[int, List[dict]] = dict()
+
+    def add_log(self, height: int):
+        self.logs.setdefault(height, list()).append(socket_log(height, len(self.logs.get(height, []))))
+
+    def send_request(self, url: str, method: str, params: list, timeout: float = None):
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        if method == "eth_getLogs":
+            from_height, to_height = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+            return [log for height in range(from_height, to_height + 1) for log in self.logs.get(height, [])]
+        raise ValueError("unexpected method: {}".format(method))
+
+
+class ChainLogCollectorWsTest(unittest.TestCase):
+    def setUp(self):
+        self.node = LocalWsNode()
+        self.http = FakeHttpNode(head=105)
+        for module in (logcollector, logfetch):
+            patcher = mock.patch.object(module, "send_request", self.http.send_request)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(logcollector, "global_logger")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.delivered: List[int] = list()
+        relayer = types.SimpleNamespace(
+            multichain_config={chain_enum.BIFROST.name: {
+                "ws_url_with_access_key": self.node.url,
+                "block_period_sec": BLOCK_PERIOD_SEC,
+                "block_aging_period": AGING
+            }},
+            abi_registry=types.SimpleNamespace(url_of=lambda chain: "http://node"),
+            active_account=types.SimpleNamespace(address="relayer"),
+            chain_event_classes={"Socket": self},
+            queue=types.SimpleNamespace(enqueue=lambda event: None)
+        )
+        target = LogTarget("socket", "Socket", SOCKET_ADDRESS, SOCKET_TOPIC)
+        self.collector = ChainLogCollector(relayer, chain_enum.BIFROST, [target], from_height=100)
+
+    def tearDown(self):
+        self.collector.stop()
+        self.node.close()
+
+    def init(self, record, time_lock: int, relayer):
+        """ the event class of the "Socket" logs; records the height of the delivered logs """
+        self.delivered.append(record.block_number)
+        return None
+
+    def subscribe_in_background(self) -> threading.Thread:
+        def run_subscription():
+            try:
+                self.collector.run_subscription()
+            except Exception:
+                pass
+
+        thread = threading.Thread(target=run_subscription, daemon=True)
+        thread.start()
+        return thread
+
+    def test_holds_logs_until_aged(self):
+        self.subscribe_in_background()
+        self.assertTrue(self.node.wait_subscribed())
+
+        self.node.push_log(socket_log(106))
+        self.node.push_head(107)
+        self.assertTrue(wait_until(lambda: self.collector.collected_height == 107 - AGING))
+        self.assertEqual(self.delivered, [])
+
+        self.node.push_head(108)
+        self.assertTrue(wait_until(lambda: self.collector.collected_height == 108 - AGING))
+        self.assertEqual(self.delivered, [106])
+
+    def test_drops_removed_logs(self):
+        self.subscribe_in_background()
+        self.assertTrue(self.node.wait_subscribed())
+
+        self.node.push_log(socket_log(107))
+        self.node.push_log(socket_log(108))
+        self.node.push_log(socket_log(107, removed=True))
+        self.node.push_head(110)
+        self.assertTrue(wait_until(lambda: self.collector.collected_height == 110 - AGING))
+        self.assertEqual(self.delivered, [108])
+
+    def test_falls_back_to_polling_on_disconnect(self):
+        thread = threading.Thread(target=self.collector.run, daemon=True)
+        thread.start()
+        self.assertTrue(self.node.wait_subscribed())
+
+        # mined while the websocket is down; never notified
+        self.http.add_log(107)
+        self.http.head = 110
+        self.node.disconnect()
+        self.assertTrue(wait_until(lambda: self.collector.collected_height == 110 - AGING))
+        self.assertEqual(self.delivered, [107])
+
+        self.collector.stop()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+    def test_backfills_gap_on_resubscribe(self):
+        first = self.subscribe_in_background()
+        self.assertTrue(self.node.wait_subscribed())
+        self.node.push_head(107)
+        self.assertTrue(wait_until(lambda: self.collector.collected_height == 107 - AGING))
+        self.node.disconnect()
+        first.join(timeout=5)
+
+        # mined during the disconnection
+        self.http.add_log(106)
+        self.http.add_log(109)
+        self.http.head = 110
+
+        self.subscribe_in_background()
+        self.assertTrue(self.node.wait_subscribed(connections=2))
+        self.node.push_log(socket_log(111))
+        self.node.push_head(113)
+        self.assertTrue(wait_until(lambda: self.collector.collected_height == 113 - AGING))
+        self.assertEqual(self.delivered, [106, 109, 111])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import types
+import unittest
+from typing import List
+
+from chainpy.eth.ethtype.utils import keccak_hash
+
+from rbclib.txpipeline import NonceAllocator, TxPipeline, rlp_encode
+from tests import secp256k1
+
+# the private key and the signed transaction of the EIP-155 example
+PRIVATE_KEY = int("46" * 32, 16)
+SENDER = "0x9d8a62f656a8d1615c1294fd71e9cfb3e4855a4f"
+TO = "0x" + "35" * 20
+
+SIGNED_LEGACY_TX = (
+    "f86c098504a817c800825208943535353535353535353535353535353535353535880de0b6b3a76400008025a028ef61340b"
+    "d939bc2195fe537567866003e1a15d3c71ff63e1590620aa636276a067cbe9d8997f761aecb703304b3800ccf555c9f3dc64"
+    "214b297fb1966a3b6d83"
+)
+# the same key and recipient, signed by eth-account
+SIGNED_DYNAMIC_FEE_TX = (
+    "02f86d010984773594008506fc23ac0082ea609435353535353535353535353535353535353535358082abcdc080a0eb6ecf"
+    "d2386e7104b4aa308a489e01e0365ae01458a4453aaf504b3a0693959da0391c3e85da2db15b0b3c248a5b6220ab4ac2481d"
+    "ee0e11787636e2f0f24fb18a"
+)
+
+
+class LocalAccount:
+    """ signs the keccak hash of the message with the private key, as the relayer's account does """
+
+    def __init__(self, private_key: int):
+        self.private_key = private_key
+        self.signed: List[tuple] = list()
+
+    def ecdsa_recoverable_sign(self, msg: bytes):
+        msg_hash = keccak_hash(bytes(msg)).bytes()
+        v, r, s = secp256k1.sign(self.private_key, msg_hash)
+        self.signed.append((msg_hash, v, r, s))
+        return types.SimpleNamespace(v=v, r=r, s=s)
+
+
+def pipeline_of(fee_config: dict = None, fee_escalation_percent: int = 20, account=None) -> TxPipeline:
+    """ a pipeline with the state "sign_tx" and "escalated_fee" use, without its threads and the node """
+    pipeline = TxPipeline.__new__(TxPipeline)
+    pipeline.relayer = types.SimpleNamespace(active_account=account)
+    pipeline.chain_id = 1
+    pipeline.fee_config = fee_config or dict()
+    pipeline.fee_escalation_percent = fee_escalation_percent
+    return pipeline
+
+
+class RlpEncodeTest(unittest.TestCase):
+    def test_strings(self):
+        self.assertEqual(rlp_encode(b"dog").hex(), "83646f67")
+        self.assertEqual(rlp_encode(b"").hex(), "80")
+        self.assertEqual(rlp_encode(b"\x00").hex(), "00")
+        self.assertEqual(rlp_encode(b"\x0f").hex(), "0f")
+        self.assertEqual(rlp_encode(b"\x04\x00").hex(), "820400")
+
+        long_string = b"Lorem ipsum dolor sit amet, consectetur adipisicing elit"
+        self.assertEqual(rlp_encode(long_string), bytes.fromhex("b838") + long_string)
+
+    def test_integers(self):
+        self.assertEqual(rlp_encode(0).hex(), "80")
+        self.assertEqual(rlp_encode(15).hex(), "0f")
+        self.assertEqual(rlp_encode(1024).hex(), "820400")
+
+    def test_lists(self):
+        self.assertEqual(rlp_encode([]).hex(), "c0")
+        self.assertEqual(rlp_encode([b"cat", b"dog"]).hex(), "c88363617483646f67")
+        self.assertEqual(rlp_encode([[], [[]], [[], [[]]]]).hex(), "c7c0c1c0c3c0c1c0")
+
+        long_list = [b"Lorem ipsum dolor sit amet, consectetur adipisicing elit"]
+        self.assertEqual(rlp_encode(long_list)[:2].hex(), "f83a")
+
+
+class SignTxTest(unittest.TestCase):
+    def setUp(self):
+        self.account = LocalAccount(PRIVATE_KEY)
+        self.pipeline = pipeline_of(account=self.account)
+
+    def assert_signed_by_sender(self):
+        self.assertEqual(secp256k1.address_of_private_key(PRIVATE_KEY), SENDER)
+        msg_hash, v, r, s = self.account.signed[-1]
+        self.assertEqual(secp256k1.recover_address(msg_hash, v, r, s), SENDER)
+
+    def test_legacy_tx(self):
+        tx = {"nonce": 9, "gasPrice": 20 * 10 ** 9, "gas": 21000, "to": TO, "value": 10 ** 18, "data": "0x"}
+        self.assertEqual(self.pipeline.sign_tx(tx).hex(), SIGNED_LEGACY_TX)
+        self.assert_signed_by_sender()
+
+    def test_dynamic_fee_tx(self):
+        tx = {
+            "nonce": 9, "maxFeePerGas": 30 * 10 ** 9, "maxPriorityFeePerGas": 2 * 10 ** 9, "gas": 60000,
+            "to": TO, "value": 0, "data": "0xabcd"
+        }
+        self.assertEqual(self.pipeline.sign_tx(tx).hex(), SIGNED_DYNAMIC_FEE_TX)
+        self.assert_signed_by_sender()
+
+
+class NonceAllocatorTest(unittest.TestCase):
+    def setUp(self):
+        self.pending_nonce = 5
+        self.filled: List[int] = list()
+        self.fill_error = None
+        self.nonces = NonceAllocator(lambda: self.pending_nonce, self.fill_gap)
+
+    def fill_gap(self, nonce: int):
+        if self.fill_error is not None:
+            raise self.fill_error
+        self.filled.append(nonce)
+
+    def test_allocates_from_the_pending_nonce(self):
+        self.assertEqual([self.nonces.allocate() for _ in range(3)], [5, 6, 7])
+
+    def test_release_of_the_last_nonce_reuses_it(self):
+        self.nonces.allocate()
+        self.nonces.release(self.nonces.allocate())
+        self.assertEqual(self.nonces.allocate(), 6)
+        self.assertEqual(self.filled, [])
+
+    def test_release_below_allocated_nonces_fills_the_gap(self):
+        first = self.nonces.allocate()
+        self.nonces.allocate()
+        self.nonces.release(first)
+        self.assertEqual(self.filled, [5])
+        self.assertEqual(self.nonces.allocate(), 7)
+
+    def test_unfilled_gap_is_reused(self):
+        first = self.nonces.allocate()
+        self.nonces.allocate()
+        self.fill_error = ConnectionError("node down")
+        with self.assertRaises(ConnectionError):
+            self.nonces.release(first)
+        self.assertEqual(self.nonces.allocate(), 5)
+        self.assertEqual(self.nonces.allocate(), 7)
+
+    def test_resync_follows_the_node(self):
+        first = self.nonces.allocate()
+        self.nonces.allocate()
+        self.fill_error = ConnectionError("node down")
+        with self.assertRaises(ConnectionError):
+            self.nonces.release(first)
+
+        # the node took the nonces up to 9 (e.g. sent by another process)
+        self.pending_nonce = 10
+        self.nonces.resync()
+        self.assertEqual(self.nonces.allocate(), 10)
+        self.assertEqual(self.nonces.allocate(), 11)
+
+
+class EscalatedFeeTest(unittest.TestCase):
+    def test_legacy_fee_rises_within_the_cap(self):
+        pipeline = pipeline_of({"type": 0, "gas_price": 100, "max_gas_price": 1000})
+        self.assertEqual(pipeline.escalated_fee({"gasPrice": 100}), {"gasPrice": 120})
+        self.assertEqual(pipeline.escalated_fee({"gasPrice": 900}), {"gasPrice": 1000})
+
+    def test_no_rise_below_the_replacement_increment(self):
+        pipeline = pipeline_of({"type": 0, "gas_price": 100, "max_gas_price": 1000})
+        self.assertIsNone(pipeline.escalated_fee({"gasPrice": 1000}))
+        # the cap leaves room for 5% only
+        self.assertIsNone(pipeline.escalated_fee({"gasPrice": 950}))
+
+    def test_small_escalation_percent_still_replaces(self):
+        pipeline = pipeline_of({"type": 0, "gas_price": 100, "max_gas_price": 1000}, fee_escalation_percent=5)
+        self.assertEqual(pipeline.escalated_fee({"gasPrice": 100}), {"gasPrice": 110})
+
+    def test_dynamic_fees_rise_within_the_caps(self):
+        pipeline = pipeline_of({"type": 2, "max_gas_price": 200, "max_priority_price": 30})
+        tx = {"maxFeePerGas": 100, "maxPriorityFeePerGas": 10}
+        for _ in range(10):
+            escalated = pipeline.escalated_fee(tx)
+            if escalated is None:
+                break
+            for key, cap in (("maxFeePerGas", 200), ("maxPriorityFeePerGas", 30)):
+                self.assertGreaterEqual(escalated[key] * 100, tx[key] * 110)
+                self.assertLessEqual(escalated[key], cap)
+            self.assertLessEqual(escalated["maxPriorityFeePerGas"], escalated["maxFeePerGas"])
+            tx = escalated
+        # escalated up to the cap, then no more
+        self.assertEqual(tx["maxFeePerGas"], 200)
+        self.assertIsNone(pipeline.escalated_fee(tx))
+
+
+if __name__ == "__main__":
+    unittest.main()
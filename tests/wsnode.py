@@ -0,0 +1,143 @@
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+from typing import Dict, Optional
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    buf = b""
+    while len(buf) < size:
+        chunk = conn.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("closed by the client")
+        buf += chunk
+    return buf
+
+
+def _recv_frame(conn: socket.socket):
+    """ returns (opcode, payload) of a frame of the client (always masked) """
+    first, second = _recv_exact(conn, 2)
+    length = second & 0x7f
+    if length == 126:
+        length = struct.unpack(">H", _recv_exact(conn, 2))[0]
+    elif length == 127:
+        length = struct.unpack(">Q", _recv_exact(conn, 8))[0]
+    mask = _recv_exact(conn, 4) if second & 0x80 else b"\0\0\0\0"
+    payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(_recv_exact(conn, length)))
+    return first & 0x0f, payload
+
+
+def _send_text(conn: socket.socket, text: str):
+    data = text.encode()
+    if len(data) < 126:
+        header = bytes([0x81, len(data)])
+    elif len(data) < 65536:
+        header = bytes([0x81, 126]) + struct.pack(">H", len(data))
+    else:
+        header = bytes([0x81, 127]) + struct.pack(">Q", len(data))
+    conn.sendall(header + data)
+
+
+class LocalWsNode:
+    """
+    A local websocket server standing in for the "eth_subscribe" API of a node.
+    The test pushes new heads and logs to the subscriptions of the current connection, and drops the connection to
+    simulate a disconnection.
+    """
+
+    def __init__(self):
+        self.__server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__server.bind(("127.0.0.1", 0))
+        self.__server.listen(4)
+        self.url = "ws://127.0.0.1:{}".format(self.__server.getsockname()[1])
+
+        self.connections = 0
+        self.__lock = threading.Condition()
+        self.__conn: Optional[socket.socket] = None
+        # "newHeads" or "logs" -> subscription id of the current connection
+        self.__subscriptions: Dict[str, str] = dict()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.__server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: socket.socket):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            request += conn.recv(4096)
+        key = [
+            line.split(b":", 1)[1].strip() for line in request.split(b"\r\n")
+            if line.lower().startswith(b"sec-websocket-key")
+        ][0]
+        accept = base64.b64encode(hashlib.sha1(key + WS_GUID.encode()).digest()).decode()
+        conn.sendall((
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            "Sec-WebSocket-Accept: {}\r\n\r\n".format(accept)
+        ).encode())
+
+        with self.__lock:
+            self.connections += 1
+            self.__conn, self.__subscriptions = conn, dict()
+            self.__lock.notify_all()
+
+        try:
+            while True:
+                opcode, payload = _recv_frame(conn)
+                if opcode == 0x8:
+                    return
+                if opcode != 0x1:
+                    continue
+                request = json.loads(payload)
+                with self.__lock:
+                    subscription = "0x{:x}".format(len(self.__subscriptions) + 1)
+                    _send_text(conn, json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": subscription}))
+                    self.__subscriptions[request["params"][0]] = subscription
+                    self.__lock.notify_all()
+        except (ConnectionError, OSError):
+            return
+        finally:
+            conn.close()
+
+    def wait_subscribed(self, connections: int = 1, timeout_sec: float = 5) -> bool:
+        """ waits until the "connections"-th connection has subscribed to the new heads and the logs """
+        with self.__lock:
+            return self.__lock.wait_for(
+                lambda: self.connections >= connections and {"newHeads", "logs"} <= set(self.__subscriptions),
+                timeout_sec
+            )
+
+    def _notify(self, kind: str, result: dict):
+        with self.__lock:
+            _send_text(self.__conn, json.dumps({
+                "jsonrpc": "2.0",
+                "method": "eth_subscription",
+                "params": {"subscription": self.__subscriptions[kind], "result": result}
+            }))
+
+    def push_head(self, height: int):
+        self._notify("newHeads", {"number": hex(height)})
+
+    def push_log(self, log: dict):
+        self._notify("logs", log)
+
+    def disconnect(self):
+        """ drops the current connection """
+        with self.__lock:
+            if self.__conn is not None:
+                self.__conn.shutdown(socket.SHUT_RDWR)
+                self.__conn.close()
+                self.__conn, self.__subscriptions = None, dict()
+
+    def close(self):
+        self.disconnect()
+        self.__server.close()